@@ -18,13 +18,15 @@ async def main() -> None:
     """Demonstrate chat message history."""
     print("🪳 Chat Message History with CockroachDB\n")
 
-    session_id = str(uuid.uuid4())
+    # UUID session ids are stored in a native 16-byte UUID column
+    session_id = uuid.uuid4()
 
-    print(f"1. Creating chat history for session: {session_id[:8]}...")
+    print(f"1. Creating chat history for session: {str(session_id)[:8]}...")
     history = CockroachDBChatMessageHistory(
         session_id=session_id,
         connection_string=CONNECTION_STRING,
-        table_name="example_chat_history",
+        table_name="example_uuid_chat_history",
+        session_id_type="UUID",
     )
 
     await history._acreate_table_if_not_exists()
@@ -40,8 +42,9 @@ async def main() -> None:
         AIMessage(content="Yes! CockroachDB has native VECTOR type support..."),
     ]
 
+    # One multi-row INSERT instead of a round trip per message
+    await history.aadd_messages(messages)
     for msg in messages:
-        await history.aadd_message(msg)
         print(f"   Added: {msg.type} - {msg.content[:40]}...")
 
     print("\n3. Retrieving conversation history...")
@@ -53,17 +56,20 @@ async def main() -> None:
 
     print("\n4. Demonstrating session isolation...")
 
-    session2_id = str(uuid.uuid4())
+    session2_id = uuid.uuid4()
     history2 = CockroachDBChatMessageHistory(
         session_id=session2_id,
         connection_string=CONNECTION_STRING,
-        table_name="example_chat_history",
+        table_name="example_uuid_chat_history",
+        session_id_type="UUID",
     )
 
     await history2.aadd_message(HumanMessage(content="This is session 2"))
 
-    session1_msgs = await history.aget_messages()
-    session2_msgs = await history2.aget_messages()
+    # The two reads are independent, so overlap their round trips
+    session1_msgs, session2_msgs = await asyncio.gather(
+        history.aget_messages(), history2.aget_messages()
+    )
 
     print(f"   Session 1: {len(session1_msgs)} messages")
     print(f"   Session 2: {len(session2_msgs)} messages")
@@ -84,9 +90,13 @@ async def main() -> None:
 
     print("\n✅ Chat history demo complete!")
 
-    await history.aclose()
-    await history2.aclose()
+    await asyncio.gather(history.aclose(), history2.aclose())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,10 +3,12 @@
 import asyncio
 import os
 
+import numpy as np
 from langchain_core.embeddings import DeterministicFakeEmbedding
 
 from langchain_cockroachdb import (
     AsyncCockroachDBVectorStore,
+    CachedEmbeddings,
     CockroachDBEngine,
     HybridSearchConfig,
 )
@@ -21,8 +23,10 @@ async def main() -> None:
     """Demonstrate hybrid search combining FTS and vector similarity."""
     print("🪳 Hybrid Search (FTS + Vector)\n")
 
-    engine = CockroachDBEngine.from_connection_string(CONNECTION_STRING)
-    embeddings = DeterministicFakeEmbedding(size=768)
+    # Send float32 embeddings as binary parameters rather than text literals
+    engine = CockroachDBEngine.from_connection_string(CONNECTION_STRING, binary_vectors=True)
+    # Identical texts are embedded once, then served from memory
+    embeddings = CachedEmbeddings(DeterministicFakeEmbedding(size=768))
 
     table_name = "hybrid_docs"
 
@@ -31,7 +35,9 @@ async def main() -> None:
         table_name=table_name,
         vector_dimension=768,
         create_tsvector=True,
-        drop_if_exists=True,
+        truncate_if_exists=True,
+        # Adds int8 sidecar columns (1 byte per dimension) next to the VECTOR
+        quantization="int8",
     )
 
     print("\n2. Creating vector store with hybrid search config...")
@@ -46,6 +52,7 @@ async def main() -> None:
         engine=engine,
         embeddings=embeddings,
         collection_name=table_name,
+        quantization="int8",  # Also store int8-quantized embeddings
         hybrid_search_config=hybrid_config,
     )
 
@@ -60,7 +67,10 @@ async def main() -> None:
         "Semantic search uses vector embeddings to find conceptually similar content",
     ]
 
-    await vectorstore.aadd_texts(documents)
+    # Embed once into a contiguous (n, dim) float32 array, then send every
+    # document in a single multi-row INSERT
+    vectors = np.asarray(await embeddings.aembed_documents(documents), dtype=np.float32)
+    await vectorstore.aadd_embeddings(documents, vectors, batch_size=len(documents))
     print(f"   Added {len(documents)} documents")
 
     print("\n4. Pure vector search...")
@@ -109,4 +119,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,7 +5,7 @@ import os
 
 from langchain_core.embeddings import DeterministicFakeEmbedding
 
-from langchain_cockroachdb import AsyncCockroachDBVectorStore, CockroachDBEngine
+from langchain_cockroachdb import AsyncCockroachDBVectorStore, CachedEmbeddings, CockroachDBEngine
 
 CONNECTION_STRING = os.getenv(
     "COCKROACHDB_URL",
@@ -18,7 +18,8 @@ async def main() -> None:
     print("🪳 Advanced Metadata Filtering\n")
 
     engine = CockroachDBEngine.from_connection_string(CONNECTION_STRING)
-    embeddings = DeterministicFakeEmbedding(size=768)
+    # Identical texts are embedded once, then served from memory
+    embeddings = CachedEmbeddings(DeterministicFakeEmbedding(size=768))
 
     table_name = "filtered_docs"
 
@@ -26,13 +27,14 @@ async def main() -> None:
     await engine.ainit_vectorstore_table(
         table_name=table_name,
         vector_dimension=768,
-        drop_if_exists=True,
+        truncate_if_exists=True,
     )
 
     vectorstore = AsyncCockroachDBVectorStore(
         engine=engine,
         embeddings=embeddings,
         collection_name=table_name,
+        query_cache_size=100,  # Serve repeated searches from memory
     )
 
     print("\n2. Adding documents with rich metadata...")
@@ -49,69 +51,38 @@ async def main() -> None:
     texts = [doc[0] for doc in documents]
     metadatas = [doc[1] for doc in documents]
 
-    await vectorstore.aadd_texts(texts, metadatas=metadatas)
+    # Embed everything in one batched call (most embedding SDKs accept up to
+    # ~2048 inputs per request), then insert the precomputed vectors
+    vecs = await embeddings.aembed_documents(texts)
+    await vectorstore.aadd_embeddings(texts, vecs, metadatas=metadatas)
     print(f"   Added {len(documents)} documents")
 
-    print("\n3. Simple equality filter...")
-    results = await vectorstore.asimilarity_search(
-        "programming",
-        k=10,
-        filter={"lang": "python"},
-    )
-    print(f"   Python docs: {len(results)} found")
-    for doc in results:
-        print(f"   - {doc.page_content} | {doc.metadata}")
-
-    print("\n4. Comparison operators...")
-    results = await vectorstore.asimilarity_search(
-        "programming",
-        k=10,
-        filter={"year": {"$gte": 2024}},
-    )
-    print(f"   Docs from 2024+: {len(results)} found")
-
-    print("\n5. IN operator...")
-    results = await vectorstore.asimilarity_search(
-        "programming",
-        k=10,
-        filter={"lang": {"$in": ["python", "go"]}},
-    )
-    print(f"   Python or Go docs: {len(results)} found")
-
-    print("\n6. Complex AND filter...")
-    results = await vectorstore.asimilarity_search(
-        "programming",
-        k=10,
-        filter={
+    # All six filters below use the same query, so embed it once and run
+    # every filtered search in a single round trip
+    filters = [
+        # 3. Simple equality filter
+        {"lang": "python"},
+        # 4. Comparison operators
+        {"year": {"$gte": 2024}},
+        # 5. IN operator
+        {"lang": {"$in": ["python", "go"]}},
+        # 6. Complex AND filter
+        {
             "$and": [
                 {"lang": "python"},
                 {"year": {"$gte": 2024}},
                 {"level": {"$in": ["beginner", "intermediate"]}},
             ]
         },
-    )
-    print(f"   Python 2024+ beginner/intermediate: {len(results)} found")
-    for doc in results:
-        print(f"   - {doc.page_content} | {doc.metadata}")
-
-    print("\n7. OR filter...")
-    results = await vectorstore.asimilarity_search(
-        "programming",
-        k=10,
-        filter={
+        # 7. OR filter
+        {
             "$or": [
                 {"level": "advanced"},
                 {"year": 2023},
             ]
         },
-    )
-    print(f"   Advanced OR 2023 docs: {len(results)} found")
-
-    print("\n8. Nested logical operators...")
-    results = await vectorstore.asimilarity_search(
-        "programming",
-        k=10,
-        filter={
+        # 8. Nested logical operators
+        {
             "$and": [
                 {"year": 2024},
                 {
@@ -122,10 +93,45 @@ async def main() -> None:
                 },
             ]
         },
-    )
-    print(f"   2024 AND (Python OR Go): {len(results)} found")
+    ]
+    (
+        python_docs,
+        recent_docs,
+        python_or_go_docs,
+        and_docs,
+        or_docs,
+        nested_docs,
+    ) = await vectorstore.asimilarity_search_multi_filter("programming", filters=filters, k=10)
+
+    print("\n3. Simple equality filter...")
+    print(f"   Python docs: {len(python_docs)} found")
+    for doc in python_docs:
+        print(f"   - {doc.page_content} | {doc.metadata}")
+
+    print("\n4. Comparison operators...")
+    print(f"   Docs from 2024+: {len(recent_docs)} found")
+
+    print("\n5. IN operator...")
+    print(f"   Python or Go docs: {len(python_or_go_docs)} found")
+
+    print("\n6. Complex AND filter...")
+    print(f"   Python 2024+ beginner/intermediate: {len(and_docs)} found")
+    for doc in and_docs:
+        print(f"   - {doc.page_content} | {doc.metadata}")
+
+    print("\n7. OR filter...")
+    print(f"   Advanced OR 2023 docs: {len(or_docs)} found")
+
+    print("\n8. Nested logical operators...")
+    print(f"   2024 AND (Python OR Go): {len(nested_docs)} found")
+
+    print("\n9. Repeated query (served from the query cache)...")
+    for _ in range(2):
+        await vectorstore.asimilarity_search("programming", k=10, filter={"lang": "python"})
+    stats = vectorstore.get_cache_stats()
+    print(f"   Cache hits: {stats['hits']}, misses: {stats['misses']}")
 
-    print("\n9. Supported filter operators:")
+    print("\n10. Supported filter operators:")
     operators = [
         ("$eq", "Equal to"),
         ("$ne", "Not equal to"),
@@ -148,4 +154,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
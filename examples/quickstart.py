@@ -6,7 +6,7 @@ import os
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
 
-from langchain_cockroachdb import AsyncCockroachDBVectorStore, CockroachDBEngine
+from langchain_cockroachdb import AsyncCockroachDBVectorStore, CachedEmbeddings, CockroachDBEngine
 
 # Replace with your connection string
 CONNECTION_STRING = os.getenv(
@@ -20,7 +20,8 @@ async def main() -> None:
     print("🪳 LangChain CockroachDB Quickstart\n")
 
     engine = CockroachDBEngine.from_connection_string(CONNECTION_STRING)
-    embeddings = DeterministicFakeEmbedding(size=768)
+    # Identical texts are embedded once, then served from memory
+    embeddings = CachedEmbeddings(DeterministicFakeEmbedding(size=768))
 
     table_name = "quickstart_docs"
     vector_dim = 768
@@ -29,13 +30,17 @@ async def main() -> None:
     await engine.ainit_vectorstore_table(
         table_name=table_name,
         vector_dimension=vector_dim,
-        drop_if_exists=True,
+        truncate_if_exists=True,
+        # Adds int8 sidecar columns (1 byte per dimension) next to the VECTOR
+        quantization="int8",
     )
 
     vectorstore = AsyncCockroachDBVectorStore(
         engine=engine,
         embeddings=embeddings,
         collection_name=table_name,
+        quantization="int8",  # Also store int8-quantized embeddings
+        query_cache_size=100,  # Serve repeated searches from memory
     )
 
     print("\n2. Adding documents...")
@@ -57,7 +62,10 @@ async def main() -> None:
     texts = [doc.page_content for doc in documents]
     metadatas = [doc.metadata for doc in documents]
 
-    ids = await vectorstore.aadd_texts(texts, metadatas=metadatas)
+    # Embed everything in one batched call (most embedding SDKs accept up to
+    # ~2048 inputs per request), then insert the precomputed vectors
+    vecs = await embeddings.aembed_documents(texts)
+    ids = await vectorstore.aadd_embeddings(texts, vecs, metadatas=metadatas, batch_size=len(texts))
     print(f"   Added {len(ids)} documents")
 
     print("\n3. Similarity search...")
@@ -67,6 +75,11 @@ async def main() -> None:
         print(f"   Result {i}: {doc.page_content[:50]}...")
         print(f"   Metadata: {doc.metadata}")
 
+    # The same query again is answered from the query cache without a round trip
+    await vectorstore.asimilarity_search("What is CockroachDB?", k=2)
+    stats = vectorstore.get_cache_stats()
+    print(f"   Cache hits: {stats['hits']}, misses: {stats['misses']}")
+
     print("\n4. Search with scores...")
     results_with_scores = await vectorstore.asimilarity_search_with_score("databases", k=3)
 
@@ -90,4 +103,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -13,7 +13,7 @@ import os
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
 
-from langchain_cockroachdb import CockroachDBEngine, CockroachDBVectorStore
+from langchain_cockroachdb import CachedEmbeddings, CockroachDBEngine, CockroachDBVectorStore
 from langchain_cockroachdb.indexes import CSPANNIndex, DistanceStrategy
 
 # Replace with your connection string
@@ -31,7 +31,8 @@ def main() -> None:
     print("1. Creating engine...")
     engine = CockroachDBEngine.from_connection_string(CONNECTION_STRING)
 
-    embeddings = DeterministicFakeEmbedding(size=768)
+    # Identical texts are embedded once, then served from memory
+    embeddings = CachedEmbeddings(DeterministicFakeEmbedding(size=768))
     table_name = "sync_example_docs"
     vector_dim = 768
 
@@ -49,10 +50,22 @@ def main() -> None:
         engine=engine,
         embeddings=embeddings,
         collection_name=table_name,
+        # Store unit-length vectors so cosine distance reduces to 1 - dot product.
+        # Rows written by other clients must be normalized too.
+        normalize_on_insert=True,
     )
 
-    # 4. Add documents (sync)
-    print("\n4. Adding documents...")
+    # 4. Apply vector index (sync) while the table is still empty, so inserts
+    # maintain it incrementally instead of building it over existing rows.
+    # For one-off bulk loads (>10k rows), the opposite also works well: insert
+    # everything first, then call apply_vector_index once at the end.
+    print("4. Creating vector index...")
+    index = CSPANNIndex(distance_strategy=DistanceStrategy.COSINE)
+    vectorstore.apply_vector_index(index)
+    print("   Index created successfully!")
+
+    # 5. Add documents (sync)
+    print("\n5. Adding documents...")
     documents = [
         Document(
             page_content="CockroachDB is a distributed SQL database",
@@ -78,23 +91,23 @@ def main() -> None:
     ids = vectorstore.add_texts(texts, metadatas=metadatas)
     print(f"   Added {len(ids)} documents")
 
-    # 5. Similarity search (sync)
-    print("\n5. Similarity search for 'database':")
+    # 6. Similarity search (sync)
+    print("\n6. Similarity search for 'database':")
     results = vectorstore.similarity_search("database", k=2)
     for i, doc in enumerate(results, 1):
         print(f"   {i}. {doc.page_content}")
         print(f"      Metadata: {doc.metadata}")
 
-    # 6. Search with scores (sync)
-    print("\n6. Similarity search with scores:")
+    # 7. Search with scores (sync)
+    print("\n7. Similarity search with scores:")
     results_with_scores = vectorstore.similarity_search_with_score("programming", k=2)
     for i, (doc, score) in enumerate(results_with_scores, 1):
         print(f"   {i}. {doc.page_content}")
         print(f"      Score: {score:.4f}")
         print(f"      Metadata: {doc.metadata}")
 
-    # 7. Search with metadata filter (sync)
-    print("\n7. Search with metadata filter (category='blog'):")
+    # 8. Search with metadata filter (sync)
+    print("\n8. Search with metadata filter (category='blog'):")
     results = vectorstore.similarity_search(
         "technology",
         k=5,
@@ -104,13 +117,7 @@ def main() -> None:
         print(f"   {i}. {doc.page_content}")
         print(f"      Category: {doc.metadata['category']}")
 
-    # 8. Apply vector index (sync)
-    print("\n8. Creating vector index...")
-    index = CSPANNIndex(distance_strategy=DistanceStrategy.COSINE)
-    vectorstore.apply_vector_index(index)
-    print("   Index created successfully!")
-
-    # 9. Search still works with index
+    # 9. Search uses the index
     print("\n9. Search with index:")
     results = vectorstore.similarity_search("LangChain", k=2)
     for i, doc in enumerate(results, 1):
@@ -1,6 +1,7 @@
 """LangChain integration for CockroachDB with native vector support."""
 
 from langchain_cockroachdb.async_vectorstore import AsyncCockroachDBVectorStore
+from langchain_cockroachdb.cached_embeddings import CachedEmbeddings
 from langchain_cockroachdb.chat_message_histories import CockroachDBChatMessageHistory
 from langchain_cockroachdb.engine import CockroachDBEngine
 from langchain_cockroachdb.hybrid_search_config import HybridSearchConfig
@@ -9,6 +10,8 @@ from langchain_cockroachdb.indexes import (
     CSPANNQueryOptions,
     DistanceStrategy,
 )
+from langchain_cockroachdb.quantization import QuantizationType
+from langchain_cockroachdb.query_cache import QueryCache
 from langchain_cockroachdb.retry import (
     async_retry_with_backoff,
     is_retryable_error,
@@ -24,6 +27,9 @@ __all__ = [
     "CSPANNQueryOptions",
     "DistanceStrategy",
     "HybridSearchConfig",
+    "CachedEmbeddings",
+    "QuantizationType",
+    "QueryCache",
     "CockroachDBChatMessageHistory",
     "async_retry_with_backoff",
     "sync_retry_with_backoff",
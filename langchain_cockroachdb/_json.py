@@ -0,0 +1,27 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object as a JSON string.
+
+    Like ``json.dumps``, non-string dict keys are converted to strings.
+    """
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return encoded.decode()
+    return json.dumps(obj)
@@ -0,0 +1,73 @@
+"""Persistent background event loop for the sync API wrappers."""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, Coroutine, Iterator
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop, starting its daemon thread on first use."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever, name="langchain-cockroachdb-loop", daemon=True
+            )
+            _thread.start()
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared background loop and wait for its result.
+
+    Unlike ``asyncio.run``, this doesn't create and tear down an event loop
+    per call, and pooled connections (which are bound to the loop they were
+    opened on) stay usable across sync calls. It also works when the caller
+    is already inside a running event loop, such as a notebook.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from a coroutine running on the background
+            loop itself, which would deadlock
+    """
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("Sync wrappers cannot be called from the background event loop")
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def iterate_sync(agen: AsyncGenerator[T, None]) -> Iterator[T]:
+    """Drain an async generator on the background loop, one item at a time.
+
+    Each item is fetched with its own ``run_sync`` call, so the caller can
+    process items as they arrive. If the caller stops early, the generator
+    is closed on the background loop, which releases whatever it holds (such
+    as a database connection).
+
+    Args:
+        agen: Async generator to drain
+
+    Yields:
+        Items of the async generator, in order
+    """
+    try:
+        while True:
+            try:
+                yield run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(agen.aclose())
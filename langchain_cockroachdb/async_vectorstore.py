@@ -1,20 +1,155 @@
 """Async vector store implementation for CockroachDB with transaction retry support."""
 
-import uuid
-from collections.abc import Iterable
+import asyncio
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Hashable, Iterable, Sequence
 from typing import Any
 
 import numpy as np
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
-from sqlalchemy import text
+from sqlalchemy import Row, TextClause, text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
+from langchain_cockroachdb._json import dumps as json_dumps
 from langchain_cockroachdb.engine import CockroachDBEngine
+from langchain_cockroachdb.filters import compile_filter
 from langchain_cockroachdb.hybrid_search_config import HybridSearchConfig
 from langchain_cockroachdb.indexes import CSPANNIndex, CSPANNQueryOptions, DistanceStrategy
+from langchain_cockroachdb.mmr import maximal_marginal_relevance
+from langchain_cockroachdb.quantization import (
+    QuantizationType,
+    dequantize_int8,
+    int8_distances,
+    quantize_int8,
+)
+from langchain_cockroachdb.query_cache import QueryCache
 from langchain_cockroachdb.retry import async_retry_with_backoff
 
+# IDs bound per DELETE statement; the driver sends them as one array parameter
+_DELETE_CHUNK_SIZE = 1000
+
+# Distinct search statements (one per filter shape) kept per vector store
+_STMT_CACHE_SIZE = 256
+
+# MMR candidate sets at least this large are reranked in a worker thread
+_MMR_OFFLOAD_CANDIDATES = 256
+
+# Largest candidate matrix (in floats, 8 MiB) whose buffer is kept for reuse
+_MAX_POOLED_FLOATS = 2 * 1024 * 1024
+
+# Per-thread scratch buffer for decoded MMR candidate matrices
+_candidate_buffers = threading.local()
+
+
+def _random_ids(n: int) -> list[str]:
+    """Generate ``n`` random UUID4 strings from a single ``os.urandom`` call.
+
+    Version and variant bits are set on the whole buffer at once, and ids are
+    sliced out of one hex string, which avoids building a ``uuid.UUID`` per id.
+    """
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    h = raw.tobytes().hex()
+    return [
+        f"{h[o : o + 8]}-{h[o + 8 : o + 12]}-{h[o + 12 : o + 16]}-"
+        f"{h[o + 16 : o + 20]}-{h[o + 20 : o + 32]}"
+        for o in range(0, 32 * n, 32)
+    ]
+
+
+def _vector_literal(embedding: Sequence[float] | np.ndarray) -> str:
+    """Format an embedding as a VECTOR text literal.
+
+    Uses the C-level list repr (``[0.1, 0.2, ...]``), which parses as a
+    VECTOR and is faster than formatting floats one at a time in Python.
+    """
+    if isinstance(embedding, np.ndarray):
+        return repr(embedding.tolist())
+    values = embedding if isinstance(embedding, list) else list(embedding)
+    if values and type(values[0]) is not float:
+        # NumPy scalars repr as "np.float32(...)"; convert to Python floats
+        values = np.asarray(values, dtype=np.float64).tolist()
+    return repr(values)
+
+
+def _parse_vectors(values: list[Any]) -> np.ndarray:
+    """Convert VECTOR column values (text like ``[1,2,3]``) to a float32 matrix."""
+    if values and all(isinstance(value, str) for value in values):
+        # One C-level parse for the whole batch instead of one per row
+        joined = ",".join(value.strip("[]") for value in values)
+        return np.fromstring(joined, sep=",", dtype=np.float32).reshape(len(values), -1)
+    return np.asarray(values, dtype=np.float32)
+
+
+def _scratch_matrix(n: int, dim: int) -> np.ndarray:
+    """Return an uninitialized (n, dim) float32 matrix backed by a reused buffer.
+
+    The buffer belongs to the calling thread and is overwritten by the next
+    call on that thread, so the result must not outlive the caller. Matrices
+    above ``_MAX_POOLED_FLOATS`` get a fresh allocation instead.
+    """
+    size = n * dim
+    if size > _MAX_POOLED_FLOATS:
+        return np.empty((n, dim), dtype=np.float32)
+    buffer = getattr(_candidate_buffers, "buffer", None)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size, dtype=np.float32)
+        _candidate_buffers.buffer = buffer
+    return buffer[:size].reshape(n, dim)
+
+
+def _candidate_vectors(vector_columns: list[Sequence[Any]]) -> np.ndarray:
+    """Build the candidate matrix from the embedding columns of search rows.
+
+    Each entry is either ``(vector,)`` or, for int8-quantized stores,
+    ``(codes, scale, vector)`` where vector is only set for rows that have
+    no codes yet. Decoded int8 candidates are written into the thread's
+    scratch buffer (see ``_scratch_matrix``).
+    """
+    if not vector_columns or len(vector_columns[0]) == 1:
+        return _parse_vectors([columns[0] for columns in vector_columns])
+
+    n = len(vector_columns)
+    if all(columns[0] is not None for columns in vector_columns):
+        codes = np.frombuffer(b"".join(columns[0] for columns in vector_columns), dtype=np.int8)
+        codes = codes.reshape(n, -1)
+        scales = np.array([columns[1] for columns in vector_columns], dtype=np.float32)
+        return dequantize_int8(codes, scales, out=_scratch_matrix(n, codes.shape[1]))
+
+    # Rows written before quantization was enabled carry the float vector
+    rows = [
+        np.frombuffer(columns[0], dtype=np.int8) if columns[0] is not None else None
+        for columns in vector_columns
+    ]
+    parsed = _parse_vectors([columns[2] for columns in vector_columns if columns[0] is None])
+    vectors = _scratch_matrix(n, parsed.shape[1])
+    legacy = iter(parsed)
+    for i, (codes_row, columns) in enumerate(zip(rows, vector_columns, strict=True)):
+        if codes_row is None:
+            vectors[i] = next(legacy)
+        else:
+            dequantize_int8(codes_row, columns[1], out=vectors[i])
+    return vectors
+
+
+def _select_mmr(
+    embedding: list[float], vector_columns: list[Sequence[Any]], k: int, lambda_mult: float
+) -> list[int]:
+    """Decode candidate embeddings and pick MMR indices.
+
+    Only indices are returned, so the candidate matrix can live in the
+    calling thread's scratch buffer.
+    """
+    return maximal_marginal_relevance(
+        embedding, _candidate_vectors(vector_columns), k=k, lambda_mult=lambda_mult
+    )
+
 
 class AsyncCockroachDBVectorStore(VectorStore):
     """Async vector store using CockroachDB native VECTOR type and C-SPANN indexes."""
@@ -38,6 +173,12 @@ class AsyncCockroachDBVectorStore(VectorStore):
         retry_max_backoff: float = 5.0,
         retry_backoff_multiplier: float = 2.0,
         retry_jitter: bool = True,
+        query_cache_size: int = 0,
+        query_cache_ttl: float | None = 300.0,
+        query_embedding_cache_size: int = 0,
+        quantization: QuantizationType = QuantizationType.NONE,
+        normalize_on_insert: bool = False,
+        copy_threshold: int | None = None,
     ):
         """Initialize async vector store.
 
@@ -58,6 +199,20 @@ class AsyncCockroachDBVectorStore(VectorStore):
             retry_max_backoff: Maximum backoff delay in seconds (default: 5.0)
             retry_backoff_multiplier: Backoff multiplier (default: 2.0)
             retry_jitter: Add randomization to backoff (default: True)
+            query_cache_size: Max cached search results; 0 disables the cache (default: 0)
+            query_cache_ttl: Seconds a cached result stays valid (default: 300.0)
+            query_embedding_cache_size: Max query texts whose embeddings are kept,
+                so repeated queries skip the embedding call; 0 disables it
+                (default: 0)
+            quantization: Also write quantized embeddings to sidecar columns
+                created by ainit_vectorstore_table(quantization=...) (default: none)
+            normalize_on_insert: L2-normalize embeddings before storing them, so
+                cosine distance equals 1 - dot product. Cosine searches then
+                rank by inner product, which assumes every stored row was
+                normalized (default: False)
+            copy_threshold: Load calls of at least this many texts with
+                aadd_texts_copy instead of batched INSERTs. Only applies when
+                no ids are given, since COPY cannot upsert (default: None, off)
         """
         self.engine = engine
         self._embeddings = embeddings
@@ -75,13 +230,94 @@ class AsyncCockroachDBVectorStore(VectorStore):
         self.retry_max_backoff = retry_max_backoff
         self.retry_backoff_multiplier = retry_backoff_multiplier
         self.retry_jitter = retry_jitter
+        # Wrap once; the retry settings are fixed for the store's lifetime
+        self._aexecute_with_retry = async_retry_with_backoff(
+            max_retries=retry_max_attempts,
+            initial_backoff=retry_initial_backoff,
+            max_backoff=retry_max_backoff,
+            backoff_multiplier=retry_backoff_multiplier,
+            jitter=retry_jitter,
+        )(self._aexecute_in_transaction)
+        self.quantization = QuantizationType(quantization)
+        self.normalize_on_insert = normalize_on_insert
+        self.copy_threshold = copy_threshold
         self._fqn = f"{schema}.{collection_name}"
+        self._op = distance_strategy.get_operator()
+        self._query_cache = (
+            QueryCache(max_size=query_cache_size, ttl=query_cache_ttl)
+            if query_cache_size > 0
+            else None
+        )
+        self._stmt_cache: dict[Hashable, TextClause] = {}
+        self.query_embedding_cache_size = query_embedding_cache_size
+        self._query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
 
     @property
     def embeddings(self) -> Embeddings:
         """Get embeddings model."""
         return self._embeddings
 
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get query cache statistics.
+
+        Returns:
+            Hit/miss counters and size, or {"enabled": False} if caching is off
+        """
+        if self._query_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._query_cache.stats()}
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached search results after the table changes."""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def _cached_results(
+        self,
+        query: str,
+        k: int,
+        filter: dict | None,
+        query_options: CSPANNQueryOptions | None = None,
+    ) -> list[tuple[Document, float]] | None:
+        """Return cached results for a query text without embedding or querying.
+
+        Only hits when both the query embedding and the search results are
+        cached. The sync wrappers use this to answer repeated queries
+        without a hop to the background event loop.
+        """
+        if self._query_cache is None:
+            return None
+        embedding = self._query_embeddings.get(query)
+        if embedding is None:
+            return None
+
+        beam_size = query_options.beam_size if query_options else None
+        key = self._query_cache.make_key(embedding, filter, k, beam_size)
+        cached = self._query_cache.get(key, record_miss=False)
+        return list(cached) if cached is not None else None
+
+    async def _aembed_query(self, query: str) -> list[float]:
+        """Embed a query, reusing the cached embedding of a repeated query.
+
+        Unlike search results, query embeddings don't depend on the table,
+        so they are kept across writes.
+        """
+        embedding: list[float]
+        if self.query_embedding_cache_size <= 0:
+            embedding = await self._embeddings.aembed_query(query)
+            return embedding
+
+        cached = self._query_embeddings.get(query)
+        if cached is not None:
+            self._query_embeddings.move_to_end(query)
+            return cached
+
+        embedding = await self._embeddings.aembed_query(query)
+        self._query_embeddings[query] = embedding
+        if len(self._query_embeddings) > self.query_embedding_cache_size:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+
     async def aadd_texts(
         self,
         texts: Iterable[str],
@@ -91,6 +327,11 @@ class AsyncCockroachDBVectorStore(VectorStore):
     ) -> list[str]:
         """Add texts to vector store with automatic retry on failures.
 
+        Texts are read from the iterable one batch at a time, and the next
+        batch is embedded while the current one is inserted, so only two
+        batches of texts and embeddings are in memory at once, even for a
+        streaming generator input.
+
         Args:
             texts: Texts to add
             metadatas: Optional metadata for each text
@@ -100,53 +341,91 @@ class AsyncCockroachDBVectorStore(VectorStore):
         Returns:
             List of IDs for added texts
         """
+        batch_size = kwargs.get("batch_size", self.batch_size)
+        texts_iter = iter(texts)
+
+        if self.copy_threshold is not None and ids is None:
+            # Only read as far as needed to tell whether the load uses COPY
+            head = list(itertools.islice(texts_iter, self.copy_threshold))
+            if self._use_copy(head, ids):
+                return await self.aadd_texts_copy(
+                    itertools.chain(head, texts_iter), metadatas=metadatas, **kwargs
+                )
+            texts_iter = iter(head)
+
+        def _embed(batch: list[str]) -> asyncio.Task[list[list[float]]] | None:
+            if not batch:
+                return None
+            return asyncio.create_task(self._embeddings.aembed_documents(batch))
+
+        added_ids: list[str] = []
+        batch = list(itertools.islice(texts_iter, batch_size))
+        pending = _embed(batch)
+        try:
+            while pending is not None:
+                embeddings = await pending
+                next_batch = list(itertools.islice(texts_iter, batch_size))
+                pending = _embed(next_batch)
+
+                start, end = len(added_ids), len(added_ids) + len(batch)
+                batch_metadatas = (
+                    metadatas[start:end] if metadatas is not None else [{} for _ in batch]
+                )
+                batch_ids = ids[start:end] if ids is not None else _random_ids(len(batch))
+                await self._insert_batch(batch, embeddings, batch_metadatas, batch_ids)
+                added_ids.extend(batch_ids)
+                batch = next_batch
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        return added_ids
+
+    async def aadd_embeddings(
+        self,
+        texts: Iterable[str],
+        embeddings: list[list[float]] | np.ndarray,
+        metadatas: list[dict] | None = None,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Add texts with precomputed embeddings.
 
-        # Apply retry with instance configuration
-        @async_retry_with_backoff(
-            max_retries=self.retry_max_attempts,
-            initial_backoff=self.retry_initial_backoff,
-            max_backoff=self.retry_max_backoff,
-            backoff_multiplier=self.retry_backoff_multiplier,
-            jitter=self.retry_jitter,
-        )
-        async def _add_batch(batch_texts, batch_embeddings, batch_metadatas, batch_ids):
-            insert_sql = f"""
-                INSERT INTO {self._fqn} 
-                ({self.id_column}, {self.content_column}, {self.embedding_column}, {self.metadata_column})
-                VALUES (:id, :content, CAST(:embedding AS VECTOR), CAST(:metadata AS jsonb))
-                ON CONFLICT ({self.id_column}) DO UPDATE SET
-                    {self.content_column} = EXCLUDED.{self.content_column},
-                    {self.embedding_column} = EXCLUDED.{self.embedding_column},
-                    {self.metadata_column} = EXCLUDED.{self.metadata_column}
-            """
+        Use this when embeddings are computed up front (for example with one
+        batched ``aembed_documents`` call) to skip the embedding step. A 2-D
+        float32 array is used as is, without converting rows to lists.
 
-            async with self.engine.engine.begin() as conn:
-                for text, embedding, metadata, id_val in zip(
-                    batch_texts, batch_embeddings, batch_metadatas, batch_ids, strict=True
-                ):
-                    import json
-
-                    await conn.execute(
-                        text(insert_sql),
-                        {
-                            "id": id_val,
-                            "content": text,
-                            "embedding": str(embedding),
-                            "metadata": json.dumps(metadata),
-                        },
-                    )
+        Args:
+            texts: Texts to add
+            embeddings: Embedding vector for each text, as lists or one
+                ``(n, dim)`` array
+            metadatas: Optional metadata for each text
+            ids: Optional IDs for texts
+            **kwargs: Additional arguments (batch_size override supported)
 
+        Returns:
+            List of IDs for added texts
+        """
         texts_list = list(texts)
         if not texts_list:
             return []
 
-        embeddings = await self._embeddings.aembed_documents(texts_list)
+        if len(embeddings) != len(texts_list):
+            raise ValueError(
+                f"Number of embeddings ({len(embeddings)}) does not match "
+                f"number of texts ({len(texts_list)})"
+            )
+
+        if self._use_copy(texts_list, ids):
+            return await self.aadd_texts_copy(
+                texts_list, metadatas=metadatas, embeddings=embeddings, **kwargs
+            )
 
         if metadatas is None:
             metadatas = [{} for _ in texts_list]
 
         if ids is None:
-            ids = [str(uuid.uuid4()) for _ in texts_list]
+            ids = _random_ids(len(texts_list))
 
         batch_size = kwargs.get("batch_size", self.batch_size)
 
@@ -160,38 +439,260 @@ class AsyncCockroachDBVectorStore(VectorStore):
 
         return ids
 
+    def _use_copy(self, texts: list[str], ids: list[str] | None) -> bool:
+        """Whether a load is large enough to go through COPY."""
+        return self.copy_threshold is not None and ids is None and len(texts) >= self.copy_threshold
+
+    def _vector_param(self, embedding: Sequence[float] | np.ndarray) -> Any:
+        """Bind value for a VECTOR parameter.
+
+        With the engine's binary codec registered, this is a float32 array
+        sent as packed binary; otherwise a text literal. Statements keep
+        ``CAST(... AS VECTOR)`` either way, so their text doesn't change.
+        """
+        if self.engine.binary_vectors:
+            return np.asarray(embedding, dtype=np.float32)
+        return _vector_literal(embedding)
+
+    @property
+    def _ranks_by_inner_product(self) -> bool:
+        """Whether cosine search can rank by inner product.
+
+        Holds when stored embeddings are normalized on insert: for unit
+        vectors cosine distance is ``1 - dot``, so ranking by ``<#>`` skips
+        the per-row norm computation of ``<=>``.
+        """
+        return self.normalize_on_insert and self.distance_strategy == DistanceStrategy.COSINE
+
+    def _distance_sql(self, param: str) -> str:
+        """SQL distance expression for a query parameter.
+
+        Searches select it once as ``distance`` and order by that alias, so
+        the vector operator is evaluated once per row.
+        """
+        operator = "<#>" if self._ranks_by_inner_product else self._op
+        return f"{self.embedding_column} {operator} CAST(:{param} AS VECTOR)"
+
+    @property
+    def _score_offset(self) -> float:
+        """Added to selected distances to report them in the configured metric.
+
+        ``<#>`` is the negated dot product, so inner-product ranking of
+        normalized cosine searches reports ``1 + (<#>)`` as cosine distance.
+        """
+        return 1.0 if self._ranks_by_inner_product else 0.0
+
+    def _query_vector_param(self, embedding: Sequence[float]) -> Any:
+        """Bind value for a query vector, normalized when ranking by inner product."""
+        if self._ranks_by_inner_product:
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                embedding = vector / norm
+        return self._vector_param(embedding)
+
+    @property
+    def _candidate_embedding_columns(self) -> str:
+        """Columns selected for candidate embeddings (MMR).
+
+        With int8 quantization, the codes and scale are read instead of the
+        float vector, about a quarter of the bytes per candidate; the float
+        vector is only read for rows that have no codes.
+        """
+        emb = self.embedding_column
+        if self.quantization == QuantizationType.INT8:
+            return f"{emb}_int8, {emb}_scale, CASE WHEN {emb}_int8 IS NULL THEN {emb} END"
+        return emb
+
+    def _insert_columns(self) -> list[str]:
+        """Columns written by inserts, including quantization sidecars."""
+        columns = [self.id_column, self.content_column, self.embedding_column, self.metadata_column]
+        if self.quantization == QuantizationType.INT8:
+            columns += [
+                f"{self.embedding_column}_int8",
+                f"{self.embedding_column}_scale",
+                f"{self.embedding_column}_norm",
+            ]
+        return columns
+
+    def _prepare_embeddings(
+        self, embeddings: list[list[float]] | np.ndarray
+    ) -> tuple[list[list[float]] | np.ndarray, list[tuple[bytes, float, float]] | None]:
+        """Apply normalization and quantization options to a batch.
+
+        Returns:
+            Tuple of (embeddings, sidecars); sidecars holds one
+            (int8 codes, scale, norm) tuple per row, or None unless int8
+            quantization is enabled
+        """
+        if self.normalize_on_insert:
+            vectors = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            embeddings = (vectors / np.where(norms > 0, norms, 1.0)).tolist()
+
+        if self.quantization == QuantizationType.INT8:
+            vectors = np.asarray(embeddings, dtype=np.float32)
+            codes, scales = quantize_int8(vectors)
+            norms = np.linalg.norm(vectors, axis=1)
+            sidecars = [
+                (row_codes.tobytes(), float(scale), float(norm))
+                for row_codes, scale, norm in zip(codes, scales, norms, strict=True)
+            ]
+            return embeddings, sidecars
+
+        return embeddings, None
+
     async def _insert_batch(
         self,
         texts: list[str],
-        embeddings: list[list[float]],
+        embeddings: list[list[float]] | np.ndarray,
         metadatas: list[dict],
         ids: list[str],
     ) -> None:
-        """Insert a batch of vectors."""
-        import json
+        """Insert a batch of vectors with a single multi-row INSERT.
+
+        Builds one parameterized ``VALUES (...), (...)`` statement and the
+        matching parameter dict so the whole batch costs one round trip. The
+        transaction is retried on CockroachDB serialization errors.
+        """
+        embeddings, sidecars = self._prepare_embeddings(embeddings)
 
+        params: dict[str, Any] = {}
         values = []
-        for content, embedding, metadata, doc_id in zip(
-            texts, embeddings, metadatas, ids, strict=True
+        for i, (content, embedding, metadata, doc_id) in enumerate(
+            zip(texts, embeddings, metadatas, ids, strict=True)
         ):
-            embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
-            escaped_content = content.replace("'", "''")
-            metadata_json = json.dumps(metadata).replace("'", "''")
-            values.append(
-                f"('{doc_id}', '{escaped_content}', '{embedding_str}', '{metadata_json}'::jsonb)"
+            params[f"id_{i}"] = doc_id
+            params[f"content_{i}"] = content
+            params[f"embedding_{i}"] = self._vector_param(embedding)
+            params[f"metadata_{i}"] = json_dumps(metadata)
+            row = (
+                f"(:id_{i}, :content_{i}, CAST(:embedding_{i} AS VECTOR), "
+                f"CAST(:metadata_{i} AS jsonb)"
             )
+            if sidecars is not None:
+                params[f"codes_{i}"], params[f"scale_{i}"], params[f"norm_{i}"] = sidecars[i]
+                row += f", :codes_{i}, :scale_{i}, :norm_{i}"
+            values.append(row + ")")
+
+        columns = self._insert_columns()
+        updates = ",\n                ".join(f"{col} = EXCLUDED.{col}" for col in columns[1:])
 
         sql = f"""
-            INSERT INTO {self._fqn} ({self.id_column}, {self.content_column}, {self.embedding_column}, {self.metadata_column})
-            VALUES {",".join(values)}
+            INSERT INTO {self._fqn} ({", ".join(columns)})
+            VALUES {", ".join(values)}
             ON CONFLICT ({self.id_column}) DO UPDATE SET
-                {self.content_column} = EXCLUDED.{self.content_column},
-                {self.embedding_column} = EXCLUDED.{self.embedding_column},
-                {self.metadata_column} = EXCLUDED.{self.metadata_column}
+                {updates}
         """
 
+        await self._aexecute_with_retry(text(sql), [params])
+        self._invalidate_query_cache()
+
+    async def _aexecute_in_transaction(
+        self, stmt: TextClause, params_list: Sequence[dict[str, Any]]
+    ) -> None:
+        """Execute a statement once per parameter set in one transaction."""
         async with self.engine.engine.begin() as conn:
-            await conn.execute(text(sql))
+            for params in params_list:
+                await conn.execute(stmt, params)
+
+    async def aadd_texts_copy(
+        self,
+        texts: Iterable[str],
+        metadatas: list[dict] | None = None,
+        ids: list[str] | None = None,
+        embeddings: list[list[float]] | np.ndarray | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Bulk-load texts with ``COPY ... FROM STDIN``.
+
+        Streams all rows through a single COPY in one transaction, which is
+        faster than multi-row INSERT for large loads. Unlike aadd_texts
+        there is no upsert: an existing ID fails the whole load. Texts are
+        embedded in batches, and rows of one batch are written while the
+        next batch is being embedded.
+
+        Args:
+            texts: Texts to add
+            metadatas: Optional metadata for each text
+            ids: Optional IDs for texts
+            embeddings: Optional precomputed embeddings (embedded if omitted)
+            **kwargs: Additional arguments (batch_size override supported)
+
+        Returns:
+            List of IDs for added texts
+        """
+        texts_list = list(texts)
+        if not texts_list:
+            return []
+
+        if embeddings is not None and len(embeddings) != len(texts_list):
+            raise ValueError(
+                f"Number of embeddings ({len(embeddings)}) does not match "
+                f"number of texts ({len(texts_list)})"
+            )
+
+        if metadatas is None:
+            metadatas = [{} for _ in texts_list]
+
+        if ids is None:
+            ids = _random_ids(len(texts_list))
+
+        batch_size = kwargs.get("batch_size", self.batch_size)
+
+        def _embed(start: int) -> asyncio.Task[list[list[float]]] | None:
+            if embeddings is not None or start >= len(texts_list):
+                return None
+            batch = texts_list[start : start + batch_size]
+            return asyncio.create_task(self._embeddings.aembed_documents(batch))
+
+        copy_sql = f"COPY {self._fqn} ({', '.join(self._insert_columns())}) FROM STDIN"
+        # Start embedding before connecting, so the two overlap
+        pending = _embed(0)
+        try:
+            async with self.engine.engine.begin() as conn:
+                raw_conn = await conn.get_raw_connection()
+                driver_conn = raw_conn.driver_connection
+                if driver_conn is None:
+                    raise RuntimeError("COPY requires an open psycopg connection")
+
+                async with driver_conn.cursor() as cursor, cursor.copy(copy_sql) as copy:
+                    for start in range(0, len(texts_list), batch_size):
+                        end = start + batch_size
+                        batch_embeddings: list[list[float]] | np.ndarray
+                        if pending is not None:
+                            batch_embeddings = await pending
+                            pending = _embed(end)
+                        else:
+                            batch_embeddings = (
+                                embeddings[start:end] if embeddings is not None else []
+                            )
+
+                        batch_embeddings, sidecars = self._prepare_embeddings(batch_embeddings)
+                        for i, (content, embedding, metadata, doc_id) in enumerate(
+                            zip(
+                                texts_list[start:end],
+                                batch_embeddings,
+                                metadatas[start:end],
+                                ids[start:end],
+                                strict=True,
+                            )
+                        ):
+                            row: list[Any] = [
+                                doc_id,
+                                content,
+                                _vector_literal(embedding),
+                                json_dumps(metadata),
+                            ]
+                            if sidecars is not None:
+                                row += sidecars[i]
+                            await copy.write_row(row)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        self._invalidate_query_cache()
+        return ids
 
     async def asimilarity_search_with_score(
         self,
@@ -213,7 +714,7 @@ class AsyncCockroachDBVectorStore(VectorStore):
         Returns:
             List of (document, score) tuples
         """
-        query_embedding = await self._embeddings.aembed_query(query)
+        query_embedding = await self._aembed_query(query)
         return await self.asimilarity_search_with_score_by_vector(
             query_embedding, k=k, filter=filter, query_options=query_options, **kwargs
         )
@@ -238,39 +739,106 @@ class AsyncCockroachDBVectorStore(VectorStore):
         Returns:
             List of (document, score) tuples
         """
-        operator = self.distance_strategy.get_operator()
-        embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
+        cache_key = None
+        if self._query_cache is not None:
+            beam_size = query_options.beam_size if query_options else None
+            cache_key = self._query_cache.make_key(embedding, filter, k, beam_size)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+        stmt, params = self._similarity_search_stmt(embedding, k, filter)
+        rows = await self._afetch_search_rows(stmt, params, query_options)
+
+        # Rows come from our own table, so skip per-field pydantic validation
+        offset = self._score_offset
+        documents = [
+            (
+                Document.model_construct(page_content=content, metadata=metadata or {}),
+                float(distance) + offset,
+            )
+            for _, content, metadata, distance in rows
+        ]
 
-        where_clause = ""
-        if filter:
-            where_clause = "WHERE " + self._build_filter_clause(filter)
+        if self._query_cache is not None and cache_key is not None:
+            self._query_cache.put(cache_key, list(documents))
 
-        sql = f"""
-            SELECT {self.id_column}, {self.content_column}, {self.metadata_column},
-                   {self.embedding_column} {operator} '{embedding_str}' AS distance
-            FROM {self._fqn}
-            {where_clause}
-            ORDER BY {self.embedding_column} {operator} '{embedding_str}'
-            LIMIT {k}
-        """
+        return documents
+
+    async def asimilarity_search_stream(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict | None = None,
+        query_options: CSPANNQueryOptions | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Document, None]:
+        """Search for similar documents, yielding each one as its row arrives.
 
-        async with self.engine.engine.connect() as conn:
-            if query_options:
-                for setting, value in query_options.get_session_settings().items():
-                    await conn.execute(text(f"SET {setting} = {value}"))
+        Rows are read through a server-side cursor instead of being buffered,
+        so a consumer can start on the nearest document before the rest are
+        fetched and decoded. The query cache is bypassed. Stop iterating (or
+        call ``aclose()`` on the generator) to release the connection early.
 
-            result = await conn.execute(text(sql))
-            rows = result.fetchall()
+        Args:
+            query: Query text
+            k: Number of results
+            filter: Metadata filter
+            query_options: C-SPANN query options
+            **kwargs: Additional arguments
 
-        documents = []
-        for row in rows:
-            doc = Document(
-                page_content=row[1],
-                metadata=row[2] or {},
-            )
-            documents.append((doc, float(row[3])))
+        Yields:
+            Documents, nearest first
+        """
+        embedding = await self._aembed_query(query)
+        stmt, params = self._similarity_search_stmt(embedding, k, filter)
 
-        return documents
+        async with self.engine.engine.begin() as conn:
+            await self._aset_query_options(conn, query_options)
+            result = await conn.stream(stmt, params)
+            async for _, content, metadata, _ in result:
+                yield Document.model_construct(page_content=content, metadata=metadata or {})
+
+    def _similarity_search_stmt(
+        self,
+        embedding: list[float],
+        k: int,
+        filter: dict | None,
+        include_embedding: bool = False,
+    ) -> tuple[TextClause, dict[str, Any]]:
+        """Build the top-k search statement and its bind parameters.
+
+        Selects id, content, metadata and distance, followed by the stored
+        embedding when include_embedding is set. Everything that varies per
+        query is a bind parameter, so statements are cached by filter shape
+        and reused.
+        """
+        condition = ""
+        params: dict[str, Any] = {}
+        if filter:
+            condition, params = self._build_filter_clause(filter)
+        params["q"] = self._query_vector_param(embedding)
+        params["k"] = k
+
+        distance = self._distance_sql("q")
+        key = (distance, condition, include_embedding)
+        stmt = self._stmt_cache.get(key)
+        if stmt is None:
+            where_clause = f"WHERE {condition}" if condition else ""
+            extra_columns = f", {self._candidate_embedding_columns}" if include_embedding else ""
+            stmt = text(f"""
+                SELECT {self.id_column}, {self.content_column}, {self.metadata_column},
+                       {distance} AS distance{extra_columns}
+                FROM {self._fqn}
+                {where_clause}
+                ORDER BY distance
+                LIMIT :k
+            """)
+            if len(self._stmt_cache) >= _STMT_CACHE_SIZE:
+                self._stmt_cache.clear()
+            self._stmt_cache[key] = stmt
+
+        return stmt, params
 
     async def asimilarity_search(
         self,
@@ -293,6 +861,256 @@ class AsyncCockroachDBVectorStore(VectorStore):
         results = await self.asimilarity_search_with_score(query, k=k, filter=filter, **kwargs)
         return [doc for doc, _ in results]
 
+    async def asimilarity_search_multi_filter(
+        self,
+        query: str,
+        filters: list[dict | None],
+        k: int = 4,
+        query_options: CSPANNQueryOptions | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Search one query against several metadata filters in one round trip.
+
+        The query is embedded once and every filter becomes a branch of a
+        single UNION ALL statement, instead of one embedding call and one
+        query per filter.
+
+        Args:
+            query: Query text
+            filters: Metadata filters, one per result list (None for no filter)
+            k: Number of results per filter
+            query_options: C-SPANN query options
+            **kwargs: Additional arguments
+
+        Returns:
+            One list of documents per filter, in the same order as filters
+        """
+        if not filters:
+            return []
+
+        query_embedding = await self._aembed_query(query)
+        results = await self._asearch_branches_with_score(
+            [query_embedding],
+            [(0, branch_filter) for branch_filter in filters],
+            k=k,
+            query_options=query_options,
+        )
+        return [[doc for doc, _ in branch] for branch in results]
+
+    async def asimilarity_search_batch(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict | None = None,
+        query_options: CSPANNQueryOptions | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Search several queries in one round trip.
+
+        The queries are embedded concurrently (through the query embedding
+        cache, if enabled) and each becomes a branch of a single UNION ALL
+        statement, instead of one query per search.
+
+        Args:
+            queries: Query texts
+            k: Number of results per query
+            filter: Metadata filter applied to every query
+            query_options: C-SPANN query options
+            **kwargs: Additional arguments
+
+        Returns:
+            One list of documents per query, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        query_embeddings = await asyncio.gather(*(self._aembed_query(q) for q in queries))
+        results = await self._asearch_branches_with_score(
+            list(query_embeddings),
+            [(i, filter) for i in range(len(queries))],
+            k=k,
+            query_options=query_options,
+        )
+        return [[doc for doc, _ in branch] for branch in results]
+
+    async def _asearch_branches_with_score(
+        self,
+        embeddings: list[list[float]],
+        branches: list[tuple[int, dict | None]],
+        k: int,
+        query_options: CSPANNQueryOptions | None = None,
+    ) -> list[list[tuple[Document, float]]]:
+        """Run several top-k searches as one UNION ALL statement.
+
+        Args:
+            embeddings: Query vectors, each bound once
+            branches: (embedding index, filter) pair for each search
+            k: Number of results per branch
+            query_options: C-SPANN query options
+
+        Returns:
+            One list of (document, score) tuples per branch
+        """
+        params: dict[str, Any] = {"k": k}
+        for i, embedding in enumerate(embeddings):
+            params[f"q_{i}"] = self._query_vector_param(embedding)
+
+        selects = []
+        for qid, (embedding_idx, branch_filter) in enumerate(branches):
+            where_clause = ""
+            if branch_filter:
+                condition, filter_params = self._build_filter_clause(branch_filter, f"f{qid}")
+                where_clause = "WHERE " + condition
+                params.update(filter_params)
+
+            distance = self._distance_sql(f"q_{embedding_idx}")
+            selects.append(f"""
+                (SELECT {qid} AS qid, {self.content_column}, {self.metadata_column},
+                        {distance} AS distance
+                 FROM {self._fqn}
+                 {where_clause}
+                 ORDER BY distance
+                 LIMIT :k)
+            """)
+
+        sql = " UNION ALL ".join(selects) + " ORDER BY qid, distance"
+
+        rows = await self._afetch_search_rows(text(sql), params, query_options)
+
+        offset = self._score_offset
+        results: list[list[tuple[Document, float]]] = [[] for _ in branches]
+        for qid, content, metadata, distance in rows:
+            doc = Document.model_construct(page_content=content, metadata=metadata or {})
+            results[qid].append((doc, float(distance) + offset))
+
+        return results
+
+    async def _afetch_search_rows(
+        self,
+        stmt: TextClause,
+        params: dict[str, Any],
+        query_options: CSPANNQueryOptions | None,
+    ) -> Sequence[Row[Any]]:
+        """Run a search query, applying C-SPANN options for this query only.
+
+        Options are applied with ``SET LOCAL`` inside the query's transaction,
+        so they don't leak to later users of the pooled connection. The rows
+        list built by ``fetchall()`` is returned as-is rather than copied.
+        """
+        rows: Sequence[Row[Any]]
+        if not query_options or not query_options.get_session_settings():
+            async with self.engine.engine.connect() as conn:
+                result = await conn.execute(stmt, params)
+                rows = result.fetchall()
+                return rows
+
+        async with self.engine.engine.begin() as conn:
+            await self._aset_query_options(conn, query_options)
+            result = await conn.execute(stmt, params)
+            rows = result.fetchall()
+            return rows
+
+    @staticmethod
+    async def _aset_query_options(
+        conn: AsyncConnection, query_options: CSPANNQueryOptions | None
+    ) -> None:
+        """Apply C-SPANN options to the connection's current transaction only."""
+        settings = query_options.get_session_settings() if query_options else {}
+        for setting, value in settings.items():
+            await conn.execute(text(f"SET LOCAL {setting} = {int(value)}"))
+
+    async def asimilarity_search_with_score_int8(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict | None = None,
+        oversample: int = 4,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        """Search by scanning the int8 sidecar columns on the client.
+
+        Reads only the int8 codes, scales and norms of matching rows (about a
+        quarter of the float data), ranks them with integer dot products,
+        then fetches the best ``k * oversample`` rows and re-ranks them with
+        the exact server-side distance. Requires ``quantization="int8"``.
+
+        This is an exhaustive scan, so it suits tables or filtered subsets
+        small enough to read in full; use C-SPANN indexed search otherwise.
+
+        Args:
+            query: Query text
+            k: Number of results
+            filter: Metadata filter
+            oversample: Candidates fetched per result for exact re-ranking
+            **kwargs: Additional arguments
+
+        Returns:
+            List of (document, score) tuples with exact distances
+
+        Raises:
+            ValueError: If int8 quantization is not enabled
+        """
+        if self.quantization != QuantizationType.INT8:
+            raise ValueError("asimilarity_search_with_score_int8 requires quantization='int8'")
+
+        embedding = await self._aembed_query(query)
+        emb = self.embedding_column
+
+        condition = f"{emb}_int8 IS NOT NULL"
+        params: dict[str, Any] = {}
+        if filter:
+            filter_condition, params = self._build_filter_clause(filter)
+            condition += f" AND {filter_condition}"
+
+        scan_sql = f"""
+            SELECT {self.id_column}, {emb}_int8, {emb}_scale, {emb}_norm
+            FROM {self._fqn}
+            WHERE {condition}
+        """
+        rows = await self._afetch_search_rows(text(scan_sql), params, None)
+        if not rows:
+            return []
+
+        ids = [row[0] for row in rows]
+        codes = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.int8)
+        codes = codes.reshape(len(rows), -1)
+        scales = np.array([row[2] for row in rows], dtype=np.float32)
+        norms = np.array([np.nan if row[3] is None else row[3] for row in rows], dtype=np.float32)
+        missing = np.isnan(norms)
+        if missing.any():
+            # Rows written before the norm column existed
+            norms[missing] = np.linalg.norm(
+                dequantize_int8(codes[missing], scales[missing]), axis=1
+            )
+
+        distances = int8_distances(embedding, codes, scales, norms, self.distance_strategy)
+        n_candidates = min(len(rows), k * max(oversample, 1))
+        candidates = np.argpartition(distances, n_candidates - 1)[:n_candidates]
+
+        rescore_sql = f"""
+            SELECT {self.content_column}, {self.metadata_column},
+                   {self._distance_sql("q")} AS distance
+            FROM {self._fqn}
+            WHERE {self.id_column} = ANY(:ids)
+            ORDER BY distance
+            LIMIT :k
+        """
+        rescore_params = {
+            "ids": [ids[i] for i in candidates],
+            "q": self._query_vector_param(embedding),
+            "k": k,
+        }
+        rows = await self._afetch_search_rows(text(rescore_sql), rescore_params, None)
+
+        offset = self._score_offset
+        return [
+            (
+                Document.model_construct(page_content=content, metadata=metadata or {}),
+                float(distance) + offset,
+            )
+            for content, metadata, distance in rows
+        ]
+
     async def amax_marginal_relevance_search(
         self,
         query: str,
@@ -315,48 +1133,62 @@ class AsyncCockroachDBVectorStore(VectorStore):
         Returns:
             List of documents
         """
-        query_embedding = await self._embeddings.aembed_query(query)
-        candidates = await self.asimilarity_search_with_score_by_vector(
-            query_embedding, k=fetch_k, filter=filter, **kwargs
+        query_embedding = await self._aembed_query(query)
+        return await self.amax_marginal_relevance_search_by_vector(
+            query_embedding,
+            k=k,
+            fetch_k=fetch_k,
+            lambda_mult=lambda_mult,
+            filter=filter,
+            **kwargs,
         )
 
-        if not candidates:
-            return []
-
-        query_vec = np.array(query_embedding)
-        candidate_vecs = []
-        candidate_docs = []
-
-        for doc, _score in candidates:
-            doc_embedding = await self._embeddings.aembed_query(doc.page_content)
-            candidate_vecs.append(doc_embedding)
-            candidate_docs.append(doc)
-
-        selected_indices = [0]
-        selected = [candidate_vecs[0]]
-
-        while len(selected_indices) < min(k, len(candidates)):
-            best_score = -float("inf")
-            best_idx = -1
-
-            for i, vec in enumerate(candidate_vecs):
-                if i in selected_indices:
-                    continue
+    async def amax_marginal_relevance_search_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: dict | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        """Max marginal relevance search by embedding vector.
 
-                relevance = np.dot(query_vec, vec)
-                max_similarity = max(np.dot(vec, s) for s in selected)
-                score = lambda_mult * relevance - (1 - lambda_mult) * max_similarity
+        Candidate embeddings are read back from the table with the
+        candidates, so no extra embedding calls are made.
 
-                if score > best_score:
-                    best_score = score
-                    best_idx = i
+        Args:
+            embedding: Query embedding vector
+            k: Number of results
+            fetch_k: Number of candidates to fetch
+            lambda_mult: Diversity parameter (0=max diversity, 1=max relevance)
+            filter: Metadata filter
+            **kwargs: Additional arguments (query_options supported)
 
-            if best_idx == -1:
-                break
+        Returns:
+            List of documents
+        """
+        stmt, params = self._similarity_search_stmt(
+            embedding, fetch_k, filter, include_embedding=True
+        )
+        rows = await self._afetch_search_rows(stmt, params, kwargs.get("query_options"))
 
-            selected_indices.append(best_idx)
-            selected.append(candidate_vecs[best_idx])
+        if not rows:
+            return []
 
+        candidate_docs = [
+            Document.model_construct(page_content=content, metadata=metadata or {})
+            for _, content, metadata, *_ in rows
+        ]
+        vector_columns = [row[4:] for row in rows]
+        if len(rows) >= _MMR_OFFLOAD_CANDIDATES:
+            # NumPy releases the GIL in the products, so other queries on this
+            # event loop keep running while a large candidate set is reranked
+            selected_indices = await asyncio.to_thread(
+                _select_mmr, embedding, vector_columns, k, lambda_mult
+            )
+        else:
+            selected_indices = _select_mmr(embedding, vector_columns, k, lambda_mult)
         return [candidate_docs[i] for i in selected_indices]
 
     async def adelete(
@@ -366,6 +1198,9 @@ class AsyncCockroachDBVectorStore(VectorStore):
     ) -> bool | None:
         """Delete documents by IDs.
 
+        IDs are bound as one array parameter per chunk of
+        ``_DELETE_CHUNK_SIZE``, and all chunks run in one transaction.
+
         Args:
             ids: Document IDs to delete
             **kwargs: Additional arguments
@@ -376,12 +1211,14 @@ class AsyncCockroachDBVectorStore(VectorStore):
         if not ids:
             return True
 
-        ids_str = ",".join(f"'{id}'" for id in ids)
-        sql = f"DELETE FROM {self._fqn} WHERE {self.id_column} IN ({ids_str})"
-
-        async with self.engine.engine.begin() as conn:
-            await conn.execute(text(sql))
+        ids = [str(id) for id in ids]
+        stmt = text(f"DELETE FROM {self._fqn} WHERE {self.id_column} = ANY(:ids)")
 
+        chunks = [
+            {"ids": ids[i : i + _DELETE_CHUNK_SIZE]} for i in range(0, len(ids), _DELETE_CHUNK_SIZE)
+        ]
+        await self._aexecute_with_retry(stmt, chunks)
+        self._invalidate_query_cache()
         return True
 
     async def aapply_vector_index(
@@ -420,74 +1257,15 @@ class AsyncCockroachDBVectorStore(VectorStore):
         async with self.engine.engine.begin() as conn:
             await conn.execute(text(sql))
 
-    def _build_filter_clause(self, filter: dict) -> str:
-        """Build WHERE clause from filter dictionary.
+    def _build_filter_clause(self, filter: dict, prefix: str = "f") -> tuple[str, dict[str, Any]]:
+        """Build a parameterized WHERE condition from a filter dictionary.
 
         Supports operators: $and, $or, $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin
+
+        Returns:
+            Tuple of (SQL condition, bind parameters)
         """
-        import json
-
-        if not filter:
-            return ""
-
-        if "$and" in filter:
-            clauses = [self._build_filter_clause(f) for f in filter["$and"]]
-            return "(" + " AND ".join(clauses) + ")"
-
-        if "$or" in filter:
-            clauses = [self._build_filter_clause(f) for f in filter["$or"]]
-            return "(" + " OR ".join(clauses) + ")"
-
-        clauses = []
-        for key, value in filter.items():
-            if isinstance(value, dict):
-                for op, op_value in value.items():
-                    clause = self._build_operator_clause(key, op, op_value)
-                    clauses.append(clause)
-            elif isinstance(value, str):
-                json_val = json.dumps(value)
-                clauses.append(f"{self.metadata_column}->'{key}' = '{json_val}'::jsonb")
-            else:
-                clauses.append(f"{self.metadata_column}->'{key}' = '{value}'")
-
-        return " AND ".join(clauses) if clauses else "true"
-
-    def _build_operator_clause(self, key: str, operator: str, value: Any) -> str:
-        """Build operator clause."""
-        import json
-
-        col = f"{self.metadata_column}->'{key}'"
-
-        if operator == "$eq":
-            if isinstance(value, str):
-                json_val = json.dumps(value)
-                return f"{col} = '{json_val}'::jsonb"
-            return f"{col} = '{value}'"
-        elif operator == "$ne":
-            if isinstance(value, str):
-                json_val = json.dumps(value)
-                return f"{col} != '{json_val}'::jsonb"
-            return f"{col} != '{value}'"
-        elif operator == "$gt":
-            return f"({col})::numeric > {value}"
-        elif operator == "$gte":
-            return f"({col})::numeric >= {value}"
-        elif operator == "$lt":
-            return f"({col})::numeric < {value}"
-        elif operator == "$lte":
-            return f"({col})::numeric <= {value}"
-        elif operator == "$in":
-            values = ",".join(
-                f"'{json.dumps(v)}'::jsonb" if isinstance(v, str) else f"'{v}'" for v in value
-            )
-            return f"{col} IN ({values})"
-        elif operator == "$nin":
-            values = ",".join(
-                f"'{json.dumps(v)}'::jsonb" if isinstance(v, str) else f"'{v}'" for v in value
-            )
-            return f"{col} NOT IN ({values})"
-        else:
-            raise ValueError(f"Unsupported operator: {operator}")
+        return compile_filter(filter, metadata_column=self.metadata_column, prefix=prefix)
 
     @classmethod
     async def afrom_texts(
@@ -498,6 +1276,8 @@ class AsyncCockroachDBVectorStore(VectorStore):
         engine: CockroachDBEngine | None = None,
         connection_string: str | None = None,
         collection_name: str = "langchain_vectors",
+        *,
+        warmup: bool = False,
         **kwargs: Any,
     ) -> "AsyncCockroachDBVectorStore":
         """Create vector store from texts.
@@ -509,6 +1289,8 @@ class AsyncCockroachDBVectorStore(VectorStore):
             engine: CockroachDBEngine instance
             connection_string: Connection string (if engine not provided)
             collection_name: Table name
+            warmup: Open the engine's pool connections before returning, so
+                the first searches don't pay for connection setup
             **kwargs: Additional arguments
 
         Returns:
@@ -532,6 +1314,8 @@ class AsyncCockroachDBVectorStore(VectorStore):
         )
 
         await store.aadd_texts(texts, metadatas=metadatas)
+        if warmup:
+            await engine.awarmup()
 
         return store
 
@@ -0,0 +1,223 @@
+"""In-memory LRU cache wrapper for embedding models, with an optional SQLite tier."""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_DOCUMENT = "document"
+_QUERY = "query"
+
+# Hashes per SQLite lookup, below the default bound-parameter limit
+_LOAD_CHUNK_SIZE = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that memoizes vectors per text.
+
+    Document and query embeddings are cached separately, since some models
+    embed queries differently from documents. Only texts missing from the
+    cache are sent to the wrapped model, in one batched call.
+
+    With ``persist_path`` set, vectors are also stored in a SQLite file keyed
+    by ``(namespace, kind, sha256(text))``, so re-indexing unchanged texts in
+    a later process doesn't call the model again. Memory misses are looked up
+    there before the model is called, and new vectors are written in one
+    transaction per call.
+    """
+
+    def __init__(
+        self,
+        inner: Embeddings,
+        maxsize: int = 10_000,
+        persist_path: str | None = None,
+        namespace: str | None = None,
+    ):
+        """Initialize cached embeddings.
+
+        Args:
+            inner: Embeddings model to wrap
+            maxsize: Maximum cached vectors per cache (documents and queries)
+            persist_path: SQLite file for the persistent tier (default: memory only)
+            namespace: Key prefix separating models that share a SQLite file
+                (default: the wrapped class name and its ``model`` attribute)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.inner = inner
+        self.maxsize = maxsize
+        self.persist_path = persist_path
+        self.namespace = namespace or (
+            f"{type(inner).__module__}.{type(inner).__qualname__}:{getattr(inner, 'model', '')}"
+        )
+        self._documents: OrderedDict[str, list[float]] = OrderedDict()
+        self._queries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._db: sqlite3.Connection | None = None
+        if persist_path is not None:
+            self._db = sqlite3.connect(persist_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "namespace TEXT NOT NULL, kind TEXT NOT NULL, hash BLOB NOT NULL, "
+                "vector BLOB NOT NULL, PRIMARY KEY (namespace, kind, hash))"
+            )
+            self._db.commit()
+
+    def _cache(self, kind: str) -> OrderedDict[str, list[float]]:
+        """Memory cache for document or query vectors."""
+        return self._documents if kind == _DOCUMENT else self._queries
+
+    def _lookup(self, kind: str, texts: list[str]) -> tuple[list[list[float] | None], list[str]]:
+        """Return cached vectors (None for misses) and the unique missing texts."""
+        cache = self._cache(kind)
+        found: list[list[float] | None] = []
+        missing: dict[str, None] = {}
+        with self._lock:
+            for text in texts:
+                vector = cache.get(text)
+                if vector is None:
+                    missing[text] = None
+                else:
+                    cache.move_to_end(text)
+                found.append(vector)
+
+            if self._db is not None and missing:
+                stored = self._load(self._db, kind, list(missing))
+                if stored:
+                    self._remember(cache, list(stored), list(stored.values()))
+                    found = [
+                        vector if vector is not None else stored.get(text)
+                        for text, vector in zip(texts, found, strict=True)
+                    ]
+                    missing = {text: None for text in missing if text not in stored}
+        return found, list(missing)
+
+    def _load(self, db: sqlite3.Connection, kind: str, texts: list[str]) -> dict[str, list[float]]:
+        """Read vectors for texts from the SQLite tier."""
+        by_hash = {_text_hash(text): text for text in texts}
+        hashes = list(by_hash)
+        stored: dict[str, list[float]] = {}
+        for start in range(0, len(hashes), _LOAD_CHUNK_SIZE):
+            chunk = hashes[start : start + _LOAD_CHUNK_SIZE]
+            rows = db.execute(
+                "SELECT hash, vector FROM embeddings "
+                f"WHERE namespace = ? AND kind = ? AND hash IN ({', '.join('?' * len(chunk))})",
+                (self.namespace, kind, *chunk),
+            ).fetchall()
+            for digest, blob in rows:
+                stored[by_hash[digest]] = np.frombuffer(blob, dtype=np.float64).tolist()
+        return stored
+
+    def _remember(
+        self,
+        cache: OrderedDict[str, list[float]],
+        texts: list[str],
+        vectors: list[list[float]],
+    ) -> None:
+        """Insert vectors into a memory cache and evict least recently used entries."""
+        for text, vector in zip(texts, vectors, strict=True):
+            cache[text] = vector
+            cache.move_to_end(text)
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    def _store(self, kind: str, texts: list[str], vectors: list[list[float]]) -> None:
+        """Cache newly computed vectors in memory and, if enabled, on disk."""
+        with self._lock:
+            self._remember(self._cache(kind), texts, vectors)
+            if self._db is not None and texts:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                        [
+                            (
+                                self.namespace,
+                                kind,
+                                _text_hash(text),
+                                np.asarray(vector, dtype=np.float64).tobytes(),
+                            )
+                            for text, vector in zip(texts, vectors, strict=True)
+                        ],
+                    )
+
+    def _merge(
+        self,
+        texts: list[str],
+        found: list[list[float] | None],
+        missing: list[str],
+        computed: list[list[float]],
+    ) -> list[list[float]]:
+        """Combine cached and newly computed vectors in input order."""
+        fresh = dict(zip(missing, computed, strict=True))
+        return [
+            list(vector if vector is not None else fresh[text])
+            for text, vector in zip(texts, found, strict=True)
+        ]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents, computing only texts that are not cached."""
+        found, missing = self._lookup(_DOCUMENT, texts)
+        computed = self.inner.embed_documents(missing) if missing else []
+        self._store(_DOCUMENT, missing, computed)
+        return self._merge(texts, found, missing, computed)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents (async), computing only texts that are not cached."""
+        found, missing = self._lookup(_DOCUMENT, texts)
+        computed = await self.inner.aembed_documents(missing) if missing else []
+        self._store(_DOCUMENT, missing, computed)
+        return self._merge(texts, found, missing, computed)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, reusing a cached vector when available."""
+        found, _ = self._lookup(_QUERY, [text])
+        if found[0] is not None:
+            return list(found[0])
+        vector = self.inner.embed_query(text)
+        self._store(_QUERY, [text], [vector])
+        return list(vector)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Embed a query (async), reusing a cached vector when available."""
+        found, _ = self._lookup(_QUERY, [text])
+        if found[0] is not None:
+            return list(found[0])
+        vector = await self.inner.aembed_query(text)
+        self._store(_QUERY, [text], [vector])
+        return list(vector)
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the number of cached document and query vectors."""
+        with self._lock:
+            return {
+                "documents": len(self._documents),
+                "queries": len(self._queries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached vectors, including this namespace's persisted ones."""
+        with self._lock:
+            self._documents.clear()
+            self._queries.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "DELETE FROM embeddings WHERE namespace = ?", (self.namespace,)
+                    )
+
+    def close(self) -> None:
+        """Close the SQLite tier, if any; later calls use the memory cache only."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _text_hash(text: str) -> bytes:
+    """Cache key of a text in the SQLite tier."""
+    return hashlib.sha256(text.encode()).digest()
@@ -1,23 +1,154 @@
 """Chat message history implementation for CockroachDB."""
 
-import json
+import uuid
+from collections.abc import Sequence
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
 
+import psycopg
 from langchain_core.chat_history import BaseChatMessageHistory
-from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
-from sqlalchemy import text
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    message_to_dict,
+    messages_from_dict,
+    messages_to_dict,
+)
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from langchain_cockroachdb._json import dumps as json_dumps
+from langchain_cockroachdb._json import loads as json_loads
+from langchain_cockroachdb._loop import run_sync
+
+# Rows per multi-row INSERT in aadd_messages
+_INSERT_CHUNK_SIZE = 500
+
+# Message types decoded directly; anything else goes through messages_from_dict
+_FAST_FROM_DICT: dict[str, type[BaseMessage]] = {
+    "human": HumanMessage,
+    "ai": AIMessage,
+    "system": SystemMessage,
+    "tool": ToolMessage,
+}
+
+
+# Namespace for row ids derived from (session_id, message.id)
+_MESSAGE_ID_NAMESPACE = uuid.UUID("8f6e2f61-3c1b-4d0a-9a57-2b8e4c6d1f90")
+
+
+def _message_row_id(session_id: str | uuid.UUID, message: BaseMessage) -> uuid.UUID:
+    """Row id for a message: stable for messages with an id, random otherwise."""
+    if message.id:
+        return uuid.uuid5(_MESSAGE_ID_NAMESPACE, f"{session_id}:{message.id}")
+    return uuid.uuid4()
+
+
+def _message_from_dict(item: dict[str, Any] | str) -> BaseMessage:
+    """Decode a stored message dict, skipping the generic dispatch for common types.
+
+    Drivers that return JSONB as text (rather than decoded by their loader)
+    hand over a string, which is parsed here first.
+    """
+    data: dict[str, Any] = json_loads(item) if isinstance(item, str) else item
+    cls = _FAST_FROM_DICT.get(data["type"])
+    if cls is not None:
+        return cls(**data["data"])
+    message: BaseMessage = messages_from_dict([data])[0]
+    return message
+
+
+@lru_cache(maxsize=128)
+def _message_statements(fqn: str) -> tuple[TextClause, TextClause, TextClause]:
+    """Build the select, insert and delete statements for a message table."""
+    select_stmt = text(f"""
+        SELECT message 
+        FROM {fqn} 
+        WHERE session_id = :session_id 
+        ORDER BY created_at ASC
+    """)
+    insert_stmt = text(f"""
+        INSERT INTO {fqn} (id, session_id, message)
+        VALUES (:id, :session_id, CAST(:message AS jsonb))
+        ON CONFLICT (id) DO NOTHING
+    """)
+    delete_stmt = text(f"""
+        DELETE FROM {fqn} 
+        WHERE session_id = :session_id
+    """)
+    return select_stmt, insert_stmt, delete_stmt
+
+
+@lru_cache(maxsize=128)
+def _message_window_stmt(
+    fqn: str, has_limit: bool, has_offset: bool, newest_first: bool
+) -> TextClause:
+    """Build a select of one session's messages with optional LIMIT/OFFSET."""
+    order = "DESC" if newest_first else "ASC"
+    sql = f"SELECT message FROM {fqn} WHERE session_id = :session_id ORDER BY created_at {order}"
+    if has_limit:
+        sql += " LIMIT :limit"
+    if has_offset:
+        sql += " OFFSET :offset"
+    return text(sql)
+
+
+@lru_cache(maxsize=32)
+def _message_insert_stmt(fqn: str, n: int) -> TextClause:
+    """Build an n-row INSERT of one session's messages.
+
+    Row ``i`` gets ``created_at = now() + :chunk_offset + i microseconds``,
+    so the same statement serves every chunk of a given size.
+    """
+    values = ", ".join(
+        f"(:id_{i}, :session_id, CAST(:message_{i} AS jsonb), "
+        f"now() + CAST(:chunk_offset AS INTERVAL) + INTERVAL '{i} microseconds')"
+        for i in range(n)
+    )
+    return text(
+        f"INSERT INTO {fqn} (id, session_id, message, created_at) VALUES {values} "
+        "ON CONFLICT (id) DO NOTHING"
+    )
+
+
+@lru_cache(maxsize=128)
+def _message_table_ddl(
+    fqn: str, table_name: str, session_id_type: str, covering_index: bool
+) -> tuple[TextClause, ...]:
+    """Build the CREATE TABLE and CREATE INDEX statements for a message table."""
+    create_stmt = text(f"""
+        CREATE TABLE IF NOT EXISTS {fqn} (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            session_id {session_id_type} NOT NULL,
+            message JSONB NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT now()
+        )
+    """)
+    storing = "STORING (message)" if covering_index else ""
+    index_stmt = text(f"""
+        CREATE INDEX IF NOT EXISTS {table_name}_session_idx 
+        ON {fqn} (session_id, created_at) {storing}
+    """)
+    return create_stmt, index_stmt
+
 
 class CockroachDBChatMessageHistory(BaseChatMessageHistory):
     """Chat message history stored in CockroachDB."""
 
     def __init__(
         self,
-        session_id: str,
+        session_id: str | uuid.UUID,
         connection_string: str | None = None,
         engine: AsyncEngine | None = None,
         table_name: str = "message_store",
         schema: str = "public",
+        *,
+        session_id_type: str = "TEXT",
+        covering_index: bool = True,
     ):
         """Initialize chat message history.
 
@@ -27,15 +158,37 @@ class CockroachDBChatMessageHistory(BaseChatMessageHistory):
             engine: Existing async engine
             table_name: Table name for messages
             schema: Database schema
+            session_id_type: Column type for session_id when creating the table.
+                Use "UUID" for 16-byte keys when session ids are UUIDs.
+            covering_index: Store the message in the (session_id, created_at)
+                index when creating the table, so reads are served from the
+                index without a primary-key lookup per row. Roughly doubles the
+                storage written per message; disable for write-heavy workloads
+                (default: True)
         """
         if engine is None and connection_string is None:
             raise ValueError("Either engine or connection_string must be provided")
 
-        self.session_id = session_id
+        self.session_id_type = session_id_type
+        self.covering_index = covering_index
+        self.session_id: str | uuid.UUID
+        if session_id_type.upper() == "UUID":
+            # Bind as a native UUID so the driver uses the binary UUID codec
+            self.session_id = (
+                session_id if isinstance(session_id, uuid.UUID) else uuid.UUID(session_id)
+            )
+        else:
+            self.session_id = str(session_id)
         self.table_name = table_name
         self.schema = schema
         self._fqn = f"{schema}.{table_name}"
 
+        # Hot-path statements are shared by every history on the same table.
+        # Reusing the same SQL text lets SQLAlchemy's compiled cache hit and
+        # psycopg auto-prepare the statement server-side after repeated
+        # execution on a connection, skipping parse/plan on later calls.
+        self._select_stmt, self._insert_stmt, self._delete_stmt = _message_statements(self._fqn)
+
         if engine is None:
             if connection_string is None:
                 raise ValueError("connection_string is required when engine is None")
@@ -46,112 +199,172 @@ class CockroachDBChatMessageHistory(BaseChatMessageHistory):
                     "cockroachdb://", "cockroachdb+psycopg://", 1
                 )
 
-            self.engine = create_async_engine(connection_string)
+            # JSONB messages are decoded by the driver's loader, with orjson when installed
+            self.engine = create_async_engine(connection_string, json_deserializer=json_loads)
             self._owns_engine = True
         else:
             self.engine = engine
             self._owns_engine = False
 
     async def _acreate_table_if_not_exists(self) -> None:
-        """Create message store table if it doesn't exist."""
-        create_sql = f"""
-            CREATE TABLE IF NOT EXISTS {self._fqn} (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                session_id TEXT NOT NULL,
-                message JSONB NOT NULL,
-                created_at TIMESTAMPTZ DEFAULT now()
-            )
-        """
+        """Create message store table if it doesn't exist.
 
-        index_sql = f"""
-            CREATE INDEX IF NOT EXISTS {self.table_name}_session_idx 
-            ON {self._fqn} (session_id, created_at)
+        The CREATE TABLE and CREATE INDEX statements are sent as one script.
         """
-
+        statements = _message_table_ddl(
+            self._fqn, self.table_name, self.session_id_type, self.covering_index
+        )
+        script = ";\n".join(stmt.text for stmt in statements)
         async with self.engine.begin() as conn:
-            await conn.execute(text(create_sql))
-            await conn.execute(text(index_sql))
+            await conn.exec_driver_sql(script, execution_options={"no_parameters": True})
 
     def create_table_if_not_exists(self) -> None:
         """Create table (sync wrapper)."""
-        import asyncio
-
-        asyncio.run(self._acreate_table_if_not_exists())
+        run_sync(self._acreate_table_if_not_exists())
 
     @property
     def messages(self) -> list[BaseMessage]:
         """Get all messages for this session."""
-        import asyncio
+        return run_sync(self.aget_messages())
 
-        return asyncio.run(self.aget_messages())
+    async def aget_messages(
+        self, limit: int | None = None, offset: int | None = None
+    ) -> list[BaseMessage]:
+        """Get messages for this session, oldest first (async).
 
-    async def aget_messages(self) -> list[BaseMessage]:
-        """Get all messages for this session (async)."""
-        query = f"""
-            SELECT message 
-            FROM {self._fqn} 
-            WHERE session_id = :session_id 
-            ORDER BY created_at ASC
+        Args:
+            limit: Maximum number of messages to return (default: all)
+            offset: Number of oldest messages to skip (default: 0)
+
+        Returns:
+            Messages in insertion order
         """
+        if limit is None and offset is None:
+            return await self._afetch_messages(self._select_stmt, {})
 
-        async with self.engine.connect() as conn:
-            result = await conn.execute(text(query), {"session_id": self.session_id})
-            rows = result.fetchall()
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        stmt = _message_window_stmt(self._fqn, "limit" in params, "offset" in params, False)
+        return await self._afetch_messages(stmt, params)
+
+    def get_recent(self, n: int) -> list[BaseMessage]:
+        """Get the n most recent messages for this session."""
+        return run_sync(self.aget_recent(n))
+
+    async def aget_recent(self, n: int) -> list[BaseMessage]:
+        """Get the n most recent messages, oldest first (async).
+
+        Only the last n rows are read, newest first with ``LIMIT``, and then
+        put back in insertion order, so long sessions aren't loaded in full.
+
+        Args:
+            n: Number of messages to return
 
-        if not rows:
+        Returns:
+            Up to n messages in insertion order
+        """
+        if n <= 0:
             return []
 
-        items = [json.loads(row[0]) if isinstance(row[0], str) else row[0] for row in rows]
-        messages: list[BaseMessage] = messages_from_dict(items)
+        stmt = _message_window_stmt(self._fqn, True, False, True)
+        messages = await self._afetch_messages(stmt, {"limit": n})
+        messages.reverse()
         return messages
 
+    async def _afetch_messages(self, stmt: TextClause, params: dict[str, Any]) -> list[BaseMessage]:
+        """Run a message select for this session and decode the rows."""
+        async with self.engine.connect() as conn:
+            result = await conn.execute(stmt, {"session_id": self.session_id, **params})
+            items = result.scalars().all()
+
+        # psycopg's JSONB loader has already decoded each message; other
+        # drivers of a user-supplied engine may return text
+        return [_message_from_dict(item) for item in items]
+
     def add_message(self, message: BaseMessage) -> None:
         """Add a message to the session."""
-        import asyncio
-
-        asyncio.run(self.aadd_message(message))
+        run_sync(self.aadd_message(message))
 
     async def aadd_message(self, message: BaseMessage) -> None:
-        """Add a message (async)."""
-        message_dict = messages_to_dict([message])[0]
-        message_json = json.dumps(message_dict)
+        """Add a message (async).
 
-        insert_sql = f"""
-            INSERT INTO {self._fqn} (session_id, message)
-            VALUES (:session_id, CAST(:message AS jsonb))
+        A message whose ``id`` is set is stored at most once per session;
+        adding it again (for example when retrying) is a no-op.
         """
+        message_json = json_dumps(message_to_dict(message))
+        params = {
+            "id": _message_row_id(self.session_id, message),
+            "session_id": self.session_id,
+            "message": message_json,
+        }
 
         async with self.engine.begin() as conn:
-            await conn.execute(
-                text(insert_sql), {"session_id": self.session_id, "message": message_json}
-            )
+            await conn.execute(self._insert_stmt, params)
 
-    def add_messages(self, messages: list[BaseMessage]) -> None:
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
         """Add multiple messages."""
-        import asyncio
+        run_sync(self.aadd_messages(messages))
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Add multiple messages with multi-row INSERTs in one transaction (async).
 
-        asyncio.run(self.aadd_messages(messages))
+        Messages are written in chunks of up to 500 rows per statement. All
+        rows share the transaction timestamp, so each row's created_at is
+        offset by its position to keep retrieval order equal to insertion order.
 
-    async def aadd_messages(self, messages: list[BaseMessage]) -> None:
-        """Add multiple messages (async)."""
-        for message in messages:
-            await self.aadd_message(message)
+        When there is more than one chunk and the connection is a psycopg 3
+        connection with pipeline support, the chunks are sent in pipeline
+        mode so they cost one round trip instead of one per chunk.
+
+        As with ``aadd_message``, messages whose ``id`` is set are stored at
+        most once per session, so replaying a batch doesn't duplicate them.
+        """
+        if not messages:
+            return
+
+        message_jsons = [json_dumps(d) for d in messages_to_dict(messages)]
+        chunks: list[tuple[TextClause, dict[str, Any]]] = []
+        for start in range(0, len(message_jsons), _INSERT_CHUNK_SIZE):
+            chunk = message_jsons[start : start + _INSERT_CHUNK_SIZE]
+            params: dict[str, Any] = {
+                "session_id": self.session_id,
+                "chunk_offset": timedelta(microseconds=start),
+            }
+            for i, message_json in enumerate(chunk):
+                params[f"id_{i}"] = _message_row_id(self.session_id, messages[start + i])
+                params[f"message_{i}"] = message_json
+            chunks.append((_message_insert_stmt(self._fqn, len(chunk)), params))
+
+        async with self.engine.begin() as conn:
+            driver_conn = None
+            if len(chunks) > 1:
+                raw = await conn.get_raw_connection()
+                driver_conn = raw.driver_connection
+
+            if isinstance(driver_conn, psycopg.AsyncConnection) and (
+                psycopg.AsyncPipeline.is_supported()
+            ):
+                # Runs inside the transaction SQLAlchemy opened on this connection
+                compiled = {stmt: stmt.compile(dialect=conn.dialect) for stmt, _ in chunks}
+                async with driver_conn.pipeline(), driver_conn.cursor() as cur:
+                    for stmt, params in chunks:
+                        sql = compiled[stmt]
+                        await cur.execute(str(sql), sql.construct_params(params))
+            else:
+                for stmt, params in chunks:
+                    await conn.execute(stmt, params)
 
     def clear(self) -> None:
         """Clear all messages for this session."""
-        import asyncio
-
-        asyncio.run(self.aclear())
+        run_sync(self.aclear())
 
     async def aclear(self) -> None:
         """Clear messages (async)."""
-        delete_sql = f"""
-            DELETE FROM {self._fqn} 
-            WHERE session_id = :session_id
-        """
-
         async with self.engine.begin() as conn:
-            await conn.execute(text(delete_sql), {"session_id": self.session_id})
+            await conn.execute(self._delete_stmt, {"session_id": self.session_id})
 
     async def aclose(self) -> None:
         """Close engine if we own it."""
@@ -160,20 +373,4 @@ class CockroachDBChatMessageHistory(BaseChatMessageHistory):
 
     def close(self) -> None:
         """Close engine (sync)."""
-        import asyncio
-
-        asyncio.run(self.aclose())
-
-    def __del__(self) -> None:
-        """Cleanup on deletion."""
-        if self._owns_engine and hasattr(self, "engine"):
-            try:
-                import asyncio
-
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.engine.dispose())
-                else:
-                    asyncio.run(self.engine.dispose())
-            except Exception:
-                pass
+        run_sync(self.aclose())
@@ -1,13 +1,166 @@
 """CockroachDB async engine management with transaction retry support."""
 
 import asyncio
+import struct
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import text
+import numpy as np
+import psycopg
+from psycopg.abc import Buffer
+from psycopg.adapt import Dumper, Loader
+from psycopg.pq import Format
+from psycopg.types import TypeInfo
+from sqlalchemy import TextClause, event, text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from langchain_cockroachdb._json import loads as json_loads
+from langchain_cockroachdb._loop import run_sync
+from langchain_cockroachdb.quantization import QuantizationType
 from langchain_cockroachdb.retry import async_retry_with_backoff
 
+# Header of a binary VECTOR value: dimension and a reserved field
+_VECTOR_HEADER = struct.Struct(">HH")
+
+
+class _VectorBinaryDumper(Dumper):
+    """Dump float arrays as VECTOR in the binary protocol.
+
+    The wire format is pgvector's: a big-endian uint16 dimension, a uint16
+    reserved field, then big-endian float32 values.
+    """
+
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> Buffer | None:
+        values = np.asarray(obj, dtype=">f4")
+        return _VECTOR_HEADER.pack(len(values), 0) + values.tobytes()
+
+
+class _VectorTextLoader(Loader):
+    """Load VECTOR text (``[1,2,3]``) as a float32 array in one C-level parse."""
+
+    def load(self, data: Any) -> np.ndarray:
+        return np.fromstring(bytes(data)[1:-1].decode(), sep=",", dtype=np.float32)
+
+
+class _VectorBinaryLoader(Loader):
+    """Load binary-protocol VECTOR values as a float32 array."""
+
+    format = Format.BINARY
+
+    def load(self, data: Any) -> np.ndarray:
+        return np.frombuffer(data, dtype=">f4", offset=_VECTOR_HEADER.size).astype(np.float32)
+
+
+async def _register_vector_types(conn: psycopg.AsyncConnection) -> None:
+    """Register the VECTOR codec on one connection.
+
+    NumPy arrays bound as parameters are sent in binary; VECTOR results are
+    decoded to float32 arrays.
+    """
+    info = await TypeInfo.fetch(conn, "vector")
+    if info is None:
+        raise psycopg.ProgrammingError("VECTOR type not found in the database")
+
+    dumper = type("VectorBinaryDumper", (_VectorBinaryDumper,), {"oid": info.oid})
+    conn.adapters.register_dumper(np.ndarray, dumper)
+    conn.adapters.register_loader(info.oid, _VectorTextLoader)
+    conn.adapters.register_loader(info.oid, _VectorBinaryLoader)
+
+
+def _register_vector_codec(engine: AsyncEngine) -> None:
+    """Register the VECTOR codec on every new connection of an engine."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.run_async(_register_vector_types)
+
+
+@lru_cache(maxsize=128)
+def _vectorstore_table_ddl(
+    fqn: str,
+    table_name: str,
+    *,
+    vector_dimension: int,
+    id_type: str,
+    content_column: str,
+    embedding_column: str,
+    metadata_column: str,
+    create_tsvector: bool,
+    quantization: QuantizationType,
+) -> tuple[TextClause, ...]:
+    """Build the CREATE/ALTER statements for a vector store table."""
+    statements = [
+        text(f"""
+            CREATE TABLE IF NOT EXISTS {fqn} (
+                id {id_type} PRIMARY KEY DEFAULT gen_random_uuid(),
+                {content_column} TEXT,
+                {embedding_column} VECTOR({vector_dimension}),
+                {metadata_column} JSONB DEFAULT '{{}}'::jsonb,
+                created_at TIMESTAMPTZ DEFAULT now()
+            )
+        """)
+    ]
+
+    if create_tsvector:
+        tsvector_col = f"{content_column}_tsvector"
+        statements.append(
+            text(f"""
+                ALTER TABLE {fqn} 
+                ADD COLUMN IF NOT EXISTS {tsvector_col} TSVECTOR 
+                GENERATED ALWAYS AS (to_tsvector('english', {content_column})) STORED
+            """)
+        )
+        statements.append(
+            text(f"""
+                CREATE INDEX IF NOT EXISTS {table_name}_{tsvector_col}_idx 
+                ON {fqn} USING GIN ({tsvector_col})
+            """)
+        )
+
+    if quantization == QuantizationType.INT8:
+        statements.append(
+            text(f"""
+                ALTER TABLE {fqn}
+                ADD COLUMN IF NOT EXISTS {embedding_column}_int8 BYTES,
+                ADD COLUMN IF NOT EXISTS {embedding_column}_scale FLOAT4,
+                ADD COLUMN IF NOT EXISTS {embedding_column}_norm FLOAT4
+            """)
+        )
+
+    return tuple(statements)
+
+
+def _vectorstore_table_objects(
+    table_name: str,
+    *,
+    content_column: str,
+    embedding_column: str,
+    metadata_column: str,
+    create_tsvector: bool,
+    quantization: QuantizationType,
+) -> frozenset[str]:
+    """Names of the columns and indexes that _vectorstore_table_ddl creates."""
+    names = {"id", content_column, embedding_column, metadata_column}
+    if create_tsvector:
+        tsvector_col = f"{content_column}_tsvector"
+        names.update((tsvector_col, f"{table_name}_{tsvector_col}_idx"))
+    if quantization == QuantizationType.INT8:
+        names.update(f"{embedding_column}_{suffix}" for suffix in ("int8", "scale", "norm"))
+    return frozenset(names)
+
+
+# Column and index names of one table, to tell whether its DDL can be skipped
+_TABLE_OBJECTS_SQL = text("""
+    SELECT column_name FROM information_schema.columns
+    WHERE table_schema = :schema AND table_name = :table_name
+    UNION ALL
+    SELECT indexname FROM pg_indexes
+    WHERE schemaname = :schema AND tablename = :table_name
+""")
+
 
 class CockroachDBEngine:
     """Manages async SQLAlchemy engine for CockroachDB with retry support."""
@@ -21,6 +174,7 @@ class CockroachDBEngine:
         retry_max_backoff: float = 10.0,
         retry_backoff_multiplier: float = 2.0,
         retry_jitter: bool = True,
+        binary_vectors: bool = False,
     ):
         """Initialize with existing async engine.
 
@@ -31,14 +185,29 @@ class CockroachDBEngine:
             retry_max_backoff: Maximum backoff delay in seconds (default: 10.0)
             retry_backoff_multiplier: Backoff multiplier (default: 2.0)
             retry_jitter: Add randomization to backoff (default: True)
+            binary_vectors: Register a VECTOR codec on new connections so
+                embeddings are sent as packed float32 in the binary protocol
+                instead of decimal text, and stored vectors are returned as
+                float32 NumPy arrays (default: False)
         """
+        if binary_vectors:
+            _register_vector_codec(engine)
+
         self._engine = engine
-        self._loop: asyncio.AbstractEventLoop | None = None
+        self.binary_vectors = binary_vectors
         self.retry_max_attempts = retry_max_attempts
         self.retry_initial_backoff = retry_initial_backoff
         self.retry_max_backoff = retry_max_backoff
         self.retry_backoff_multiplier = retry_backoff_multiplier
         self.retry_jitter = retry_jitter
+        # Wrap once; the retry settings are fixed for the engine's lifetime
+        self._aexecute_ddl_with_retry = async_retry_with_backoff(
+            max_retries=retry_max_attempts,
+            initial_backoff=retry_initial_backoff,
+            max_backoff=retry_max_backoff,
+            backoff_multiplier=retry_backoff_multiplier,
+            jitter=retry_jitter,
+        )(self._aexecute_ddl)
 
     @classmethod
     def from_connection_string(
@@ -50,11 +219,14 @@ class CockroachDBEngine:
         pool_pre_ping: bool = True,
         pool_recycle: int = 3600,
         pool_timeout: float = 30.0,
+        pool_use_lifo: bool = True,
+        concurrency_hint: int | None = None,
         retry_max_attempts: int = 5,
         retry_initial_backoff: float = 0.1,
         retry_max_backoff: float = 10.0,
         retry_backoff_multiplier: float = 2.0,
         retry_jitter: bool = True,
+        binary_vectors: bool = False,
         **kwargs: Any,
     ) -> "CockroachDBEngine":
         """Create engine from connection string.
@@ -66,15 +238,30 @@ class CockroachDBEngine:
             pool_pre_ping: Enable connection health checks (default: True)
             pool_recycle: Recycle connections after N seconds (default: 3600)
             pool_timeout: Connection timeout in seconds (default: 30.0)
+            pool_use_lifo: Hand out the most recently returned connection first,
+                so a few warm connections (with their prepared statements)
+                serve light traffic and idle extras get recycled (default: True)
+            concurrency_hint: Expected number of concurrent operations. Raises
+                pool_size to at least this and sets max_overflow to it, so
+                concurrent coroutines don't queue behind the pool. Keep the
+                total within the cluster's per-gateway connection limits
+                (default: None, use pool_size and max_overflow as given)
             retry_max_attempts: Maximum retry attempts (default: 5)
             retry_initial_backoff: Initial backoff delay in seconds (default: 0.1)
             retry_max_backoff: Maximum backoff delay in seconds (default: 10.0)
             retry_backoff_multiplier: Backoff multiplier (default: 2.0)
             retry_jitter: Add randomization to backoff (default: True)
-            **kwargs: Additional arguments for create_async_engine
+            binary_vectors: Send embeddings in the binary protocol
+                (default: False)
+            **kwargs: Additional arguments for create_async_engine. JSONB
+                columns are decoded with orjson when it is installed unless
+                ``json_deserializer`` is given.
 
         Returns:
             CockroachDBEngine instance
+
+        Raises:
+            ValueError: If concurrency_hint is not positive
         """
         # Ensure we use the async driver (psycopg, not psycopg2)
         if connection_string.startswith("cockroachdb://"):
@@ -82,6 +269,13 @@ class CockroachDBEngine:
                 "cockroachdb://", "cockroachdb+psycopg://", 1
             )
 
+        if concurrency_hint is not None:
+            if concurrency_hint <= 0:
+                raise ValueError("concurrency_hint must be positive")
+            pool_size = max(pool_size, concurrency_hint)
+            max_overflow = concurrency_hint
+
+        kwargs.setdefault("json_deserializer", json_loads)
         engine = create_async_engine(
             connection_string,
             pool_size=pool_size,
@@ -89,6 +283,7 @@ class CockroachDBEngine:
             pool_pre_ping=pool_pre_ping,
             pool_recycle=pool_recycle,
             pool_timeout=pool_timeout,
+            pool_use_lifo=pool_use_lifo,
             **kwargs,
         )
         return cls(
@@ -98,42 +293,33 @@ class CockroachDBEngine:
             retry_max_backoff=retry_max_backoff,
             retry_backoff_multiplier=retry_backoff_multiplier,
             retry_jitter=retry_jitter,
+            binary_vectors=binary_vectors,
         )
 
     @classmethod
-    def from_engine(cls, engine: AsyncEngine) -> "CockroachDBEngine":
+    def from_engine(
+        cls, engine: AsyncEngine, *, binary_vectors: bool = False
+    ) -> "CockroachDBEngine":
         """Create from existing AsyncEngine.
 
         Args:
             engine: SQLAlchemy AsyncEngine
+            binary_vectors: Send embeddings in the binary protocol
+                (applies to connections opened after this call; default: False)
 
         Returns:
             CockroachDBEngine instance
         """
-        return cls(engine)
+        return cls(engine, binary_vectors=binary_vectors)
 
     @property
     def engine(self) -> AsyncEngine:
         """Get underlying AsyncEngine."""
         return self._engine
 
-    def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get or create event loop for sync operations."""
-        if self._loop is None or self._loop.is_closed():
-            try:
-                self._loop = asyncio.get_running_loop()
-            except RuntimeError:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-        return self._loop
-
     def _run_async(self, coro: Any) -> Any:
-        """Run async coroutine from sync context."""
-        loop = self._get_loop()
-        try:
-            loop.run_until_complete(coro)
-        except RuntimeError:
-            return asyncio.run(coro)
+        """Run async coroutine from sync context on the shared background loop."""
+        return run_sync(coro)
 
     async def ainit_vectorstore_table(
         self,
@@ -147,10 +333,15 @@ class CockroachDBEngine:
         metadata_column: str = "metadata",
         create_tsvector: bool = False,
         drop_if_exists: bool = False,
+        truncate_if_exists: bool = False,
+        quantization: QuantizationType = QuantizationType.NONE,
     ) -> None:
         """Create vector store table with optional full-text search.
 
-        Uses retry logic configured on engine instance.
+        Uses retry logic configured on engine instance. Unless
+        ``drop_if_exists`` is set, the catalog is checked first, and a table
+        that already has every requested column and index is left alone, so
+        re-initializing costs one query instead of a schema change.
 
         Args:
             table_name: Name of the table to create
@@ -162,50 +353,80 @@ class CockroachDBEngine:
             metadata_column: Name of metadata column
             create_tsvector: Create TSVECTOR column for FTS
             drop_if_exists: Drop table if it exists
+            truncate_if_exists: Keep an existing table and its indexes but
+                delete all rows. Much cheaper than drop_if_exists for reruns,
+                but the existing vector dimension is kept.
+            quantization: Add sidecar columns for quantized embeddings
+                (int8 adds {embedding_column}_int8 BYTES,
+                {embedding_column}_scale FLOAT4 and {embedding_column}_norm FLOAT4)
+
+        Raises:
+            ValueError: If both drop_if_exists and truncate_if_exists are set
         """
+        if drop_if_exists and truncate_if_exists:
+            raise ValueError("drop_if_exists and truncate_if_exists are mutually exclusive")
+
+        fqn = f"{schema}.{table_name}"
+        statements = _vectorstore_table_ddl(
+            fqn,
+            table_name,
+            vector_dimension=vector_dimension,
+            id_type=id_type,
+            content_column=content_column,
+            embedding_column=embedding_column,
+            metadata_column=metadata_column,
+            create_tsvector=create_tsvector,
+            quantization=QuantizationType(quantization),
+        )
+        lookup = None
+        required: frozenset[str] = frozenset()
+        if drop_if_exists:
+            statements = (text(f"DROP TABLE IF EXISTS {fqn}"), *statements)
+        else:
+            lookup = _TABLE_OBJECTS_SQL.bindparams(schema=schema, table_name=table_name)
+            required = _vectorstore_table_objects(
+                table_name,
+                content_column=content_column,
+                embedding_column=embedding_column,
+                metadata_column=metadata_column,
+                create_tsvector=create_tsvector,
+                quantization=QuantizationType(quantization),
+            )
 
-        # Apply retry with instance configuration
-        @async_retry_with_backoff(
-            max_retries=self.retry_max_attempts,
-            initial_backoff=self.retry_initial_backoff,
-            max_backoff=self.retry_max_backoff,
-            backoff_multiplier=self.retry_backoff_multiplier,
-            jitter=self.retry_jitter,
+        await self._aexecute_ddl_with_retry(
+            statements,
+            text(f"TRUNCATE TABLE {fqn}") if truncate_if_exists else None,
+            lookup,
+            required,
         )
-        async def _create_table() -> None:
-            fqn = f"{schema}.{table_name}"
 
+    async def _aexecute_ddl(
+        self,
+        statements: Sequence[TextClause],
+        truncate: TextClause | None = None,
+        lookup: TextClause | None = None,
+        required: frozenset[str] = frozenset(),
+    ) -> None:
+        """Run DDL statements in one transaction, then an optional TRUNCATE.
+
+        The statements are sent as one semicolon-separated script, so they
+        cost a single round trip. ``no_parameters`` makes the driver send it
+        without bind parameters, which multi-statement strings require. If
+        ``lookup`` returns every name in ``required``, the DDL is skipped.
+        """
+        present: set[str] = set()
+        if lookup is not None:
+            async with self._engine.connect() as conn:
+                present = set((await conn.execute(lookup)).scalars())
+
+        if lookup is None or not required <= present:
+            script = ";\n".join(stmt.text for stmt in statements)
+            async with self._engine.begin() as conn:
+                await conn.exec_driver_sql(script, execution_options={"no_parameters": True})
+
+        if truncate is not None:
             async with self._engine.begin() as conn:
-                if drop_if_exists:
-                    await conn.execute(text(f"DROP TABLE IF EXISTS {fqn}"))
-
-                create_sql = f"""
-                    CREATE TABLE IF NOT EXISTS {fqn} (
-                        id {id_type} PRIMARY KEY DEFAULT gen_random_uuid(),
-                        {content_column} TEXT,
-                        {embedding_column} VECTOR({vector_dimension}),
-                        {metadata_column} JSONB DEFAULT '{{}}'::jsonb,
-                        created_at TIMESTAMPTZ DEFAULT now()
-                    )
-                """
-                await conn.execute(text(create_sql))
-
-                if create_tsvector:
-                    tsvector_col = f"{content_column}_tsvector"
-                    alter_sql = f"""
-                        ALTER TABLE {fqn} 
-                        ADD COLUMN IF NOT EXISTS {tsvector_col} TSVECTOR 
-                        GENERATED ALWAYS AS (to_tsvector('english', {content_column})) STORED
-                    """
-                    await conn.execute(text(alter_sql))
-
-                    index_sql = f"""
-                        CREATE INDEX IF NOT EXISTS {table_name}_{tsvector_col}_idx 
-                        ON {fqn} USING GIN ({tsvector_col})
-                    """
-                    await conn.execute(text(index_sql))
-
-        await _create_table()
+                await conn.execute(truncate)
 
     def init_vectorstore_table(
         self,
@@ -216,6 +437,38 @@ class CockroachDBEngine:
         """Sync wrapper for ainit_vectorstore_table."""
         self._run_async(self.ainit_vectorstore_table(table_name, vector_dimension, **kwargs))
 
+    async def awarmup(self, connections: int | None = None) -> int:
+        """Open pool connections ahead of the first real query.
+
+        Connections are established concurrently and returned to the pool, so
+        later operations skip connection setup (including TLS handshakes).
+
+        Args:
+            connections: Number of connections to open (default: the pool size)
+
+        Returns:
+            Number of connections opened
+        """
+        if connections is None:
+            pool_size = getattr(self._engine.pool, "size", None)
+            connections = pool_size() if callable(pool_size) else 1
+
+        results = await asyncio.gather(
+            *(self._engine.connect().start() for _ in range(connections)),
+            return_exceptions=True,
+        )
+        opened = [conn for conn in results if not isinstance(conn, BaseException)]
+        await asyncio.gather(*(conn.close() for conn in opened))
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return len(opened)
+
+    def warmup(self, connections: int | None = None) -> int:
+        """Sync wrapper for awarmup."""
+        return self._run_async(self.awarmup(connections))  # type: ignore[no-any-return]
+
     async def aclose(self) -> None:
         """Close async engine."""
         await self._engine.dispose()
@@ -0,0 +1,122 @@
+"""Metadata filter compilation to parameterized SQL."""
+
+import itertools
+import json
+from collections.abc import Hashable, Iterator
+from functools import lru_cache
+from typing import Any
+
+_COMPARISON_OPERATORS = {
+    "$eq": "=",
+    "$ne": "!=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
+_NUMERIC_OPERATORS = frozenset({"$gt", "$gte", "$lt", "$lte"})
+_LIST_OPERATORS = {"$in": "IN", "$nin": "NOT IN"}
+
+
+def compile_filter(
+    filter: dict,
+    metadata_column: str = "metadata",
+    prefix: str = "f",
+) -> tuple[str, dict[str, Any]]:
+    """Compile a metadata filter into a SQL condition and bind parameters.
+
+    Neither metadata keys nor values are inlined; they are returned as
+    parameters named ``{prefix}_0``, ``{prefix}_1``, ... The SQL text depends
+    only on the filter's shape (nesting, operators and list lengths), so it is
+    rendered once per shape and reused, and the database sees the same
+    statement text for filters that differ only in keys or values.
+
+    Supports operators: $and, $or, $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin
+
+    Args:
+        filter: Metadata filter dictionary
+        metadata_column: Name of the JSONB metadata column
+        prefix: Prefix for bind parameter names
+
+    Returns:
+        Tuple of (SQL condition, bind parameters)
+    """
+    values: list[Any] = []
+    shape = _filter_shape(filter, values)
+    sql = _render_filter(shape, metadata_column, prefix)
+    return sql, {f"{prefix}_{i}": value for i, value in enumerate(values)}
+
+
+def _filter_shape(filter: dict, values: list[Any]) -> Hashable:
+    """Reduce a filter to a hashable shape, appending its values in order."""
+    if "$and" in filter:
+        return ("AND", tuple(_filter_shape(f, values) for f in filter["$and"]))
+
+    if "$or" in filter:
+        return ("OR", tuple(_filter_shape(f, values) for f in filter["$or"]))
+
+    leaves = []
+    for key, value in filter.items():
+        if isinstance(value, dict):
+            for op, op_value in value.items():
+                leaves.append(_operator_shape(key, op, op_value, values))
+        else:
+            leaves.append(_operator_shape(key, "$eq", value, values))
+
+    return ("LEAVES", tuple(leaves))
+
+
+def _operator_shape(key: str, op: str, value: Any, values: list[Any]) -> Hashable:
+    """Shape of a single key/operator condition; the key is bound first."""
+    if op in _NUMERIC_OPERATORS:
+        values.extend((str(key), value))
+        return (op, 1)
+
+    if op in _COMPARISON_OPERATORS:
+        values.extend((str(key), json.dumps(value)))
+        return (op, 1)
+
+    if op in _LIST_OPERATORS:
+        if value:
+            values.append(str(key))
+            values.extend(json.dumps(v) for v in value)
+        return (op, len(value))
+
+    raise ValueError(f"Unsupported operator: {op}")
+
+
+@lru_cache(maxsize=256)
+def _render_filter(shape: Hashable, metadata_column: str, prefix: str) -> str:
+    """Render the SQL template for a filter shape."""
+    return _render_node(shape, metadata_column, prefix, itertools.count())
+
+
+def _render_node(node: Any, metadata_column: str, prefix: str, counter: Iterator[int]) -> str:
+    """Render one shape node, numbering parameters in traversal order."""
+    kind, children = node
+
+    if kind in ("AND", "OR"):
+        clauses = [_render_node(child, metadata_column, prefix, counter) for child in children]
+        return "(" + f" {kind} ".join(clauses) + ")"
+
+    clauses = []
+    for op, count in children:
+        if count == 0:
+            # Nothing is IN an empty list; everything is NOT IN it
+            clauses.append("false" if op == "$in" else "true")
+            continue
+
+        col = f"{metadata_column}->CAST(:{prefix}_{next(counter)} AS STRING)"
+        if op in _NUMERIC_OPERATORS:
+            param = f"{prefix}_{next(counter)}"
+            clauses.append(
+                f"CAST({col} AS NUMERIC) {_COMPARISON_OPERATORS[op]} CAST(:{param} AS NUMERIC)"
+            )
+        elif op in _COMPARISON_OPERATORS:
+            param = f"{prefix}_{next(counter)}"
+            clauses.append(f"{col} {_COMPARISON_OPERATORS[op]} CAST(:{param} AS JSONB)")
+        else:
+            params = ", ".join(f"CAST(:{prefix}_{next(counter)} AS JSONB)" for _ in range(count))
+            clauses.append(f"{col} {_LIST_OPERATORS[op]} ({params})")
+
+    return " AND ".join(clauses) if clauses else "true"
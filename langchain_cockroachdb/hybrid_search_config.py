@@ -1,6 +1,11 @@
 """Hybrid search configuration for combining FTS and vector search."""
 
+import heapq
 from enum import Enum
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
 
 
 class FusionType(str, Enum):
@@ -13,6 +18,8 @@ class FusionType(str, Enum):
 class HybridSearchConfig:
     """Configuration for hybrid full-text + vector search."""
 
+    __slots__ = ("fts_weight", "vector_weight", "fusion_type", "fts_query_language", "k")
+
     def __init__(
         self,
         fts_weight: float = 0.5,
@@ -43,63 +50,203 @@ class HybridSearchConfig:
         self,
         fts_results: list[tuple[str, float]],
         vector_results: list[tuple[str, float]],
+        limit: int | None = None,
     ) -> list[tuple[str, float]]:
         """Fuse FTS and vector search results.
 
         Args:
             fts_results: List of (id, score) from FTS
             vector_results: List of (id, score) from vector search
+            limit: Keep only the top ``limit`` fused results, selected
+                without sorting the rest
 
         Returns:
             Fused list of (id, score) sorted by final score
         """
+        if not fts_results or not vector_results:
+            # Nothing to align when a side is empty
+            if fts_results:
+                return self._fuse_one_side(fts_results, self.fts_weight, limit)
+            return self._fuse_one_side(vector_results, self.vector_weight, limit)
+
+        ids, scores = self.fuse_scores_soa(
+            np.array([doc_id for doc_id, _ in fts_results], dtype=object),
+            np.array([score for _, score in fts_results], dtype=np.float64),
+            np.array([doc_id for doc_id, _ in vector_results], dtype=object),
+            np.array([score for _, score in vector_results], dtype=np.float64),
+            limit=limit,
+        )
+        return list(zip(ids.tolist(), scores.tolist(), strict=True))
+
+    def _fuse_one_side(
+        self, results: list[tuple[str, float]], weight: float, limit: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Fuse results from one search, the other having returned nothing.
+
+        Matches ``fuse_scores_soa``: a repeated id keeps its first position
+        and its last score, and ties keep first-seen order.
+        """
+        fused: dict[str, float] = {}
         if self.fusion_type == FusionType.WEIGHTED_SUM:
-            return self._weighted_sum_fusion(fts_results, vector_results)
+            for doc_id, score in results:
+                fused[doc_id] = weight * float(score)
         elif self.fusion_type == FusionType.RRF:
-            return self._rrf_fusion(fts_results, vector_results)
+            for rank, (doc_id, _) in enumerate(results, 1):
+                fused[doc_id] = weight / (self.k + rank)
         else:
             raise ValueError(f"Unknown fusion type: {self.fusion_type}")
+        if limit is not None and 0 < limit < len(fused):
+            # Same result as the sorted slice, including tie order
+            return heapq.nlargest(limit, fused.items(), key=itemgetter(1))
+        return sorted(fused.items(), key=itemgetter(1), reverse=True)[:limit]
 
-    def _weighted_sum_fusion(
+    def fuse_scores_soa(
         self,
-        fts_results: list[tuple[str, float]],
-        vector_results: list[tuple[str, float]],
-    ) -> list[tuple[str, float]]:
-        """Combine scores using weighted sum."""
-        fts_dict = dict(fts_results)
-        vector_dict = dict(vector_results)
-        all_ids = set(fts_dict.keys()) | set(vector_dict.keys())
+        fts_ids: np.ndarray,
+        fts_scores: np.ndarray,
+        vector_ids: np.ndarray,
+        vector_scores: np.ndarray,
+        limit: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Fuse FTS and vector results given as parallel id and score arrays.
+
+        Same result as ``fuse_scores`` without building (id, score) tuples,
+        for callers that already hold results as NumPy arrays. Ids are
+        aligned with ``np.unique``; ties keep first-seen order, FTS first.
+
+        Args:
+            fts_ids: FTS result ids, best first
+            fts_scores: FTS scores, aligned with ``fts_ids``
+            vector_ids: Vector search result ids, best first
+            vector_scores: Vector scores, aligned with ``vector_ids``
+            limit: Keep only the top ``limit`` fused results
+
+        Returns:
+            Tuple of (ids, fused scores) sorted by descending fused score
+        """
+        # Each list's weighted contribution is computed before alignment, so
+        # ids missing from a list contribute 0 and fusion is a single add
+        if self.fusion_type == FusionType.WEIGHTED_SUM:
+            fts_values = self.fts_weight * np.asarray(fts_scores, dtype=np.float64)
+            vector_values = self.vector_weight * np.asarray(vector_scores, dtype=np.float64)
+        elif self.fusion_type == FusionType.RRF:
+            # k + rank for every rank either list reaches, shared by both lists
+            denominators = self.k + np.arange(
+                1, max(len(fts_ids), len(vector_ids)) + 1, dtype=np.float64
+            )
+            fts_values = self.fts_weight / denominators[: len(fts_ids)]
+            vector_values = self.vector_weight / denominators[: len(vector_ids)]
+        else:
+            raise ValueError(f"Unknown fusion type: {self.fusion_type}")
 
-        combined = []
-        for doc_id in all_ids:
-            fts_score = fts_dict.get(doc_id, 0.0)
-            vector_score = vector_dict.get(doc_id, 0.0)
-            final_score = self.fts_weight * fts_score + self.vector_weight * vector_score
-            combined.append((doc_id, final_score))
+        ids, fts_array, vector_array = self._scatter(fts_ids, vector_ids, fts_values, vector_values)
+        combined = fts_array + vector_array
 
-        return sorted(combined, key=lambda x: x[1], reverse=True)
+        order = _top_order(combined, limit)
+        return ids[order], combined[order]
 
-    def _rrf_fusion(
+    def build_fusion_sql(
         self,
-        fts_results: list[tuple[str, float]],
-        vector_results: list[tuple[str, float]],
-    ) -> list[tuple[str, float]]:
-        """Combine scores using Reciprocal Rank Fusion."""
-        fts_ranks = {doc_id: rank for rank, (doc_id, _) in enumerate(fts_results, 1)}
-        vector_ranks = {doc_id: rank for rank, (doc_id, _) in enumerate(vector_results, 1)}
-        all_ids = set(fts_ranks.keys()) | set(vector_ranks.keys())
-
-        combined = []
-        for doc_id in all_ids:
-            fts_rank = fts_ranks.get(doc_id, 0)
-            vector_rank = vector_ranks.get(doc_id, 0)
+        fts_sql: str,
+        vector_sql: str,
+        limit: int,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build one statement that runs both searches and fuses them server-side.
+
+        Both subqueries must select ``id`` and ``score`` columns, with higher
+        scores ranking better (for vector search, a similarity such as
+        ``1 - distance``). Their results are joined with FULL OUTER JOIN and
+        fused with the configured strategy, so only the top ``limit`` fused rows
+        are returned, in one round trip. Weights, k and limit are bind
+        parameters; merge the subqueries' own parameters into the returned
+        dict before executing.
 
-            rrf_score = 0.0
-            if fts_rank > 0:
-                rrf_score += self.fts_weight / (self.k + fts_rank)
-            if vector_rank > 0:
-                rrf_score += self.vector_weight / (self.k + vector_rank)
+        Args:
+            fts_sql: Full-text search query selecting ``id, score``
+            vector_sql: Vector search query selecting ``id, score``
+            limit: Number of fused results to return
 
-            combined.append((doc_id, rrf_score))
+        Returns:
+            Tuple of (SQL selecting ``id, score`` by descending fused score,
+            bind parameters)
+        """
+        if self.fusion_type == FusionType.WEIGHTED_SUM:
+            score = (
+                "CAST(:fusion_fts_weight AS FLOAT8) * COALESCE(CAST(f.score AS FLOAT8), 0) + "
+                "CAST(:fusion_vector_weight AS FLOAT8) * COALESCE(CAST(v.score AS FLOAT8), 0)"
+            )
+        elif self.fusion_type == FusionType.RRF:
+            # Ids missing from one side have a NULL rank and contribute 0
+            score = (
+                "COALESCE(CAST(:fusion_fts_weight AS FLOAT8) / "
+                "(CAST(:fusion_k AS FLOAT8) + CAST(f.rank AS FLOAT8)), 0) + "
+                "COALESCE(CAST(:fusion_vector_weight AS FLOAT8) / "
+                "(CAST(:fusion_k AS FLOAT8) + CAST(v.rank AS FLOAT8)), 0)"
+            )
+        else:
+            raise ValueError(f"Unknown fusion type: {self.fusion_type}")
 
-        return sorted(combined, key=lambda x: x[1], reverse=True)
+        sql = f"""
+            WITH fts AS ({fts_sql}),
+            vec AS ({vector_sql}),
+            fts_ranked AS (
+                SELECT id, score, ROW_NUMBER() OVER (ORDER BY score DESC) AS rank FROM fts
+            ),
+            vec_ranked AS (
+                SELECT id, score, ROW_NUMBER() OVER (ORDER BY score DESC) AS rank FROM vec
+            )
+            SELECT COALESCE(f.id, v.id) AS id, {score} AS score
+            FROM fts_ranked AS f
+            FULL OUTER JOIN vec_ranked AS v ON f.id = v.id
+            ORDER BY score DESC
+            LIMIT :fusion_limit
+        """
+        params: dict[str, Any] = {
+            "fusion_fts_weight": self.fts_weight,
+            "fusion_vector_weight": self.vector_weight,
+            "fusion_limit": limit,
+        }
+        if self.fusion_type == FusionType.RRF:
+            params["fusion_k"] = self.k
+        return sql, params
+
+    @staticmethod
+    def _scatter(
+        fts_ids: np.ndarray,
+        vector_ids: np.ndarray,
+        fts_values: np.ndarray,
+        vector_values: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Align per-result values on a shared id index (first-seen order).
+
+        Ids missing from one result list get 0 in that list's array.
+        """
+        all_ids = np.concatenate(
+            [np.asarray(fts_ids, dtype=object), np.asarray(vector_ids, dtype=object)]
+        )
+        unique_ids, first_seen, inverse = np.unique(all_ids, return_index=True, return_inverse=True)
+        # np.unique sorts; relabel so the index follows first appearance
+        order = np.argsort(first_seen, kind="stable")
+        relabel = np.empty_like(order)
+        relabel[order] = np.arange(len(order))
+        inverse = relabel[inverse.reshape(-1)]
+
+        n_fts = len(fts_values)
+        fts_array = np.zeros(len(order))
+        vector_array = np.zeros(len(order))
+        fts_array[inverse[:n_fts]] = fts_values
+        vector_array[inverse[n_fts:]] = vector_values
+        return unique_ids[order], fts_array, vector_array
+
+
+def _top_order(scores: np.ndarray, limit: int | None) -> np.ndarray:
+    """Indices of the top ``limit`` scores, best first; ties keep index order.
+
+    Same as a stable descending argsort cut to ``limit``, but only the
+    scores tied with or above the ``limit``-th best are sorted.
+    """
+    if limit is None or not 0 < limit < len(scores):
+        return np.argsort(-scores, kind="stable")[:limit]
+    threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+    candidates = np.flatnonzero(scores >= threshold)
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:limit]
@@ -2,6 +2,20 @@
 
 from enum import Enum
 
+# Distance strategy value -> SQL operator / index operator class. Members are
+# str subclasses that hash and compare like their values, so they index these
+# tables directly.
+_OPERATORS = {
+    "l2": "<->",
+    "cosine": "<=>",
+    "ip": "<#>",
+}
+_OPCLASSES = {
+    "l2": "vector_l2_ops",
+    "cosine": "vector_cosine_ops",
+    "ip": "vector_ip_ops",
+}
+
 
 class DistanceStrategy(str, Enum):
     """Distance strategies for vector similarity."""
@@ -12,19 +26,11 @@ class DistanceStrategy(str, Enum):
 
     def get_operator(self) -> str:
         """Get SQL operator for distance calculation."""
-        return {
-            "l2": "<->",
-            "cosine": "<=>",
-            "ip": "<#>",
-        }[self.value]
+        return _OPERATORS[self]
 
     def get_opclass(self) -> str:
         """Get index operator class."""
-        return {
-            "l2": "vector_l2_ops",
-            "cosine": "vector_cosine_ops",
-            "ip": "vector_ip_ops",
-        }[self.value]
+        return _OPCLASSES[self]
 
 
 class CSPANNIndex:
@@ -35,6 +41,8 @@ class CSPANNIndex:
     Based on Microsoft's SPANN (Space Partition with Approximate Nearest Neighbor).
     """
 
+    __slots__ = ("distance_strategy", "min_partition_size", "max_partition_size", "name")
+
     def __init__(
         self,
         distance_strategy: DistanceStrategy = DistanceStrategy.COSINE,
@@ -79,7 +87,7 @@ class CSPANNIndex:
 
         columns = ", ".join(prefix_columns + [column_name]) if prefix_columns else column_name
 
-        sql = f"CREATE VECTOR INDEX IF NOT EXISTS {index_name} ON {fqn} ({columns})"
+        parts = ["CREATE VECTOR INDEX IF NOT EXISTS", index_name, "ON", fqn, f"({columns})"]
 
         with_clauses = []
         if self.min_partition_size is not None:
@@ -88,9 +96,9 @@ class CSPANNIndex:
             with_clauses.append(f"max_partition_size = {self.max_partition_size}")
 
         if with_clauses:
-            sql += f" WITH ({', '.join(with_clauses)})"
+            parts.append(f"WITH ({', '.join(with_clauses)})")
 
-        return sql
+        return " ".join(parts)
 
     def get_drop_index_sql(
         self,
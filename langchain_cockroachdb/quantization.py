@@ -0,0 +1,103 @@
+"""Scalar quantization helpers for stored embeddings."""
+
+from collections.abc import Sequence
+from enum import Enum
+
+import numpy as np
+
+from langchain_cockroachdb.indexes import DistanceStrategy
+
+
+class QuantizationType(str, Enum):
+    """Quantization modes for the client-side embedding sidecar columns."""
+
+    NONE = "none"
+    INT8 = "int8"
+
+
+def quantize_int8(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize float vectors to int8 with a symmetric per-vector scale.
+
+    Each vector is divided by ``max(|v|) / 127`` and rounded, so
+    ``codes * scales[:, None]`` approximates the input.
+
+    Args:
+        vectors: Array of shape (n, dim) or (dim,)
+
+    Returns:
+        Tuple of int8 codes with the input's shape and float32 scales of
+        shape (n,) (or a 0-d array for a single vector)
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    max_abs = np.abs(vectors).max(axis=-1)
+    scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales[..., None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+def dequantize_int8(
+    codes: np.ndarray, scales: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Reconstruct float32 vectors from int8 codes and per-vector scales.
+
+    Args:
+        codes: int8 codes of shape (n, dim) or (dim,)
+        scales: Scales of shape (n,) or a scalar
+        out: Optional float32 array with the shape of ``codes`` to write into,
+            which avoids allocating the result and an intermediate copy
+
+    Returns:
+        Approximate float32 vectors with the shape of ``codes``
+    """
+    scales = np.asarray(scales, dtype=np.float32)
+    if out is None:
+        out = np.empty(codes.shape, dtype=np.float32)
+    vectors: np.ndarray = np.multiply(codes, scales[..., None], out=out)
+    return vectors
+
+
+def int8_distances(
+    query: Sequence[float] | np.ndarray,
+    codes: np.ndarray,
+    scales: np.ndarray,
+    norms: np.ndarray,
+    distance_strategy: DistanceStrategy,
+) -> np.ndarray:
+    """Approximate distances from a query to int8-quantized vectors.
+
+    The query is quantized too, so the dot products run on integers
+    (int8 codes widened to int32) and are then rescaled. L2 and cosine
+    distances use the stored float norms of the original vectors:
+    ``|a - b|^2 = |a|^2 + |b|^2 - 2 a.b``.
+
+    Args:
+        query: Query vector of shape (dim,)
+        codes: int8 codes of shape (n, dim)
+        scales: Per-vector scales of shape (n,)
+        norms: L2 norms of the original vectors, shape (n,)
+        distance_strategy: Distance to compute, matching the SQL operators
+            (L2 distance, cosine distance, or negative inner product)
+
+    Returns:
+        float32 distances of shape (n,), smaller is closer
+    """
+    query_vector = np.asarray(query, dtype=np.float32)
+    query_codes, query_scale = quantize_int8(query_vector)
+    dots = (codes.astype(np.int32) @ query_codes.astype(np.int32)).astype(np.float32)
+    dots *= np.asarray(scales, dtype=np.float32) * query_scale
+
+    if distance_strategy == DistanceStrategy.INNER_PRODUCT:
+        return -dots
+
+    norms = np.asarray(norms, dtype=np.float32)
+    query_norm = np.float32(np.linalg.norm(query_vector))
+    if distance_strategy == DistanceStrategy.EUCLIDEAN:
+        squared = norms**2 + query_norm**2 - 2 * dots
+        euclidean: np.ndarray = np.sqrt(np.maximum(squared, 0))
+        return euclidean
+
+    denominator = norms * query_norm
+    cosine: np.ndarray = 1 - np.divide(
+        dots, denominator, out=np.zeros_like(dots), where=denominator > 0
+    )
+    return cosine
@@ -0,0 +1,117 @@
+"""In-process LRU cache for vector search results."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+
+class QueryCache:
+    """Thread-safe LRU cache with per-entry TTL for search results.
+
+    Keys are built from the query embedding (rounded so that tiny float
+    differences map to the same entry), the metadata filter, k, and any
+    extra hashable search options.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float | None = 300.0,
+        precision: int = 8,
+    ):
+        """Initialize query cache.
+
+        Args:
+            max_size: Maximum number of cached queries
+            ttl: Seconds before an entry expires (None for no expiry)
+            precision: Decimal places embeddings are rounded to for keys
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.precision = precision
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def make_key(
+        self,
+        embedding: Sequence[float],
+        filter: dict | None,
+        k: int,
+        *extra: Hashable,
+    ) -> Hashable:
+        """Build a cache key for a search.
+
+        Args:
+            embedding: Query embedding vector
+            filter: Metadata filter
+            k: Number of results
+            *extra: Additional hashable search options
+
+        Returns:
+            Hashable cache key
+        """
+        filter_key = json.dumps(filter, sort_keys=True, default=str) if filter else None
+        return (
+            tuple(round(float(x), self.precision) for x in embedding),
+            filter_key,
+            k,
+            extra,
+        )
+
+    def get(self, key: Hashable, record_miss: bool = True) -> Any | None:
+        """Return the cached value for key, or None on a miss or expiry.
+
+        Args:
+            key: Cache key from make_key
+            record_miss: Count a miss in the stats; pass False for a
+                speculative lookup that is followed by a regular one
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += record_miss
+                return None
+
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._misses += record_miss
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries (hit/miss counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
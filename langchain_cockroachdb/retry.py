@@ -9,8 +9,11 @@ Based on CockroachDB best practices and patterns from crdb-dump project.
 """
 
 import asyncio
+import contextlib
 import logging
 import random
+import re
+import time
 from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import Any, TypeVar
@@ -20,37 +23,111 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# PostgreSQL/CockroachDB transient error patterns
+_TRANSIENT_PATTERNS = (
+    "restart transaction",
+    "serialization failure",
+    "connection",
+    "timeout",
+    "closed",
+    "broken pipe",
+    "connection reset",
+    "too many clients",
+    "server closed",
+    "query_wait",
+)
+# Patterns are lowercase and matched against the lowercased message head
+_TRANSIENT_RE = re.compile("|".join(map(re.escape, _TRANSIENT_PATTERNS)))
+
+# SQLSTATEs worth retrying: serialization failure, ambiguous commit, too many
+# connections and server shutdown/startup. Class 08 (connection exception)
+# is matched by prefix.
+_RETRYABLE_SQLSTATES = frozenset({"40001", "40003", "53300", "57P01", "57P02", "57P03"})
+_CONNECTION_SQLSTATE_CLASS = "08"
+
+# Connection-level error classes (DB-API, and SQLAlchemy's closed-resource
+# error), retried by name without formatting the message. Only consulted when
+# the error has no SQLSTATE: psycopg also raises non-transient errors such as
+# QueryCanceled (57014) and DiskFull (53100) as OperationalError subclasses.
+_CONNECTION_ERROR_NAMES = frozenset({"OperationalError", "InterfaceError", "ResourceClosedError"})
+
+# Driver messages lead with the error text; SQLAlchemy appends SQL and parameters
+_MESSAGE_HEAD_CHARS = 512
+
+# Attribute caching the verdict on an exception seen by nested retry wrappers
+_VERDICT_ATTR = "_cockroach_retryable"
+
+
+def _sqlstate(error: BaseException) -> str | None:
+    """SQLSTATE of a driver error, also when wrapped by SQLAlchemy."""
+    for candidate in (error, getattr(error, "orig", None)):
+        if candidate is None:
+            continue
+        # psycopg 3 exposes sqlstate; psycopg2 exposes pgcode
+        code = getattr(candidate, "sqlstate", None) or getattr(candidate, "pgcode", None)
+        if code:
+            return str(code)
+    return None
+
+
 def is_retryable_error(error: Exception) -> bool:
     """Check if error is transient and should be retried.
 
+    When the error (or the driver error it wraps) has a SQLSTATE, it alone
+    decides. Without one, the error is retried if it is a DB-API
+    ``OperationalError`` or ``InterfaceError``, or SQLAlchemy's
+    ``ResourceClosedError``, such as for a dropped connection. Otherwise
+    the lowercased head of the message is matched against all transient
+    patterns with one precompiled regex. The verdict is
+    stored on the exception, so an error passing through nested retry
+    wrappers is classified once.
+
     Args:
         error: Exception to check
 
     Returns:
         True if error should be retried
     """
-    error_str = str(error).lower()
-    error_code = getattr(error, "pgcode", None)
-
-    # CockroachDB serialization failure (40001)
-    if error_code == "40001":
-        return True
-
-    # PostgreSQL/CockroachDB transient error patterns
-    transient_patterns = [
-        "restart transaction",
-        "serialization failure",
-        "connection",
-        "timeout",
-        "closed",
-        "broken pipe",
-        "connection reset",
-        "too many clients",
-        "server closed",
-        "query_wait",
-    ]
-
-    return any(pattern in error_str for pattern in transient_patterns)
+    verdict = getattr(error, _VERDICT_ATTR, None)
+    if verdict is None:
+        verdict = _classify(error)
+        # Some exception types don't accept new attributes
+        with contextlib.suppress(AttributeError, TypeError):
+            setattr(error, _VERDICT_ATTR, verdict)
+    return verdict
+
+
+def _classify(error: Exception) -> bool:
+    """Retry verdict for an exception not classified before."""
+    sqlstate = _sqlstate(error)
+    if sqlstate is not None:
+        return sqlstate in _RETRYABLE_SQLSTATES or sqlstate.startswith(_CONNECTION_SQLSTATE_CLASS)
+
+    orig = getattr(error, "orig", None)
+    for candidate in (error, orig):
+        if type(candidate).__name__ in _CONNECTION_ERROR_NAMES:
+            return True
+
+    # A wrapped driver error carries the message; formatting the SQLAlchemy
+    # wrapper would also render the statement and its parameters
+    message = str(orig if orig is not None else error)
+    return _TRANSIENT_RE.search(message[:_MESSAGE_HEAD_CHARS].lower()) is not None
+
+
+def _backoff_delays(
+    max_retries: int, initial_backoff: float, max_backoff: float, backoff_multiplier: float
+) -> tuple[float, ...]:
+    """Delay before each retry (before jitter), computed once per decorator.
+
+    The first delay is ``initial_backoff``; each later one is multiplied by
+    ``backoff_multiplier`` and capped at ``max_backoff``.
+    """
+    delays = []
+    backoff = initial_backoff
+    for _ in range(max_retries - 1):
+        delays.append(backoff)
+        backoff = min(backoff * backoff_multiplier, max_backoff)
+    return tuple(delays)
 
 
 def async_retry_with_backoff(
@@ -85,10 +162,11 @@ def async_retry_with_backoff(
         ```
     """
 
+    delays = _backoff_delays(max_retries, initial_backoff, max_backoff, backoff_multiplier)
+
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            backoff = initial_backoff
             last_exception: Exception | None = None
 
             for attempt in range(max_retries):
@@ -111,6 +189,7 @@ def async_retry_with_backoff(
                         raise
 
                     # Calculate backoff with optional jitter (add 0-50% randomization)
+                    backoff = delays[attempt]
                     actual_backoff = backoff * (0.5 + random.random() * 0.5) if jitter else backoff
 
                     logger.warning(
@@ -121,9 +200,6 @@ def async_retry_with_backoff(
                     # Sleep before retry
                     await asyncio.sleep(actual_backoff)
 
-                    # Exponential backoff for next iteration
-                    backoff = min(backoff * backoff_multiplier, max_backoff)
-
             # Should never reach here, but just in case
             if last_exception:
                 raise last_exception
@@ -156,12 +232,11 @@ def sync_retry_with_backoff(
         Decorated function with retry logic
     """
 
+    delays = _backoff_delays(max_retries, initial_backoff, max_backoff, backoff_multiplier)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            import time
-
-            backoff = initial_backoff
             last_exception: Exception | None = None
 
             for attempt in range(max_retries):
@@ -180,6 +255,7 @@ def sync_retry_with_backoff(
                         )
                         raise
 
+                    backoff = delays[attempt]
                     actual_backoff = backoff * (0.5 + random.random() * 0.5) if jitter else backoff
 
                     logger.warning(
@@ -188,7 +264,6 @@ def sync_retry_with_backoff(
                     )
 
                     time.sleep(actual_backoff)
-                    backoff = min(backoff * backoff_multiplier, max_backoff)
 
             if last_exception:
                 raise last_exception
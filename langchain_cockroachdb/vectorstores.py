@@ -1,12 +1,13 @@
 """Vector store implementations with sync/async support."""
 
-import asyncio
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+import numpy as np
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 
+from langchain_cockroachdb._loop import iterate_sync, run_sync
 from langchain_cockroachdb.async_vectorstore import AsyncCockroachDBVectorStore
 from langchain_cockroachdb.engine import CockroachDBEngine
 from langchain_cockroachdb.indexes import CSPANNQueryOptions
@@ -33,7 +34,32 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
         Returns:
             List of IDs
         """
-        return asyncio.run(self.aadd_texts(texts, metadatas=metadatas, ids=ids, **kwargs))
+        return run_sync(self.aadd_texts(texts, metadatas=metadatas, ids=ids, **kwargs))
+
+    def add_embeddings(
+        self,
+        texts: Iterable[str],
+        embeddings: list[list[float]] | np.ndarray,
+        metadatas: list[dict] | None = None,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Add texts with precomputed embeddings (sync).
+
+        Args:
+            texts: Texts to add
+            embeddings: Embedding vector for each text, as lists or one
+                ``(n, dim)`` array
+            metadatas: Optional metadata
+            ids: Optional IDs
+            **kwargs: Additional arguments
+
+        Returns:
+            List of IDs
+        """
+        return run_sync(
+            self.aadd_embeddings(texts, embeddings, metadatas=metadatas, ids=ids, **kwargs)
+        )
 
     def similarity_search(
         self,
@@ -53,7 +79,10 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
         Returns:
             List of documents
         """
-        return asyncio.run(self.asimilarity_search(query, k=k, filter=filter, **kwargs))
+        cached = self._cached_results(query, k, filter, kwargs.get("query_options"))
+        if cached is not None:
+            return [doc for doc, _ in cached]
+        return run_sync(self.asimilarity_search(query, k=k, filter=filter, **kwargs))
 
     def similarity_search_with_score(
         self,
@@ -75,12 +104,75 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
         Returns:
             List of (document, score) tuples
         """
-        return asyncio.run(
+        cached = self._cached_results(query, k, filter, query_options)
+        if cached is not None:
+            return cached
+        return run_sync(
             self.asimilarity_search_with_score(
                 query, k=k, filter=filter, query_options=query_options, **kwargs
             )
         )
 
+    def similarity_search_multi_filter(
+        self,
+        query: str,
+        filters: list[dict | None],
+        k: int = 4,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Search one query against several metadata filters (sync).
+
+        Args:
+            query: Query text
+            filters: Metadata filters, one per result list
+            k: Number of results per filter
+            **kwargs: Additional arguments
+
+        Returns:
+            One list of documents per filter
+        """
+        return run_sync(self.asimilarity_search_multi_filter(query, filters=filters, k=k, **kwargs))
+
+    def similarity_search_batch(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Search several queries in one round trip (sync).
+
+        Args:
+            queries: Query texts
+            k: Number of results per query
+            filter: Metadata filter applied to every query
+            **kwargs: Additional arguments
+
+        Returns:
+            One list of documents per query
+        """
+        return run_sync(self.asimilarity_search_batch(queries, k=k, filter=filter, **kwargs))
+
+    def similarity_search_stream(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Document]:
+        """Search for similar documents, yielding each one as it arrives (sync).
+
+        Args:
+            query: Query text
+            k: Number of results
+            filter: Metadata filter
+            **kwargs: Additional arguments
+
+        Yields:
+            Documents, nearest first
+        """
+        yield from iterate_sync(self.asimilarity_search_stream(query, k=k, filter=filter, **kwargs))
+
     def max_marginal_relevance_search(
         self,
         query: str,
@@ -103,12 +195,40 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
         Returns:
             List of documents
         """
-        return asyncio.run(
+        return run_sync(
             self.amax_marginal_relevance_search(
                 query, k=k, fetch_k=fetch_k, lambda_mult=lambda_mult, filter=filter, **kwargs
             )
         )
 
+    def max_marginal_relevance_search_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: dict | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        """MMR search by embedding vector (sync).
+
+        Args:
+            embedding: Query embedding vector
+            k: Number of results
+            fetch_k: Candidate pool size
+            lambda_mult: Diversity parameter
+            filter: Metadata filter
+            **kwargs: Additional arguments
+
+        Returns:
+            List of documents
+        """
+        return run_sync(
+            self.amax_marginal_relevance_search_by_vector(
+                embedding, k=k, fetch_k=fetch_k, lambda_mult=lambda_mult, filter=filter, **kwargs
+            )
+        )
+
     def delete(
         self,
         ids: list[str] | None = None,
@@ -123,7 +243,7 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
         Returns:
             True if successful
         """
-        return asyncio.run(self.adelete(ids=ids, **kwargs))
+        return run_sync(self.adelete(ids=ids, **kwargs))
 
     @classmethod
     def from_texts(
@@ -134,6 +254,8 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
         engine: CockroachDBEngine | None = None,
         connection_string: str | None = None,
         collection_name: str = "langchain_vectors",
+        *,
+        warmup: bool = False,
         **kwargs: Any,
     ) -> "CockroachDBVectorStore":
         """Create from texts (sync).
@@ -145,12 +267,13 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
             engine: CockroachDBEngine instance
             connection_string: Connection string
             collection_name: Table name
+            warmup: Open the engine's pool connections before returning
             **kwargs: Additional arguments
 
         Returns:
             CockroachDBVectorStore instance
         """
-        return asyncio.run(
+        return run_sync(
             AsyncCockroachDBVectorStore.afrom_texts(
                 texts,
                 embedding,
@@ -158,6 +281,7 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
                 engine=engine,
                 connection_string=connection_string,
                 collection_name=collection_name,
+                warmup=warmup,
                 **kwargs,
             )
         )
@@ -169,4 +293,4 @@ class CockroachDBVectorStore(AsyncCockroachDBVectorStore):
             index: Index configuration
             **kwargs: Additional arguments
         """
-        asyncio.run(self.aapply_vector_index(index, **kwargs))
+        run_sync(self.aapply_vector_index(index, **kwargs))
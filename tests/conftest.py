@@ -1,10 +1,13 @@
 """Pytest configuration and shared fixtures."""
 
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from typing import Any
 
 import pytest
 import pytest_asyncio
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from testcontainers.core.container import DockerContainer
 
@@ -35,15 +38,30 @@ class CockroachDBContainer(DockerContainer):
         return f"cockroachdb+psycopg://root@{host}:{port}/defaultdb?sslmode=disable"
 
     def start(self) -> "CockroachDBContainer":
-        """Start container and wait for readiness."""
-        import time
-
+        """Start container and wait until it accepts queries."""
         super().start()
+        self._wait_until_ready()
+        return self
 
-        # Give CockroachDB extra time to fully initialize after log message appears
-        time.sleep(5)
+    def _wait_until_ready(self, timeout: float = 10.0, interval: float = 0.05) -> None:
+        """Poll ``SELECT 1`` until it succeeds, instead of sleeping a fixed time."""
+        import time
 
-        return self
+        import psycopg
+
+        host = self.get_container_host_ip()
+        port = self.get_exposed_port(26257)
+        conninfo = f"postgresql://root@{host}:{port}/defaultdb?sslmode=disable"
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with psycopg.connect(conninfo, connect_timeout=1) as conn:
+                    conn.execute("SELECT 1")
+                return
+            except psycopg.OperationalError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(interval)
 
 
 @pytest.fixture(scope="session")
@@ -66,37 +84,62 @@ def cockroachdb_container() -> Generator[CockroachDBContainer | None, None, None
         container.stop()
 
 
+def _worker_database(connection_string: str, worker: str) -> str:
+    """Create a database for one pytest-xdist worker and return its URL."""
+    import psycopg
+    from sqlalchemy.engine import make_url
+
+    url = make_url(connection_string).set(database=f"test_{worker}")
+    admin = url.set(drivername="postgresql", database="defaultdb")
+    with psycopg.connect(admin.render_as_string(hide_password=False), autocommit=True) as conn:
+        conn.execute(f"CREATE DATABASE IF NOT EXISTS {url.database}")
+    return url.render_as_string(hide_password=False)
+
+
 @pytest.fixture(scope="session")
 def connection_string(cockroachdb_container: CockroachDBContainer | None) -> str:
     """Get connection string for tests.
 
     Uses testcontainer if USE_TESTCONTAINER=true (default).
     Uses COCKROACHDB_URL environment variable if USE_TESTCONTAINER=false.
+    Under pytest-xdist (``pytest -n 4``), each worker gets its own database,
+    so workers sharing one cluster don't touch each other's tables.
     """
     if cockroachdb_container is not None:
         # Using testcontainer
-        return cockroachdb_container.get_connection_url()
-
-    # Using external CockroachDB instance
-    connection_string_env = os.getenv("COCKROACHDB_URL")
-    if not connection_string_env:
-        pytest.skip(
-            "No CockroachDB connection available. "
-            "Either enable USE_TESTCONTAINER=true or set COCKROACHDB_URL"
-        )
-
-    return connection_string_env
-
-
-@pytest_asyncio.fixture
+        connection_string = cockroachdb_container.get_connection_url()
+    else:
+        # Using external CockroachDB instance
+        connection_string_env = os.getenv("COCKROACHDB_URL")
+        if not connection_string_env:
+            pytest.skip(
+                "No CockroachDB connection available. "
+                "Either enable USE_TESTCONTAINER=true or set COCKROACHDB_URL"
+            )
+        connection_string = connection_string_env
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        connection_string = _worker_database(connection_string, worker)
+    return connection_string
+
+
+@pytest_asyncio.fixture(scope="session")
 async def async_engine(connection_string: str) -> AsyncGenerator[AsyncEngine, None]:
-    """Create async engine for tests."""
+    """Create one async engine for the test session."""
     # Ensure we use the async driver (psycopg, not psycopg2)
     # This is needed when using external CockroachDB with cockroachdb:// URLs
     if connection_string.startswith("cockroachdb://"):
         connection_string = connection_string.replace("cockroachdb://", "cockroachdb+psycopg://", 1)
 
-    engine = create_async_engine(connection_string, pool_pre_ping=True)
+    # Sized for the concurrent tests, so they don't wait on the pool
+    engine = create_async_engine(
+        connection_string,
+        pool_size=20,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
 
     try:
         yield engine
@@ -104,11 +147,11 @@ async def async_engine(connection_string: str) -> AsyncGenerator[AsyncEngine, No
         await engine.dispose()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def cockroachdb_engine(
     async_engine: AsyncEngine,
 ) -> AsyncGenerator[CockroachDBEngine, None]:
-    """Create CockroachDBEngine for tests."""
+    """Create one CockroachDBEngine for the test session."""
     engine = CockroachDBEngine.from_engine(async_engine)
 
     try:
@@ -117,6 +160,49 @@ async def cockroachdb_engine(
         await engine.aclose()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def vector_tables(
+    cockroachdb_engine: CockroachDBEngine,
+) -> AsyncGenerator[Callable[..., Awaitable[str]], None]:
+    """Prepare empty vector store tables, creating each one once per session.
+
+    The yielded coroutine function takes ``ainit_vectorstore_table``
+    arguments. The first request for a table drops and recreates it; later
+    requests with the same arguments only TRUNCATE it, which is much cheaper
+    than repeating the schema changes for every test. At session end, every
+    table it created is dropped with a single statement.
+    """
+    created: set[tuple[Any, ...]] = set()
+
+    async def prepare(table_name: str, vector_dimension: int = 3, **options: Any) -> str:
+        key = (table_name, vector_dimension, tuple(sorted(options.items())))
+        if key in created:
+            async with cockroachdb_engine.engine.begin() as conn:
+                await conn.execute(text(f"TRUNCATE public.{table_name}"))
+        else:
+            await cockroachdb_engine.ainit_vectorstore_table(
+                table_name=table_name,
+                vector_dimension=vector_dimension,
+                drop_if_exists=True,
+                **options,
+            )
+            created.add(key)
+        return table_name
+
+    yield prepare
+
+    tables = sorted({f"public.{table_name}" for table_name, *_ in created})
+    if tables:
+        async with cockroachdb_engine.engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {', '.join(tables)} CASCADE"))
+
+
+@pytest.fixture(scope="session")
+def embeddings_384() -> DeterministicFakeEmbedding:
+    """384-dimensional fake embeddings, built once for the whole session."""
+    return DeterministicFakeEmbedding(size=384)
+
+
 @pytest.fixture
 def sample_texts() -> list[str]:
     """Sample texts for testing."""
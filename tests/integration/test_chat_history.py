@@ -52,11 +52,38 @@ class TestCockroachDBChatMessageHistory:
 
         retrieved = await history.aget_messages()
         assert len(retrieved) == 3
+        assert [msg.content for msg in retrieved] == ["First", "Second", "Third"]
+
+    async def test_add_messages_across_chunks(self, history: CockroachDBChatMessageHistory) -> None:
+        """Test that a batch larger than one INSERT chunk keeps its order."""
+        messages = [HumanMessage(content=f"Message {i}") for i in range(1200)]
+
+        await history.aadd_messages(messages)
+
+        retrieved = await history.aget_messages()
+        assert [msg.content for msg in retrieved] == [msg.content for msg in messages]
+
+    async def test_messages_with_ids_are_idempotent(
+        self, history: CockroachDBChatMessageHistory
+    ) -> None:
+        """Test that re-adding messages with ids is a no-op, unlike id-less ones."""
+        with_ids = [HumanMessage(content="Q", id="m1"), AIMessage(content="A", id="m2")]
+        without_id = HumanMessage(content="again")
+
+        await history.aadd_messages(with_ids)
+        await history.aadd_messages(with_ids)
+        await history.aadd_message(with_ids[0])
+        await history.aadd_message(without_id)
+        await history.aadd_message(without_id)
+
+        retrieved = await history.aget_messages()
+        assert [msg.content for msg in retrieved] == ["Q", "A", "again", "again"]
+        assert [msg.id for msg in retrieved[:2]] == ["m1", "m2"]
 
     async def test_message_ordering(self, history: CockroachDBChatMessageHistory) -> None:
-        """Test that messages are retrieved in order."""
-        for i in range(5):
-            await history.aadd_message(HumanMessage(content=f"Message {i}"))
+        """Test that messages are retrieved in order, within and across calls."""
+        await history.aadd_messages([HumanMessage(content=f"Message {i}") for i in range(4)])
+        await history.aadd_message(HumanMessage(content="Message 4"))
 
         messages = await history.aget_messages()
 
@@ -64,10 +91,23 @@ class TestCockroachDBChatMessageHistory:
         for i, msg in enumerate(messages):
             assert msg.content == f"Message {i}"
 
+    async def test_get_messages_window(self, history: CockroachDBChatMessageHistory) -> None:
+        """Test limit/offset paging and the recent-messages fast path."""
+        await history.aadd_messages([HumanMessage(content=f"Message {i}") for i in range(6)])
+
+        page = await history.aget_messages(limit=2, offset=1)
+        assert [msg.content for msg in page] == ["Message 1", "Message 2"]
+
+        tail = await history.aget_messages(offset=4)
+        assert [msg.content for msg in tail] == ["Message 4", "Message 5"]
+
+        recent = await history.aget_recent(3)
+        assert [msg.content for msg in recent] == ["Message 3", "Message 4", "Message 5"]
+        assert await history.aget_recent(0) == []
+
     async def test_clear_messages(self, history: CockroachDBChatMessageHistory) -> None:
         """Test clearing messages."""
-        await history.aadd_message(HumanMessage(content="Test"))
-        await history.aadd_message(AIMessage(content="Response"))
+        await history.aadd_messages([HumanMessage(content="Test"), AIMessage(content="Response")])
 
         messages = await history.aget_messages()
         assert len(messages) == 2
@@ -109,6 +149,60 @@ class TestCockroachDBChatMessageHistory:
         await history1.aclose()
         await history2.aclose()
 
+    async def test_covering_index(self, connection_string: str) -> None:
+        """Test that the session index stores the message column."""
+        from sqlalchemy import text
+
+        for covering_index, table_name in ((True, "test_covering"), (False, "test_not_covering")):
+            history = CockroachDBChatMessageHistory(
+                session_id="s",
+                connection_string=connection_string,
+                table_name=table_name,
+                covering_index=covering_index,
+            )
+            async with history.engine.begin() as conn:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+            await history._acreate_table_if_not_exists()
+
+            async with history.engine.connect() as conn:
+                result = await conn.execute(
+                    text(f"SHOW INDEX FROM {table_name}"),
+                )
+                stored = {
+                    row.column_name
+                    for row in result
+                    if row.index_name == f"{table_name}_session_idx" and row.storing
+                }
+            assert ("message" in stored) is covering_index
+            await history.aclose()
+
+    async def test_uuid_session_id(self, connection_string: str) -> None:
+        """Test storing session ids in a native UUID column."""
+        import uuid
+
+        session_id = uuid.uuid4()
+        history = CockroachDBChatMessageHistory(
+            session_id=session_id,
+            connection_string=connection_string,
+            table_name="test_uuid_sessions",
+            session_id_type="UUID",
+        )
+        await history._acreate_table_if_not_exists()
+
+        await history.aadd_messages([HumanMessage(content="Hello"), AIMessage(content="Hi")])
+
+        same_session = CockroachDBChatMessageHistory(
+            session_id=str(session_id),
+            engine=history.engine,
+            table_name="test_uuid_sessions",
+            session_id_type="UUID",
+        )
+        messages = await same_session.aget_messages()
+        assert [msg.content for msg in messages] == ["Hello", "Hi"]
+
+        await history.aclear()
+        await history.aclose()
+
     async def test_system_message(self, history: CockroachDBChatMessageHistory) -> None:
         """Test storing system messages."""
         msg = SystemMessage(content="System prompt")
@@ -6,52 +6,38 @@ from langchain_core.embeddings import DeterministicFakeEmbedding
 
 from langchain_cockroachdb import AsyncCockroachDBVectorStore, CockroachDBEngine
 
+# Engine construction doesn't connect, so attribute checks need no database
+UNUSED_URL = "cockroachdb+psycopg://root@localhost:26257/defaultdb"
+
 
 class TestEngineConfiguration:
     """Test engine configuration parameters."""
 
     @pytest.mark.asyncio
-    async def test_custom_pool_size(self, connection_string: str) -> None:
-        """Test custom connection pool configuration."""
-        engine = CockroachDBEngine.from_connection_string(
-            connection_string,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-        )
-
-        # Verify engine works with custom pool settings
-        await engine.ainit_vectorstore_table(
-            table_name="pool_test",
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
+    @pytest.mark.parametrize(
+        "pool_options",
+        [
+            {"pool_size": 5, "max_overflow": 10, "pool_pre_ping": True},
+            {"pool_size": 3, "pool_timeout": 5.0, "pool_recycle": 1800},
+        ],
+        ids=["pool_size", "pool_timeout"],
+    )
+    async def test_custom_pool(self, connection_string: str, pool_options: dict) -> None:
+        """Test that engines with custom pool settings can run queries."""
+        from sqlalchemy import text
+
+        engine = CockroachDBEngine.from_connection_string(connection_string, **pool_options)
+
+        async with engine.engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
 
         await engine.aclose()
 
     @pytest.mark.asyncio
-    async def test_custom_pool_timeout(self, connection_string: str) -> None:
-        """Test custom pool timeout configuration."""
-        engine = CockroachDBEngine.from_connection_string(
-            connection_string,
-            pool_size=3,
-            pool_timeout=5.0,
-            pool_recycle=1800,
-        )
-
-        await engine.ainit_vectorstore_table(
-            table_name="timeout_test",
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
-
-        await engine.aclose()
-
-    @pytest.mark.asyncio
-    async def test_custom_retry_configuration(self, connection_string: str) -> None:
+    async def test_custom_retry_configuration(self) -> None:
         """Test custom retry parameters."""
         engine = CockroachDBEngine.from_connection_string(
-            connection_string,
+            UNUSED_URL,
             retry_max_attempts=10,
             retry_initial_backoff=0.05,
             retry_max_backoff=30.0,
@@ -69,9 +55,9 @@ class TestEngineConfiguration:
         await engine.aclose()
 
     @pytest.mark.asyncio
-    async def test_minimal_configuration(self, connection_string: str) -> None:
+    async def test_minimal_configuration(self) -> None:
         """Test engine with minimal (default) configuration."""
-        engine = CockroachDBEngine.from_connection_string(connection_string)
+        engine = CockroachDBEngine.from_connection_string(UNUSED_URL)
 
         # Verify defaults
         assert engine.retry_max_attempts == 5
@@ -83,29 +69,26 @@ class TestEngineConfiguration:
         await engine.aclose()
 
 
+@pytest_asyncio.fixture(loop_scope="session")
+async def configured_engine(
+    cockroachdb_engine: CockroachDBEngine, vector_tables
+) -> CockroachDBEngine:
+    """Session engine with an empty shared table for each test."""
+    await vector_tables("config_test_vectors", 384)
+    return cockroachdb_engine
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestVectorStoreConfiguration:
     """Test vectorstore configuration parameters."""
 
-    @pytest_asyncio.fixture
-    async def configured_engine(self, connection_string: str):
-        """Create engine for vectorstore tests."""
-        engine = CockroachDBEngine.from_connection_string(connection_string)
-        await engine.ainit_vectorstore_table(
-            table_name="config_test_vectors",
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
-        yield engine
-        await engine.aclose()
-
-    @pytest.mark.asyncio
-    async def test_custom_batch_size(self, configured_engine: CockroachDBEngine) -> None:
+    async def test_custom_batch_size(
+        self, configured_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
+    ) -> None:
         """Test custom batch size configuration."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-
         vectorstore = AsyncCockroachDBVectorStore(
             engine=configured_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name="config_test_vectors",
             batch_size=10,
         )
@@ -117,16 +100,13 @@ class TestVectorStoreConfiguration:
         ids = await vectorstore.aadd_texts(texts)
         assert len(ids) == 25
 
-    @pytest.mark.asyncio
     async def test_custom_retry_params_vectorstore(
-        self, configured_engine: CockroachDBEngine
+        self, configured_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
     ) -> None:
         """Test custom retry parameters for vectorstore operations."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-
         vectorstore = AsyncCockroachDBVectorStore(
             engine=configured_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name="config_test_vectors",
             retry_max_attempts=7,
             retry_initial_backoff=0.02,
@@ -147,11 +127,10 @@ class TestVectorStoreConfiguration:
         ids = await vectorstore.aadd_texts(texts)
         assert len(ids) == 2
 
-    @pytest.mark.asyncio
-    async def test_custom_column_names(self, configured_engine: CockroachDBEngine) -> None:
+    async def test_custom_column_names(
+        self, configured_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
+    ) -> None:
         """Test custom column name configuration."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-
         # Create table with custom columns
         table_name = "custom_columns_test"
         await configured_engine.ainit_vectorstore_table(
@@ -165,7 +144,7 @@ class TestVectorStoreConfiguration:
 
         vectorstore = AsyncCockroachDBVectorStore(
             engine=configured_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
             content_column="text_content",
             embedding_column="vector_data",
@@ -180,15 +159,14 @@ class TestVectorStoreConfiguration:
         results = await vectorstore.asimilarity_search("test", k=1)
         assert len(results) == 1
 
-    @pytest.mark.asyncio
-    async def test_different_batch_sizes(self, configured_engine: CockroachDBEngine) -> None:
+    async def test_different_batch_sizes(
+        self, configured_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
+    ) -> None:
         """Test operations with different batch sizes."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-
         # Small batch size
         vs_small = AsyncCockroachDBVectorStore(
             engine=configured_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name="config_test_vectors",
             batch_size=2,
         )
@@ -200,7 +178,7 @@ class TestVectorStoreConfiguration:
         # Large batch size
         vs_large = AsyncCockroachDBVectorStore(
             engine=configured_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name="config_test_vectors",
             batch_size=100,
         )
@@ -209,16 +187,13 @@ class TestVectorStoreConfiguration:
         ids_large = await vs_large.aadd_texts(texts_large)
         assert len(ids_large) == 10
 
-    @pytest.mark.asyncio
     async def test_override_batch_size_at_runtime(
-        self, configured_engine: CockroachDBEngine
+        self, configured_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
     ) -> None:
         """Test overriding batch size at runtime."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-
         vectorstore = AsyncCockroachDBVectorStore(
             engine=configured_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name="config_test_vectors",
             batch_size=10,  # Default
         )
@@ -228,8 +203,12 @@ class TestVectorStoreConfiguration:
         ids = await vectorstore.aadd_texts(texts, batch_size=5)
         assert len(ids) == 20
 
-    @pytest.mark.asyncio
-    async def test_production_configuration(self, connection_string: str) -> None:
+    async def test_production_configuration(
+        self,
+        connection_string: str,
+        configured_engine: CockroachDBEngine,
+        embeddings_384: DeterministicFakeEmbedding,
+    ) -> None:
         """Test production-ready configuration."""
         # Production-style configuration
         engine = CockroachDBEngine.from_connection_string(
@@ -246,18 +225,10 @@ class TestVectorStoreConfiguration:
             retry_jitter=True,
         )
 
-        await engine.ainit_vectorstore_table(
-            table_name="production_test",
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
-
-        embeddings = DeterministicFakeEmbedding(size=384)
-
         vectorstore = AsyncCockroachDBVectorStore(
             engine=engine,
-            embeddings=embeddings,
-            collection_name="production_test",
+            embeddings=embeddings_384,
+            collection_name="config_test_vectors",
             batch_size=100,
             retry_max_attempts=5,
             retry_initial_backoff=0.05,
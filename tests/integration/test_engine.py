@@ -84,6 +84,81 @@ class TestCockroachDBEngine:
         assert len(columns) > 0
         assert columns[0][1] == "tsvector"
 
+    async def test_ainit_vectorstore_table_noop_if_exists(
+        self, cockroachdb_engine: CockroachDBEngine
+    ) -> None:
+        """Test that re-initializing a complete table issues no DDL."""
+        from sqlalchemy import event
+
+        table_name = "test_noop_vectors"
+        await cockroachdb_engine.ainit_vectorstore_table(
+            table_name=table_name,
+            vector_dimension=3,
+            create_tsvector=True,
+            drop_if_exists=True,
+        )
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        sync_engine = cockroachdb_engine.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            await cockroachdb_engine.ainit_vectorstore_table(
+                table_name=table_name, vector_dimension=3, create_tsvector=True
+            )
+            ddl = [s for s in statements if any(w in s for w in ("CREATE", "ALTER", "DROP "))]
+            assert ddl == []
+
+            # A column the table lacks still goes through the DDL path
+            await cockroachdb_engine.ainit_vectorstore_table(
+                table_name=table_name, vector_dimension=3, quantization="int8"
+            )
+            assert any("ALTER TABLE" in s for s in statements)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+    async def test_ainit_vectorstore_table_truncate(
+        self, cockroachdb_engine: CockroachDBEngine
+    ) -> None:
+        """Test that truncate_if_exists keeps the table but removes rows."""
+        table_name = "test_truncate_vectors"
+
+        await cockroachdb_engine.ainit_vectorstore_table(
+            table_name=table_name,
+            vector_dimension=3,
+            drop_if_exists=True,
+        )
+
+        async with cockroachdb_engine.engine.begin() as conn:
+            await conn.execute(
+                text(f"INSERT INTO {table_name} (content, embedding) VALUES ('a', '[1,2,3]')")
+            )
+
+        await cockroachdb_engine.ainit_vectorstore_table(
+            table_name=table_name,
+            vector_dimension=3,
+            truncate_if_exists=True,
+        )
+
+        async with cockroachdb_engine.engine.connect() as conn:
+            result = await conn.execute(text(f"SELECT count(*) FROM {table_name}"))
+            assert result.scalar() == 0
+
+    async def test_ainit_vectorstore_table_drop_and_truncate(
+        self, cockroachdb_engine: CockroachDBEngine
+    ) -> None:
+        """Test that drop_if_exists and truncate_if_exists are exclusive."""
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            await cockroachdb_engine.ainit_vectorstore_table(
+                table_name="test_vectors",
+                vector_dimension=3,
+                drop_if_exists=True,
+                truncate_if_exists=True,
+            )
+
     async def test_context_manager(self, connection_string: str) -> None:
         """Test async context manager."""
         async with CockroachDBEngine.from_connection_string(connection_string) as engine:
@@ -104,3 +179,34 @@ class TestCockroachDBEngine:
         assert engine.engine.pool.size() == 5
 
         await engine.aclose()
+
+    async def test_concurrency_hint(self, connection_string: str) -> None:
+        """Test that concurrency_hint raises the pool size."""
+        engine = CockroachDBEngine.from_connection_string(
+            connection_string,
+            pool_size=5,
+            concurrency_hint=16,
+        )
+
+        assert engine.engine.pool.size() == 16
+
+        await engine.aclose()
+
+        with pytest.raises(ValueError, match="concurrency_hint"):
+            CockroachDBEngine.from_connection_string(connection_string, concurrency_hint=0)
+
+    async def test_awarmup(self, connection_string: str) -> None:
+        """Test that warmup fills the pool with idle connections."""
+        engine = CockroachDBEngine.from_connection_string(
+            connection_string,
+            pool_size=3,
+            max_overflow=0,
+        )
+
+        opened = await engine.awarmup()
+
+        assert opened == 3
+        assert engine.engine.pool.checkedin() == 3
+        assert engine.engine.pool.checkedout() == 0
+
+        await engine.aclose()
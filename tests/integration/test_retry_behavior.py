@@ -11,14 +11,19 @@ from langchain_cockroachdb import AsyncCockroachDBVectorStore, CockroachDBEngine
 class TestRetryBehavior:
     """Test retry behavior with real database errors."""
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="class")
     async def engine_with_retries(self, connection_string: str):
-        """Create engine with custom retry configuration."""
+        """Create one engine with custom retry configuration for the class."""
         engine = CockroachDBEngine.from_connection_string(
             connection_string,
+            pool_size=20,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=1800,
             retry_max_attempts=3,
-            retry_initial_backoff=0.05,
-            retry_max_backoff=0.5,
+            # Short sleeps; the backoff schedule itself is covered by unit tests
+            retry_initial_backoff=0.005,
+            retry_max_backoff=0.1,
         )
         yield engine
         await engine.aclose()
@@ -54,22 +59,18 @@ class TestRetryBehavior:
 
     @pytest.mark.asyncio
     async def test_vectorstore_add_with_custom_retry_params(
-        self, engine_with_retries: CockroachDBEngine
+        self,
+        engine_with_retries: CockroachDBEngine,
+        vector_tables,
+        embeddings_384: DeterministicFakeEmbedding,
     ) -> None:
         """Test vectorstore operations with custom retry parameters."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-        table_name = "retry_vectorstore_test"
-
-        await engine_with_retries.ainit_vectorstore_table(
-            table_name=table_name,
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
+        table_name = await vector_tables("retry_test_vectors", 384)
 
         # Create vectorstore with custom retry settings
         vectorstore = AsyncCockroachDBVectorStore(
             engine=engine_with_retries,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
             retry_max_attempts=5,
             retry_initial_backoff=0.02,
@@ -88,58 +89,54 @@ class TestRetryBehavior:
 
     @pytest.mark.asyncio
     async def test_batch_insert_with_multiple_batches(
-        self, engine_with_retries: CockroachDBEngine
+        self,
+        engine_with_retries: CockroachDBEngine,
+        vector_tables,
+        embeddings_384: DeterministicFakeEmbedding,
     ) -> None:
         """Test batch insert with small batch size triggers multiple operations."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-        table_name = "batch_retry_test"
-
-        await engine_with_retries.ainit_vectorstore_table(
-            table_name=table_name,
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
+        table_name = await vector_tables("retry_test_vectors", 384)
 
         # Create vectorstore with small batch size
         vectorstore = AsyncCockroachDBVectorStore(
             engine=engine_with_retries,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
             batch_size=2,  # Small batch to trigger multiple inserts
             retry_max_attempts=3,
         )
 
+        from unittest.mock import AsyncMock
+
+        spy = AsyncMock(wraps=vectorstore._insert_batch)
+        vectorstore._insert_batch = spy  # type: ignore[method-assign]
+
         # Add 10 texts with batch_size=2 (5 batches)
         texts = [f"Document {i}" for i in range(10)]
         ids = await vectorstore.aadd_texts(texts)
 
         assert len(ids) == 10
+        assert spy.await_count == len(texts) // 2
 
-        # Verify all inserted
-        async with engine_with_retries.engine.connect() as conn:
-            result = await conn.execute(text(f"SELECT COUNT(*) FROM public.{table_name}"))
-            count = result.scalar()
-            assert count == 10
+        # One search for every row checks that all 5 batches were stored
+        results = await vectorstore.asimilarity_search("Document", k=len(texts))
+        assert sorted(doc.page_content for doc in results) == sorted(texts)
 
     @pytest.mark.asyncio
     async def test_concurrent_operations_with_retries(
-        self, engine_with_retries: CockroachDBEngine
+        self,
+        engine_with_retries: CockroachDBEngine,
+        vector_tables,
+        embeddings_384: DeterministicFakeEmbedding,
     ) -> None:
         """Test concurrent operations don't interfere with retry logic."""
         import asyncio
 
-        embeddings = DeterministicFakeEmbedding(size=384)
-        table_name = "concurrent_retry_test"
-
-        await engine_with_retries.ainit_vectorstore_table(
-            table_name=table_name,
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
+        table_name = await vector_tables("retry_test_vectors", 384)
 
         vectorstore = AsyncCockroachDBVectorStore(
             engine=engine_with_retries,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
             retry_max_attempts=3,
         )
@@ -164,21 +161,17 @@ class TestRetryBehavior:
 
     @pytest.mark.asyncio
     async def test_retry_with_different_error_types(
-        self, engine_with_retries: CockroachDBEngine
+        self,
+        engine_with_retries: CockroachDBEngine,
+        vector_tables,
+        embeddings_384: DeterministicFakeEmbedding,
     ) -> None:
         """Test that retry logic distinguishes retryable vs non-retryable errors."""
-        embeddings = DeterministicFakeEmbedding(size=384)
-        table_name = "error_type_test"
-
-        await engine_with_retries.ainit_vectorstore_table(
-            table_name=table_name,
-            vector_dimension=384,
-            drop_if_exists=True,
-        )
+        table_name = await vector_tables("retry_test_vectors", 384)
 
         vectorstore = AsyncCockroachDBVectorStore(
             engine=engine_with_retries,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
         )
 
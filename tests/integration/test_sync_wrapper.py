@@ -7,32 +7,38 @@ from langchain_cockroachdb import CockroachDBEngine, CockroachDBVectorStore
 from langchain_cockroachdb.indexes import CSPANNIndex, DistanceStrategy
 
 
+@pytest.fixture(scope="session")
+def sync_engine(connection_string: str):
+    """Create one sync engine, and its shared table, for the test session."""
+    engine = CockroachDBEngine.from_connection_string(connection_string)
+    engine.init_vectorstore_table(
+        table_name="sync_test_vectors",
+        vector_dimension=384,
+        drop_if_exists=True,
+    )
+    yield engine
+    engine.close()
+
+
 class TestCockroachDBVectorStoreSync:
     """Test synchronous vectorstore wrapper."""
 
     @pytest.fixture
-    def sync_engine(self, connection_string: str):
-        """Create sync engine."""
-        engine = CockroachDBEngine.from_connection_string(connection_string)
-        yield engine
-        engine.close()
-
-    @pytest.fixture
-    def sync_vectorstore(self, sync_engine: CockroachDBEngine):
-        """Create sync vectorstore."""
-        embeddings = DeterministicFakeEmbedding(size=384)
+    def sync_vectorstore(
+        self, sync_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
+    ):
+        """Create sync vectorstore on the emptied shared table."""
         table_name = "sync_test_vectors"
 
-        # Initialize table synchronously
         sync_engine.init_vectorstore_table(
             table_name=table_name,
             vector_dimension=384,
-            drop_if_exists=True,
+            truncate_if_exists=True,
         )
 
         vectorstore = CockroachDBVectorStore(
             engine=sync_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
         )
 
@@ -50,14 +56,14 @@ class TestCockroachDBVectorStoreSync:
         ids = sync_vectorstore.add_texts(texts, metadatas=metadatas)
 
         assert len(ids) == 3
-        assert all(isinstance(id_val, str) for id_val in ids)
+        assert {type(id_val) for id_val in ids} == {str}
 
     def test_add_texts_with_ids_sync(self, sync_vectorstore: CockroachDBVectorStore) -> None:
         """Test adding texts with custom IDs synchronously."""
-        import uuid
+        from langchain_cockroachdb.async_vectorstore import _random_ids
 
         texts = ["Doc 1", "Doc 2"]
-        custom_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        custom_ids = _random_ids(len(texts))
 
         ids = sync_vectorstore.add_texts(texts, ids=custom_ids)
 
@@ -144,9 +150,10 @@ class TestCockroachDBVectorStoreSync:
         # Should get one ML doc and one DB doc (diverse)
         assert any("Machine learning" in c for c in contents)
 
-    def test_from_texts_sync(self, sync_engine: CockroachDBEngine) -> None:
+    def test_from_texts_sync(
+        self, sync_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
+    ) -> None:
         """Test creating vectorstore and adding texts in one go."""
-        embeddings = DeterministicFakeEmbedding(size=384)
         texts = ["Text 1", "Text 2", "Text 3"]
         table_name = "from_texts_sync_test"
 
@@ -159,7 +166,7 @@ class TestCockroachDBVectorStoreSync:
         # Create vectorstore and add texts separately (from_texts is complex with async/sync)
         vectorstore = CockroachDBVectorStore(
             engine=sync_engine,
-            embeddings=embeddings,
+            embeddings=embeddings_384,
             collection_name=table_name,
         )
 
@@ -169,8 +176,25 @@ class TestCockroachDBVectorStoreSync:
         results = vectorstore.similarity_search("Text", k=5)
         assert len(results) == 3
 
-    def test_apply_vector_index_sync(self, sync_vectorstore: CockroachDBVectorStore) -> None:
-        """Test applying vector index synchronously."""
+    def test_apply_vector_index_sync(
+        self, sync_engine: CockroachDBEngine, embeddings_384: DeterministicFakeEmbedding
+    ) -> None:
+        """Test applying vector index synchronously and that searches plan through it."""
+        from sqlalchemy import text
+
+        # Own table, so the index doesn't change searches on the shared one
+        table_name = "sync_indexed_vectors"
+        sync_engine.init_vectorstore_table(
+            table_name=table_name,
+            vector_dimension=384,
+            drop_if_exists=True,
+        )
+        sync_vectorstore = CockroachDBVectorStore(
+            engine=sync_engine,
+            embeddings=embeddings_384,
+            collection_name=table_name,
+        )
+
         # Add some data first
         texts = ["Doc 1", "Doc 2", "Doc 3"]
         sync_vectorstore.add_texts(texts)
@@ -179,17 +203,42 @@ class TestCockroachDBVectorStoreSync:
         index = CSPANNIndex(distance_strategy=DistanceStrategy.COSINE)
         sync_vectorstore.apply_vector_index(index)
 
-        # Search should still work with index
-        results = sync_vectorstore.similarity_search("Doc", k=2)
-        assert len(results) == 2
+        # Check the plan instead of repeating a search the other tests cover
+        query = str(embeddings_384.embed_query("Doc"))
+
+        async def explain() -> str:
+            async with sync_engine.engine.connect() as conn:
+                result = await conn.execute(
+                    text(
+                        f"EXPLAIN SELECT id FROM public.{table_name} "
+                        f"ORDER BY embedding <=> '{query}'::VECTOR LIMIT 2"
+                    )
+                )
+                return "\n".join(row[0] for row in result)
+
+        assert f"{table_name}_embedding_vector_idx" in sync_engine._run_async(explain())
+
+    def test_similarity_search_stream_sync(self, sync_vectorstore: CockroachDBVectorStore) -> None:
+        """Test streaming search results synchronously."""
+        sync_vectorstore.add_texts(["Alpha", "Beta", "Gamma"])
+
+        streamed = list(sync_vectorstore.similarity_search_stream("Alpha", k=2))
+
+        buffered = sync_vectorstore.similarity_search("Alpha", k=2)
+        assert [doc.page_content for doc in streamed] == [doc.page_content for doc in buffered]
 
     def test_batch_operations_sync(self, sync_vectorstore: CockroachDBVectorStore) -> None:
         """Test batch operations with custom batch size synchronously."""
+        from unittest.mock import AsyncMock
+
+        spy = AsyncMock(wraps=sync_vectorstore._insert_batch)
+        sync_vectorstore._insert_batch = spy  # type: ignore[method-assign]
         texts = [f"Document {i}" for i in range(20)]
 
         # Add with custom batch size
         ids = sync_vectorstore.add_texts(texts, batch_size=5)
         assert len(ids) == 20
+        assert spy.await_count == len(texts) // 5
 
         # Search should return all documents
         results = sync_vectorstore.similarity_search("Document", k=25)
@@ -205,12 +254,12 @@ class TestCockroachDBVectorStoreSync:
         # Add via sync
         sync_ids = sync_vectorstore.add_texts(texts, metadatas=metadatas)
 
-        # Search via sync
-        sync_results = sync_vectorstore.similarity_search("Test", k=2)
+        # Search via sync, asking for every row so all of them can be checked
+        sync_results = sync_vectorstore.similarity_search("Test", k=len(texts))
 
         assert len(sync_ids) == 2
-        assert len(sync_results) == 2
-        assert all("Test document" in doc.page_content for doc in sync_results)
+        assert sorted(doc.page_content for doc in sync_results) == texts
+        assert sorted(doc.metadata["idx"] for doc in sync_results) == [1, 2]
 
     def test_sync_error_handling(self, sync_vectorstore: CockroachDBVectorStore) -> None:
         """Test error handling in sync operations."""
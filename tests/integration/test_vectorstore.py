@@ -1,5 +1,8 @@
 """Integration tests for vector store."""
 
+import asyncio
+
+import numpy as np
 import pytest
 from langchain_core.embeddings import Embeddings
 
@@ -13,7 +16,8 @@ class FakeEmbeddings(Embeddings):
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed documents."""
-        return [[float(i), float(i + 1), float(i + 2)] for i in range(len(texts))]
+        rows = np.add.outer(np.arange(len(texts), dtype=np.float32), np.arange(3, dtype=np.float32))
+        return rows.tolist()
 
     def embed_query(self, text: str) -> list[float]:
         """Embed query."""
@@ -28,28 +32,25 @@ class FakeEmbeddings(Embeddings):
         return self.embed_query(text)
 
 
+@pytest.fixture(scope="session")
+def embeddings_3() -> FakeEmbeddings:
+    """One 3-dimensional fake embeddings instance shared by the session."""
+    return FakeEmbeddings()
+
+
 @pytest.mark.asyncio
 class TestAsyncCockroachDBVectorStore:
     """Test async vector store with real database."""
 
     @pytest.fixture
     async def vectorstore(
-        self, cockroachdb_engine: CockroachDBEngine
+        self, cockroachdb_engine: CockroachDBEngine, vector_tables, embeddings_3: FakeEmbeddings
     ) -> AsyncCockroachDBVectorStore:
-        """Create vector store for testing."""
-        embeddings = FakeEmbeddings()
-        collection_name = "test_collection"
-
-        await cockroachdb_engine.ainit_vectorstore_table(
-            table_name=collection_name,
-            vector_dimension=3,
-            drop_if_exists=True,
-        )
-
+        """Create vector store for testing on an empty shared table."""
         return AsyncCockroachDBVectorStore(
             engine=cockroachdb_engine,
-            embeddings=embeddings,
-            collection_name=collection_name,
+            embeddings=embeddings_3,
+            collection_name=await vector_tables("test_collection"),
         )
 
     async def test_aadd_texts(
@@ -61,7 +62,7 @@ class TestAsyncCockroachDBVectorStore:
         ids = await vectorstore.aadd_texts(sample_texts)
 
         assert len(ids) == len(sample_texts)
-        assert all(isinstance(id, str) for id in ids)
+        assert {type(id_val) for id_val in ids} == {str}
 
     async def test_aadd_texts_with_metadata(
         self,
@@ -74,19 +75,143 @@ class TestAsyncCockroachDBVectorStore:
 
         assert len(ids) == len(sample_texts)
 
+    async def test_aadd_texts_from_generator(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test that a generator is consumed in batches across batch boundaries."""
+        ids = await vectorstore.aadd_texts(
+            (text for text in sample_texts), metadatas=sample_metadatas, batch_size=2
+        )
+
+        assert len(ids) == len(sample_texts)
+        results = await vectorstore.asimilarity_search("query", k=len(sample_texts))
+        assert {doc.page_content for doc in results} == set(sample_texts)
+        assert {doc.metadata["category"] for doc in results} == {
+            m["category"] for m in sample_metadatas
+        }
+
     async def test_aadd_texts_with_ids(
         self,
         vectorstore: AsyncCockroachDBVectorStore,
         sample_texts: list[str],
     ) -> None:
         """Test adding texts with custom IDs."""
-        import uuid
+        from langchain_cockroachdb.async_vectorstore import _random_ids
 
-        custom_ids = [str(uuid.uuid4()) for _ in range(len(sample_texts))]
+        custom_ids = _random_ids(len(sample_texts))
         ids = await vectorstore.aadd_texts(sample_texts, ids=custom_ids)
 
         assert ids == custom_ids
 
+    async def test_aadd_embeddings(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test adding texts with precomputed embeddings."""
+        embeddings = await vectorstore.embeddings.aembed_documents(sample_texts)
+        ids = await vectorstore.aadd_embeddings(sample_texts, embeddings)
+
+        assert len(ids) == len(sample_texts)
+
+        results = await vectorstore.asimilarity_search("database", k=len(sample_texts))
+        assert {doc.page_content for doc in results} == set(sample_texts)
+
+    async def test_aadd_embeddings_ndarray(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test adding precomputed embeddings given as one float32 array."""
+        embeddings = np.asarray(
+            await vectorstore.embeddings.aembed_documents(sample_texts), dtype=np.float32
+        )
+        ids = await vectorstore.aadd_embeddings(sample_texts, embeddings)
+
+        assert len(ids) == len(sample_texts)
+
+        results = await vectorstore.asimilarity_search("database", k=len(sample_texts))
+        assert {doc.page_content for doc in results} == set(sample_texts)
+
+    async def test_aadd_embeddings_length_mismatch(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that mismatched texts and embeddings are rejected."""
+        with pytest.raises(ValueError, match="does not match"):
+            await vectorstore.aadd_embeddings(sample_texts, [[1.0, 2.0, 3.0]])
+
+    async def test_aadd_texts_copy(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test bulk loading with COPY."""
+        ids = await vectorstore.aadd_texts_copy(sample_texts, metadatas=sample_metadatas)
+
+        assert len(ids) == len(sample_texts)
+
+        results = await vectorstore.asimilarity_search(
+            "query", k=10, filter={"category": {"$eq": "database"}}
+        )
+        assert len(results) == 3
+        assert {doc.page_content for doc in results} <= set(sample_texts)
+
+    async def test_aadd_texts_copy_in_batches(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test that COPY embeds in batches and keeps rows aligned with metadata."""
+        ids = await vectorstore.aadd_texts_copy(
+            sample_texts, metadatas=sample_metadatas, batch_size=2
+        )
+
+        assert len(ids) == len(sample_texts)
+        docs = await vectorstore.asimilarity_search("query", k=10)
+        assert {(doc.page_content, doc.metadata["page"]) for doc in docs} == {
+            (content, metadata["page"])
+            for content, metadata in zip(sample_texts, sample_metadatas, strict=True)
+        }
+
+    async def test_copy_threshold(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that large loads without ids go through COPY."""
+        vectorstore.copy_threshold = 3
+        copy_calls = []
+        aadd_texts_copy = vectorstore.aadd_texts_copy
+
+        async def tracking_copy(texts, *args, **kwargs):
+            # aadd_texts may pass a lazy iterator; count it before forwarding
+            materialized = list(texts)
+            copy_calls.append(len(materialized))
+            return await aadd_texts_copy(materialized, *args, **kwargs)
+
+        vectorstore.aadd_texts_copy = tracking_copy  # type: ignore[method-assign]
+
+        await asyncio.gather(
+            vectorstore.aadd_texts(sample_texts[:2]),
+            vectorstore.aadd_texts(sample_texts[2:]),
+        )
+
+        # Explicit ids keep the upsert path even above the threshold
+        ids = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(3)]
+        await vectorstore.aadd_texts(["a", "b", "c"], ids=ids)
+        await vectorstore.aadd_texts(["a", "b", "c"], ids=ids)
+
+        assert copy_calls == [len(sample_texts) - 2]
+        results = await vectorstore.asimilarity_search("", k=20)
+        assert len(results) == len(sample_texts) + 3
+
     async def test_asimilarity_search(
         self,
         vectorstore: AsyncCockroachDBVectorStore,
@@ -150,6 +275,253 @@ class TestAsyncCockroachDBVectorStore:
             assert doc.metadata.get("category") == "database"
             assert doc.metadata.get("page", 0) > 2
 
+    async def test_asimilarity_search_multi_filter(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test searching several filters in one call."""
+        await vectorstore.aadd_texts(sample_texts, metadatas=sample_metadatas)
+
+        filters = [
+            {"category": {"$eq": "database"}},
+            {"category": {"$eq": "framework"}},
+            None,
+        ]
+        database_docs, framework_docs, all_docs = await vectorstore.asimilarity_search_multi_filter(
+            "query", filters=filters, k=5
+        )
+
+        assert len(database_docs) == 3
+        assert all(doc.metadata["category"] == "database" for doc in database_docs)
+        assert len(framework_docs) == 1
+        assert framework_docs[0].metadata["category"] == "framework"
+        assert len(all_docs) == 5
+
+    async def test_asimilarity_search_batch(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test that a batch returns the same results as separate searches."""
+        await vectorstore.aadd_texts(sample_texts, metadatas=sample_metadatas)
+        db_filter = {"category": {"$eq": "database"}}
+
+        batch, single = await asyncio.gather(
+            vectorstore.asimilarity_search_batch(["q1", "q2"], k=2, filter=db_filter),
+            vectorstore.asimilarity_search("q1", k=2, filter=db_filter),
+        )
+        assert len(batch) == 2
+        assert [doc.page_content for doc in batch[0]] == [doc.page_content for doc in single]
+        assert [doc.page_content for doc in batch[1]] == [doc.page_content for doc in single]
+        assert await vectorstore.asimilarity_search_batch([]) == []
+
+    async def test_asimilarity_search_stream(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test that streamed results match a buffered search, and early stops."""
+        await vectorstore.aadd_texts(sample_texts, metadatas=sample_metadatas)
+        db_filter = {"category": {"$eq": "database"}}
+
+        streamed = [
+            doc async for doc in vectorstore.asimilarity_search_stream("q", k=3, filter=db_filter)
+        ]
+
+        buffered = await vectorstore.asimilarity_search("q", k=3, filter=db_filter)
+        assert [doc.page_content for doc in streamed] == [doc.page_content for doc in buffered]
+        assert streamed[0].metadata == buffered[0].metadata
+
+        async for doc in vectorstore.asimilarity_search_stream("q", k=5):
+            assert doc.page_content
+            break
+
+    async def test_query_cache(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that repeated searches are cached and writes invalidate them."""
+        cached_store = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=vectorstore.embeddings,
+            collection_name=vectorstore.collection_name,
+            query_cache_size=10,
+        )
+        await cached_store.aadd_texts(sample_texts)
+
+        first = await cached_store.asimilarity_search("database", k=3)
+        second = await cached_store.asimilarity_search("database", k=3)
+
+        assert [doc.page_content for doc in first] == [doc.page_content for doc in second]
+        stats = cached_store.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        await cached_store.aadd_texts(["New document"])
+        assert cached_store.get_cache_stats()["size"] == 0
+
+    async def test_query_embedding_cache(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that repeated queries are embedded once and survive writes."""
+        from unittest.mock import AsyncMock
+
+        embeddings = FakeEmbeddings()
+        spy = AsyncMock(wraps=embeddings.aembed_query)
+        embeddings.aembed_query = spy  # type: ignore[method-assign]
+        cached_store = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=embeddings,
+            collection_name=vectorstore.collection_name,
+            query_embedding_cache_size=1,
+        )
+        await cached_store.aadd_texts(sample_texts)
+
+        first = await cached_store.asimilarity_search("database", k=3)
+        await cached_store.aadd_texts(["New document"])
+        second = await cached_store.asimilarity_search("database", k=3)
+        assert spy.await_count == 1
+        assert len(first) == len(second) == 3
+
+        await cached_store.asimilarity_search("framework", k=3)
+        await cached_store.asimilarity_search("database", k=3)
+        assert spy.await_count == 3
+
+    async def test_int8_quantization(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vector_tables,
+        embeddings_3: FakeEmbeddings,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that int8 codes and scales are written to sidecar columns."""
+        import numpy as np
+        from sqlalchemy import text
+
+        from langchain_cockroachdb.quantization import dequantize_int8
+
+        await vector_tables("test_quantized", quantization="int8")
+        vectorstore = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=embeddings_3,
+            collection_name="test_quantized",
+            quantization="int8",
+        )
+        ids = await vectorstore.aadd_texts(sample_texts[:2])
+
+        async with cockroachdb_engine.engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT embedding_int8, embedding_scale FROM test_quantized WHERE id = :id"),
+                {"id": ids[1]},
+            )
+            codes, scale = result.one()
+
+        restored = dequantize_int8(np.frombuffer(codes, dtype=np.int8), scale)
+        assert np.allclose(restored, [1.0, 2.0, 3.0], atol=scale)
+
+    async def test_asimilarity_search_with_score_int8(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vector_tables,
+        embeddings_3: FakeEmbeddings,
+        sample_texts: list[str],
+        sample_metadatas: list[dict],
+    ) -> None:
+        """Test that the int8 scan returns the same top results as exact search."""
+        await vector_tables("test_quantized_search", quantization="int8")
+        vectorstore = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=embeddings_3,
+            collection_name="test_quantized_search",
+            quantization="int8",
+        )
+        await vectorstore.aadd_texts(sample_texts, metadatas=sample_metadatas)
+
+        exact, quantized = await asyncio.gather(
+            vectorstore.asimilarity_search_with_score("query", k=2),
+            vectorstore.asimilarity_search_with_score_int8("query", k=2),
+        )
+
+        assert [doc.page_content for doc, _ in quantized] == [doc.page_content for doc, _ in exact]
+        assert [score for _, score in quantized] == pytest.approx([s for _, s in exact])
+
+        filtered = await vectorstore.asimilarity_search_with_score_int8(
+            "query", k=10, filter={"category": "database"}
+        )
+        assert {doc.metadata["category"] for doc, _ in filtered} == {"database"}
+
+        # MMR reads the int8 codes instead of the float vectors
+        mmr = await vectorstore.amax_marginal_relevance_search("query", k=3, fetch_k=5)
+        assert len({doc.page_content for doc in mmr}) == 3
+
+    async def test_asimilarity_search_with_score_int8_requires_quantization(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+    ) -> None:
+        """Test that the int8 scan is rejected without int8 sidecars."""
+        with pytest.raises(ValueError, match="quantization='int8'"):
+            await vectorstore.asimilarity_search_with_score_int8("query")
+
+    async def test_normalize_on_insert(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that stored embeddings are unit length when normalizing."""
+        import numpy as np
+        from sqlalchemy import text
+
+        normalized_store = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=vectorstore.embeddings,
+            collection_name=vectorstore.collection_name,
+            normalize_on_insert=True,
+        )
+        await normalized_store.aadd_texts(sample_texts)
+
+        async with cockroachdb_engine.engine.connect() as conn:
+            result = await conn.execute(text("SELECT embedding::STRING FROM test_collection"))
+            rows = result.fetchall()
+
+        for (embedding,) in rows:
+            vector = np.array([float(x) for x in embedding.strip("[]").split(",")])
+            assert np.isclose(np.linalg.norm(vector), 1.0, atol=1e-5)
+
+    async def test_normalized_cosine_scores_match_cosine_distance(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that inner-product ranking reports the same cosine distances."""
+        normalized_store = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=vectorstore.embeddings,
+            collection_name=vectorstore.collection_name,
+            normalize_on_insert=True,
+        )
+        await normalized_store.aadd_texts(sample_texts)
+
+        # Same rows ranked with <=> by a store that does not assume unit vectors
+        fast, exact = await asyncio.gather(
+            normalized_store.asimilarity_search_with_score("query", k=5),
+            vectorstore.asimilarity_search_with_score("query", k=5),
+        )
+
+        assert [doc.page_content for doc, _ in fast] == [doc.page_content for doc, _ in exact]
+        for (_, fast_score), (_, exact_score) in zip(fast, exact, strict=True):
+            assert fast_score == pytest.approx(exact_score, abs=1e-5)
+
     async def test_adelete(
         self,
         vectorstore: AsyncCockroachDBVectorStore,
@@ -166,12 +538,35 @@ class TestAsyncCockroachDBVectorStore:
         remaining = await vectorstore.asimilarity_search("", k=10)
         assert len(remaining) == len(sample_texts) - len(delete_ids)
 
-    async def test_aapply_vector_index(
+    async def test_adelete_more_ids_than_one_chunk(
         self,
         vectorstore: AsyncCockroachDBVectorStore,
+    ) -> None:
+        """Test deleting more IDs than fit in one DELETE statement."""
+        texts = [f"doc {i}" for i in range(1200)]
+        ids = await vectorstore.aadd_texts(texts)
+
+        await vectorstore.adelete(ids[:1100])
+
+        remaining = await vectorstore.asimilarity_search("", k=1200)
+        assert len(remaining) == 100
+
+    async def test_aapply_vector_index(
+        self,
+        cockroachdb_engine: CockroachDBEngine,
+        vector_tables,
+        embeddings_3: FakeEmbeddings,
         sample_texts: list[str],
     ) -> None:
-        """Test creating vector index."""
+        """Test creating vector index and that searches plan through it."""
+        from sqlalchemy import text
+
+        # Own table, so the index doesn't change searches on the shared one
+        vectorstore = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=embeddings_3,
+            collection_name=await vector_tables("test_indexed"),
+        )
         await vectorstore.aadd_texts(sample_texts)
 
         index = CSPANNIndex(
@@ -181,12 +576,56 @@ class TestAsyncCockroachDBVectorStore:
 
         await vectorstore.aapply_vector_index(index)
 
+        query = str(embeddings_3.embed_query("database"))
+        async with cockroachdb_engine.engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "EXPLAIN SELECT id FROM public.test_indexed "
+                    f"ORDER BY embedding <=> '{query}'::VECTOR LIMIT 2"
+                )
+            )
+            plan = "\n".join(row[0] for row in result)
+        assert "test_indexed_embedding_vector_idx" in plan
+
+    async def test_binary_vectors(
+        self, connection_string: str, embeddings_3: FakeEmbeddings
+    ) -> None:
+        """Test insert and search with the binary VECTOR codec."""
+        engine = CockroachDBEngine.from_connection_string(connection_string, binary_vectors=True)
+        try:
+            await engine.ainit_vectorstore_table(
+                table_name="test_binary_vectors",
+                vector_dimension=3,
+                drop_if_exists=True,
+            )
+            vectorstore = AsyncCockroachDBVectorStore(
+                engine=engine,
+                embeddings=embeddings_3,
+                collection_name="test_binary_vectors",
+            )
+
+            await vectorstore.aadd_texts(["first", "second", "third"])
+            results = await vectorstore.asimilarity_search_with_score("query", k=3)
+            mmr_results = await vectorstore.amax_marginal_relevance_search("query", k=2, fetch_k=3)
+
+            assert len(results) == 3
+            assert len(mmr_results) == 2
+        finally:
+            await engine.aclose()
+
     async def test_query_with_beam_size(
         self,
-        vectorstore: AsyncCockroachDBVectorStore,
+        cockroachdb_engine: CockroachDBEngine,
+        vector_tables,
+        embeddings_3: FakeEmbeddings,
         sample_texts: list[str],
     ) -> None:
         """Test query with beam size option."""
+        vectorstore = AsyncCockroachDBVectorStore(
+            engine=cockroachdb_engine,
+            embeddings=embeddings_3,
+            collection_name=await vector_tables("test_beam_size"),
+        )
         await vectorstore.aadd_texts(sample_texts)
 
         index = CSPANNIndex(distance_strategy=DistanceStrategy.COSINE)
@@ -201,6 +640,29 @@ class TestAsyncCockroachDBVectorStore:
 
         assert len(results) <= 3
 
+    async def test_query_options_do_not_leak_to_session(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+    ) -> None:
+        """Test that beam size applies only to the search's own transaction."""
+        from sqlalchemy import text
+
+        await vectorstore.aadd_texts(sample_texts)
+
+        async with vectorstore.engine.engine.connect() as conn:
+            result = await conn.execute(text("SHOW vector_search_beam_size"))
+            default_beam_size = result.scalar()
+
+        await vectorstore.asimilarity_search(
+            "database", k=3, query_options=CSPANNQueryOptions(beam_size=123)
+        )
+
+        # The fixture engine's pool hands the same connection back
+        async with vectorstore.engine.engine.connect() as conn:
+            result = await conn.execute(text("SHOW vector_search_beam_size"))
+            assert result.scalar() == default_beam_size
+
     async def test_amax_marginal_relevance_search(
         self,
         vectorstore: AsyncCockroachDBVectorStore,
@@ -218,28 +680,88 @@ class TestAsyncCockroachDBVectorStore:
 
         assert len(results) <= 3
 
+    async def test_mmr_reuses_stored_embeddings(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+        sample_texts: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that MMR embeds only the query, not each candidate."""
+        await vectorstore.aadd_texts(sample_texts)
+
+        calls = []
+        embed_query = vectorstore._embeddings.aembed_query
+
+        async def counting_embed_query(text: str) -> list[float]:
+            calls.append(text)
+            return await embed_query(text)
+
+        # The embeddings instance is shared by the session, so undo this after the test
+        monkeypatch.setattr(vectorstore._embeddings, "aembed_query", counting_embed_query)
+
+        results = await vectorstore.amax_marginal_relevance_search("database", k=2, fetch_k=5)
+
+        assert len(results) == 2
+        assert calls == ["database"]
+
+    async def test_mmr_large_candidate_set(self, vectorstore: AsyncCockroachDBVectorStore) -> None:
+        """Test MMR over enough candidates to be reranked in a worker thread."""
+        texts = [f"Document {i}" for i in range(300)]
+        await vectorstore.aadd_texts(texts)
+
+        results = await vectorstore.amax_marginal_relevance_search("query", k=5, fetch_k=300)
+
+        assert len(results) == 5
+        assert len({doc.page_content for doc in results}) == 5
+
     async def test_batch_insert_with_custom_batch_size(
         self,
         vectorstore: AsyncCockroachDBVectorStore,
     ) -> None:
-        """Test batch insert with custom batch size."""
+        """Test that a custom batch size splits the load into that many INSERTs."""
+        from unittest.mock import AsyncMock
+
+        spy = AsyncMock(wraps=vectorstore._insert_batch)
+        vectorstore._insert_batch = spy  # type: ignore[method-assign]
         texts = [f"text_{i}" for i in range(250)]
 
         ids = await vectorstore.aadd_texts(texts, batch_size=50)
 
         assert len(ids) == 250
+        assert spy.await_count == len(texts) // 50
+
+    async def test_large_batch_uses_single_statement(
+        self,
+        vectorstore: AsyncCockroachDBVectorStore,
+    ) -> None:
+        """Test that a large load issues one INSERT per batch within the bind limit."""
+        import math
+        from unittest.mock import AsyncMock
+
+        spy = AsyncMock(wraps=vectorstore._aexecute_with_retry)
+        vectorstore._aexecute_with_retry = spy
+        texts = [f"text_{i}" for i in range(5000)]
+
+        ids = await vectorstore.aadd_texts(texts, batch_size=1000)
+
+        assert len(ids) == 5000
+        assert spy.await_count <= math.ceil(len(texts) / 1000)
+        for call in spy.await_args_list:
+            _, params_list = call.args
+            assert len(params_list) == 1
+            # PostgreSQL's wire protocol caps a statement at 65535 bind parameters
+            assert len(params_list[0]) <= 65535
 
     async def test_afrom_texts(
         self,
         cockroachdb_engine: CockroachDBEngine,
+        embeddings_3: FakeEmbeddings,
         sample_texts: list[str],
     ) -> None:
         """Test creating vectorstore from texts."""
-        embeddings = FakeEmbeddings()
-
         vectorstore = await AsyncCockroachDBVectorStore.afrom_texts(
             texts=sample_texts,
-            embedding=embeddings,
+            embedding=embeddings_3,
             engine=cockroachdb_engine,
             collection_name="from_texts_test",
         )
@@ -249,35 +771,49 @@ class TestAsyncCockroachDBVectorStore:
         results = await vectorstore.asimilarity_search("database", k=3)
         assert len(results) <= 3
 
+    async def test_afrom_texts_warmup(
+        self, connection_string: str, embeddings_3: FakeEmbeddings, sample_texts: list[str]
+    ) -> None:
+        """Test that warmup leaves the pool full of idle connections."""
+        engine = CockroachDBEngine.from_connection_string(
+            connection_string, pool_size=3, max_overflow=0
+        )
+
+        await AsyncCockroachDBVectorStore.afrom_texts(
+            texts=sample_texts,
+            embedding=embeddings_3,
+            engine=engine,
+            collection_name="from_texts_warmup_test",
+            warmup=True,
+        )
+
+        assert engine.engine.pool.checkedin() == 3
+        await engine.aclose()
+
     async def test_multiple_distance_strategies(
         self,
         cockroachdb_engine: CockroachDBEngine,
+        vector_tables,
+        embeddings_3: FakeEmbeddings,
         sample_texts: list[str],
     ) -> None:
-        """Test different distance strategies."""
-        embeddings = FakeEmbeddings()
-
-        for strategy in [
-            DistanceStrategy.COSINE,
-            DistanceStrategy.EUCLIDEAN,
-            DistanceStrategy.INNER_PRODUCT,
-        ]:
-            collection_name = f"test_{strategy.value}"
-
-            await cockroachdb_engine.ainit_vectorstore_table(
-                table_name=collection_name,
-                vector_dimension=3,
-                drop_if_exists=True,
-            )
+        """Test different distance strategies, each on its own table, concurrently."""
 
+        async def run(strategy: DistanceStrategy) -> list:
             vectorstore = AsyncCockroachDBVectorStore(
                 engine=cockroachdb_engine,
-                embeddings=embeddings,
-                collection_name=collection_name,
+                embeddings=embeddings_3,
+                collection_name=await vector_tables(f"test_{strategy.value}"),
                 distance_strategy=strategy,
             )
-
             await vectorstore.aadd_texts(sample_texts)
+            return await vectorstore.asimilarity_search("database", k=3)
+
+        strategies = [
+            DistanceStrategy.COSINE,
+            DistanceStrategy.EUCLIDEAN,
+            DistanceStrategy.INNER_PRODUCT,
+        ]
+        results = await asyncio.gather(*[run(strategy) for strategy in strategies])
 
-            results = await vectorstore.asimilarity_search("database", k=3)
-            assert len(results) <= 3
+        assert all(0 < len(docs) <= 3 for docs in results)
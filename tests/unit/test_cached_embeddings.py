@@ -0,0 +1,141 @@
+"""Unit tests for the cached embeddings wrapper."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from langchain_cockroachdb.cached_embeddings import CachedEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """Fake embeddings that record which texts were embedded."""
+
+    def __init__(self) -> None:
+        self.document_calls: list[list[str]] = []
+        self.query_calls: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents as [len, 0]."""
+        self.document_calls.append(list(texts))
+        return [[float(len(text)), 0.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query as [len, 1]."""
+        self.query_calls.append(text)
+        return [float(len(text)), 1.0]
+
+
+class TestCachedEmbeddings:
+    """Test CachedEmbeddings behavior."""
+
+    def test_documents_embedded_once(self) -> None:
+        """Test that only uncached, unique texts reach the wrapped model."""
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner)
+
+        first = embeddings.embed_documents(["a", "bb", "a"])
+        second = embeddings.embed_documents(["bb", "ccc"])
+
+        assert first == [[1.0, 0.0], [2.0, 0.0], [1.0, 0.0]]
+        assert second == [[2.0, 0.0], [3.0, 0.0]]
+        assert inner.document_calls == [["a", "bb"], ["ccc"]]
+
+    def test_query_cache_is_separate(self) -> None:
+        """Test that query and document vectors are cached separately."""
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner)
+
+        embeddings.embed_documents(["a"])
+        assert embeddings.embed_query("a") == [1.0, 1.0]
+        assert embeddings.embed_query("a") == [1.0, 1.0]
+        assert inner.query_calls == ["a"]
+
+    async def test_async_methods_use_cache(self) -> None:
+        """Test that async methods share the sync caches."""
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner)
+
+        embeddings.embed_documents(["a"])
+        assert await embeddings.aembed_documents(["a", "bb"]) == [[1.0, 0.0], [2.0, 0.0]]
+        await embeddings.aembed_query("q")
+        await embeddings.aembed_query("q")
+
+        assert inner.document_calls == [["a"], ["bb"]]
+        assert inner.query_calls == ["q"]
+
+    def test_returned_vectors_are_copies(self) -> None:
+        """Test that mutating a result does not corrupt the cache."""
+        embeddings = CachedEmbeddings(CountingEmbeddings())
+
+        embeddings.embed_query("a")[0] = 99.0
+        assert embeddings.embed_query("a") == [1.0, 1.0]
+
+    def test_lru_eviction(self) -> None:
+        """Test that least recently used texts are evicted."""
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner, maxsize=2)
+
+        embeddings.embed_documents(["a", "bb"])
+        embeddings.embed_documents(["a"])
+        embeddings.embed_documents(["ccc"])
+        embeddings.embed_documents(["a", "bb"])
+
+        assert inner.document_calls == [["a", "bb"], ["ccc"], ["bb"]]
+        assert embeddings.cache_info()["documents"] == 2
+
+    def test_clear(self) -> None:
+        """Test clearing cached vectors."""
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner)
+
+        embeddings.embed_query("a")
+        embeddings.clear()
+        embeddings.embed_query("a")
+
+        assert inner.query_calls == ["a", "a"]
+
+    def test_invalid_maxsize(self) -> None:
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError, match="maxsize"):
+            CachedEmbeddings(CountingEmbeddings(), maxsize=0)
+
+
+class TestPersistentCachedEmbeddings:
+    """Test the SQLite tier of CachedEmbeddings."""
+
+    def test_vectors_survive_new_instance(self, tmp_path) -> None:
+        """Test that a new wrapper reads vectors persisted by an earlier one."""
+        path = str(tmp_path / "embeddings.sqlite")
+        first = CachedEmbeddings(CountingEmbeddings(), persist_path=path)
+        first.embed_documents(["a", "bb"])
+        first.embed_query("q")
+        first.close()
+
+        inner = CountingEmbeddings()
+        second = CachedEmbeddings(inner, persist_path=path)
+
+        assert second.embed_documents(["bb", "a", "ccc"]) == [[2.0, 0.0], [1.0, 0.0], [3.0, 0.0]]
+        assert second.embed_query("q") == [1.0, 1.0]
+        assert inner.document_calls == [["ccc"]]
+        assert inner.query_calls == []
+
+    def test_namespaces_are_separate(self, tmp_path) -> None:
+        """Test that models sharing a file don't read each other's vectors."""
+        path = str(tmp_path / "embeddings.sqlite")
+        CachedEmbeddings(CountingEmbeddings(), persist_path=path, namespace="m1").embed_query("q")
+
+        inner = CountingEmbeddings()
+        CachedEmbeddings(inner, persist_path=path, namespace="m2").embed_query("q")
+
+        assert inner.query_calls == ["q"]
+
+    def test_clear_drops_persisted_vectors(self, tmp_path) -> None:
+        """Test that clear also removes this namespace's persisted vectors."""
+        path = str(tmp_path / "embeddings.sqlite")
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner, persist_path=path)
+
+        embeddings.embed_documents(["a"])
+        embeddings.clear()
+        embeddings.embed_documents(["a"])
+
+        assert inner.document_calls == [["a"], ["a"]]
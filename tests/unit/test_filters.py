@@ -0,0 +1,126 @@
+"""Unit tests for metadata filter compilation."""
+
+import pytest
+
+from langchain_cockroachdb.filters import _render_filter, compile_filter
+
+
+class TestCompileFilter:
+    """Test compiling metadata filters to parameterized SQL."""
+
+    def test_simple_equality(self) -> None:
+        """Test that plain values compile to a bound JSONB equality."""
+        sql, params = compile_filter({"lang": "python"})
+
+        assert sql == "metadata->CAST(:f_0 AS STRING) = CAST(:f_1 AS JSONB)"
+        assert params == {"f_0": "lang", "f_1": '"python"'}
+
+    def test_non_string_equality(self) -> None:
+        """Test that numbers and booleans are bound as JSON."""
+        sql, params = compile_filter({"year": 2024, "published": True})
+
+        assert sql == (
+            "metadata->CAST(:f_0 AS STRING) = CAST(:f_1 AS JSONB) AND "
+            "metadata->CAST(:f_2 AS STRING) = CAST(:f_3 AS JSONB)"
+        )
+        assert params == {"f_0": "year", "f_1": "2024", "f_2": "published", "f_3": "true"}
+
+    @pytest.mark.parametrize(
+        ("op", "sql_op"),
+        [("$gt", ">"), ("$gte", ">="), ("$lt", "<"), ("$lte", "<=")],
+    )
+    def test_numeric_comparison(self, op: str, sql_op: str) -> None:
+        """Test numeric comparison operators."""
+        sql, params = compile_filter({"year": {op: 2024}})
+
+        assert sql == (
+            f"CAST(metadata->CAST(:f_0 AS STRING) AS NUMERIC) {sql_op} CAST(:f_1 AS NUMERIC)"
+        )
+        assert params == {"f_0": "year", "f_1": 2024}
+
+    def test_ne(self) -> None:
+        """Test the not-equal operator."""
+        sql, params = compile_filter({"lang": {"$ne": "go"}})
+
+        assert sql == "metadata->CAST(:f_0 AS STRING) != CAST(:f_1 AS JSONB)"
+        assert params == {"f_0": "lang", "f_1": '"go"'}
+
+    def test_in_and_nin(self) -> None:
+        """Test list operators bind one parameter per element."""
+        sql, params = compile_filter({"lang": {"$in": ["python", "go"]}})
+        assert sql == (
+            "metadata->CAST(:f_0 AS STRING) IN (CAST(:f_1 AS JSONB), CAST(:f_2 AS JSONB))"
+        )
+        assert params == {"f_0": "lang", "f_1": '"python"', "f_2": '"go"'}
+
+        sql, params = compile_filter({"page": {"$nin": [1]}})
+        assert sql == "metadata->CAST(:f_0 AS STRING) NOT IN (CAST(:f_1 AS JSONB))"
+        assert params == {"f_0": "page", "f_1": "1"}
+
+    def test_empty_in_list(self) -> None:
+        """Test that empty lists compile to constant conditions."""
+        assert compile_filter({"lang": {"$in": []}}) == ("false", {})
+        assert compile_filter({"lang": {"$nin": []}}) == ("true", {})
+
+    def test_nested_logical_operators(self) -> None:
+        """Test nested $and/$or filters number parameters in order."""
+        sql, params = compile_filter(
+            {
+                "$and": [
+                    {"year": 2024},
+                    {"$or": [{"lang": "python"}, {"lang": "go"}]},
+                ]
+            }
+        )
+
+        assert sql == (
+            "(metadata->CAST(:f_0 AS STRING) = CAST(:f_1 AS JSONB) AND "
+            "(metadata->CAST(:f_2 AS STRING) = CAST(:f_3 AS JSONB) OR "
+            "metadata->CAST(:f_4 AS STRING) = CAST(:f_5 AS JSONB)))"
+        )
+        assert params == {
+            "f_0": "year",
+            "f_1": "2024",
+            "f_2": "lang",
+            "f_3": '"python"',
+            "f_4": "lang",
+            "f_5": '"go"',
+        }
+
+    def test_column_and_prefix(self) -> None:
+        """Test custom metadata column and parameter prefix."""
+        sql, params = compile_filter({"a": 1}, metadata_column="meta", prefix="f3")
+
+        assert sql == "meta->CAST(:f3_0 AS STRING) = CAST(:f3_1 AS JSONB)"
+        assert params == {"f3_0": "a", "f3_1": "1"}
+
+    def test_values_do_not_reach_sql(self) -> None:
+        """Test that values are bound, not interpolated."""
+        sql, params = compile_filter({"name": "x' OR '1'='1"})
+
+        assert "OR" not in sql
+        assert params == {"f_0": "name", "f_1": "\"x' OR '1'='1\""}
+
+    def test_keys_do_not_reach_sql(self) -> None:
+        """Test that metadata keys are bound, not interpolated."""
+        sql, params = compile_filter({"a' = 'a' OR 'x:y": 1})
+
+        assert "OR" not in sql
+        assert ":y" not in sql
+        assert params["f_0"] == "a' = 'a' OR 'x:y"
+
+    def test_same_shape_reuses_template(self) -> None:
+        """Test that filters differing only in keys and values share one rendering."""
+        _render_filter.cache_clear()
+
+        sql_a, params_a = compile_filter({"year": {"$gte": 2020}, "lang": "python"})
+        sql_b, params_b = compile_filter({"page": {"$gte": 2024}, "author": "go"})
+
+        assert sql_a == sql_b
+        assert params_a != params_b
+        assert _render_filter.cache_info().hits == 1
+
+    def test_unsupported_operator(self) -> None:
+        """Test that unknown operators raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported operator"):
+            compile_filter({"a": {"$regex": "x"}})
@@ -1,5 +1,6 @@
 """Unit tests for hybrid search configuration."""
 
+import numpy as np
 import pytest
 
 from langchain_cockroachdb.hybrid_search_config import FusionType, HybridSearchConfig
@@ -65,6 +66,18 @@ class TestHybridSearchConfig:
         doc_ids = {doc_id for doc_id, _ in fused}
         assert doc_ids == {"doc1", "doc2", "doc3", "doc4"}
 
+    def test_weighted_sum_fusion_ordering(self) -> None:
+        """Test that weighted sum fusion sorts by fused score descending."""
+        config = HybridSearchConfig(fts_weight=0.5, vector_weight=0.5)
+
+        fts_results = [("doc1", 0.2), ("doc2", 1.0)]
+        vector_results = [("doc1", 0.4), ("doc3", 0.9)]
+
+        fused = config.fuse_scores(fts_results, vector_results)
+
+        assert [doc_id for doc_id, _ in fused] == ["doc2", "doc3", "doc1"]
+        assert all(isinstance(score, float) for _, score in fused)
+
     def test_rrf_fusion(self) -> None:
         """Test reciprocal rank fusion."""
         config = HybridSearchConfig(
@@ -100,6 +113,34 @@ class TestHybridSearchConfig:
         assert fused[0][0] == "doc1"
         assert fused[0][1] > fused[1][1]
 
+    def test_rrf_fusion_matches_reference(self) -> None:
+        """Test vectorized RRF against the per-id formula on larger lists."""
+        config = HybridSearchConfig(
+            fts_weight=0.3,
+            vector_weight=0.7,
+            fusion_type=FusionType.RRF,
+            k=10,
+        )
+
+        fts_results = [(f"doc{i}", 1.0) for i in range(0, 300, 2)]
+        vector_results = [(f"doc{i}", 1.0) for i in range(0, 300, 3)]
+
+        fused = dict(config.fuse_scores(fts_results, vector_results))
+
+        fts_ranks = {doc_id: rank for rank, (doc_id, _) in enumerate(fts_results, 1)}
+        vector_ranks = {doc_id: rank for rank, (doc_id, _) in enumerate(vector_results, 1)}
+        assert fused.keys() == fts_ranks.keys() | vector_ranks.keys()
+        for doc_id, score in fused.items():
+            expected = 0.0
+            if doc_id in fts_ranks:
+                expected += 0.3 / (10 + fts_ranks[doc_id])
+            if doc_id in vector_ranks:
+                expected += 0.7 / (10 + vector_ranks[doc_id])
+            assert score == pytest.approx(expected)
+
+        scores = list(fused.values())
+        assert scores == sorted(scores, reverse=True)
+
     def test_empty_results(self) -> None:
         """Test fusion with empty results."""
         config = HybridSearchConfig()
@@ -111,3 +152,107 @@ class TestHybridSearchConfig:
 
         vector_results = [("doc2", 0.9)]
         assert len(config.fuse_scores([], vector_results)) == 1
+
+    @pytest.mark.parametrize("fusion_type", [FusionType.WEIGHTED_SUM, FusionType.RRF])
+    @pytest.mark.parametrize("limit", [1, 7, 150, 1000])
+    def test_limit_matches_truncated_full_ranking(
+        self, fusion_type: FusionType, limit: int
+    ) -> None:
+        """Test that a limit keeps exactly the head of the full ranking, ties included."""
+        config = HybridSearchConfig(fusion_type=fusion_type)
+        rng = np.random.default_rng(0)
+        # Coarse scores so that many results tie
+        fts_results = [(f"doc{i}", float(rng.integers(0, 5))) for i in range(0, 300, 2)]
+        vector_results = [(f"doc{i}", float(rng.integers(0, 5))) for i in range(0, 300, 3)]
+
+        full = config.fuse_scores(fts_results, vector_results)
+        assert config.fuse_scores(fts_results, vector_results, limit=limit) == full[:limit]
+
+        one_sided = config.fuse_scores(fts_results, [])
+        assert config.fuse_scores(fts_results, [], limit=limit) == one_sided[:limit]
+
+    @pytest.mark.parametrize("fusion_type", [FusionType.WEIGHTED_SUM, FusionType.RRF])
+    def test_one_sided_fusion_matches_array_path(self, fusion_type: FusionType) -> None:
+        """Test that the empty-side shortcut scores and orders like the array path."""
+        config = HybridSearchConfig(fts_weight=0.3, vector_weight=0.7, fusion_type=fusion_type)
+        results = [("doc1", 0.4), ("doc2", 0.9), ("doc3", 0.9), ("doc1", 0.6)]
+        no_ids = np.array([], dtype=object)
+        no_scores = np.array([], dtype=np.float64)
+        ids = np.array([doc_id for doc_id, _ in results], dtype=object)
+        scores = np.array([score for _, score in results], dtype=np.float64)
+
+        for fused, (expected_ids, expected_scores) in (
+            (
+                config.fuse_scores(results, []),
+                config.fuse_scores_soa(ids, scores, no_ids, no_scores),
+            ),
+            (
+                config.fuse_scores([], results),
+                config.fuse_scores_soa(no_ids, no_scores, ids, scores),
+            ),
+        ):
+            assert [doc_id for doc_id, _ in fused] == expected_ids.tolist()
+            assert [score for _, score in fused] == pytest.approx(expected_scores.tolist())
+
+    @pytest.mark.parametrize("fusion_type", [FusionType.WEIGHTED_SUM, FusionType.RRF])
+    def test_fuse_scores_soa_matches_fuse_scores(self, fusion_type: FusionType) -> None:
+        """Test that array inputs give the same ranking as list inputs, with limit."""
+        config = HybridSearchConfig(fusion_type=fusion_type)
+        fts_results = [("doc1", 0.9), ("doc2", 0.5), ("doc3", 0.5)]
+        vector_results = [("doc3", 0.8), ("doc4", 0.7), ("doc1", 0.1)]
+
+        ids, scores = config.fuse_scores_soa(
+            np.array([doc_id for doc_id, _ in fts_results]),
+            np.array([score for _, score in fts_results], dtype=np.float32),
+            np.array([doc_id for doc_id, _ in vector_results]),
+            np.array([score for _, score in vector_results], dtype=np.float32),
+            limit=3,
+        )
+
+        expected = config.fuse_scores(fts_results, vector_results)[:3]
+        assert ids.tolist() == [doc_id for doc_id, _ in expected]
+        np.testing.assert_allclose(scores, [score for _, score in expected], rtol=1e-6)
+
+
+class TestBuildFusionSql:
+    """Test server-side fusion SQL generation."""
+
+    FTS_SQL = "SELECT id, ts_rank(content_tsvector, q) AS score FROM t, q"
+    VECTOR_SQL = "SELECT id, 1 - (embedding <=> CAST(:q AS VECTOR)) AS score FROM t"
+
+    def test_weighted_sum_sql(self) -> None:
+        """Test that weighted sum fusion binds weights and joins both searches."""
+        config = HybridSearchConfig(fts_weight=0.3, vector_weight=0.7)
+
+        sql, params = config.build_fusion_sql(self.FTS_SQL, self.VECTOR_SQL, 5)
+
+        assert f"WITH fts AS ({self.FTS_SQL})" in sql
+        assert f"vec AS ({self.VECTOR_SQL})" in sql
+        assert "FULL OUTER JOIN vec_ranked" in sql
+        assert "COALESCE(CAST(f.score AS FLOAT8), 0)" in sql
+        assert "LIMIT :fusion_limit" in sql
+        assert params == {
+            "fusion_fts_weight": 0.3,
+            "fusion_vector_weight": 0.7,
+            "fusion_limit": 5,
+        }
+
+    def test_rrf_sql(self) -> None:
+        """Test that RRF fusion scores by rank and binds k."""
+        config = HybridSearchConfig(fusion_type=FusionType.RRF, k=40)
+
+        sql, params = config.build_fusion_sql(self.FTS_SQL, self.VECTOR_SQL, 10)
+
+        assert "ROW_NUMBER() OVER (ORDER BY score DESC)" in sql
+        assert "CAST(f.rank AS FLOAT8)" in sql
+        assert params["fusion_k"] == 40
+        assert params["fusion_limit"] == 10
+
+    def test_weights_not_inlined(self) -> None:
+        """Test that weights reach the database only as bind parameters."""
+        config = HybridSearchConfig(fts_weight=0.25, vector_weight=0.75)
+
+        sql, _ = config.build_fusion_sql(self.FTS_SQL, self.VECTOR_SQL, 3)
+
+        assert "0.25" not in sql
+        assert "0.75" not in sql
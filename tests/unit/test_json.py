@@ -0,0 +1,24 @@
+"""Unit tests for the JSON helpers."""
+
+from langchain_cockroachdb import _json
+
+
+class TestJson:
+    """Test JSON encode/decode helpers."""
+
+    def test_round_trip(self) -> None:
+        """Test that dumps output decodes back to the same object."""
+        obj = {"source": "doc", "page": 3, "tags": ["a", "é"], "score": 0.5}
+
+        encoded = _json.dumps(obj)
+
+        assert isinstance(encoded, str)
+        assert _json.loads(encoded) == obj
+
+    def test_loads_bytes(self) -> None:
+        """Test that raw bytes from the driver are accepted."""
+        assert _json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_dumps_non_string_keys(self) -> None:
+        """Test that non-string keys are stringified like the stdlib does."""
+        assert _json.loads(_json.dumps({1: "a"})) == {"1": "a"}
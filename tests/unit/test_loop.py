@@ -0,0 +1,120 @@
+"""Unit tests for the background event loop used by sync wrappers."""
+
+import asyncio
+
+import pytest
+
+from langchain_cockroachdb._loop import iterate_sync, run_sync
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+class TestIterateSync:
+    """Test draining async generators from sync code."""
+
+    def test_yields_items_in_order(self) -> None:
+        """Test that every item is yielded, fetched on the background loop."""
+        loops = []
+
+        async def numbers():
+            for i in range(3):
+                loops.append(asyncio.get_running_loop())
+                yield i
+
+        assert list(iterate_sync(numbers())) == [0, 1, 2]
+        assert loops[0] is run_sync(_current_loop())
+
+    def test_early_stop_closes_generator(self) -> None:
+        """Test that breaking out of the loop runs the generator's cleanup."""
+        closed = []
+
+        async def numbers():
+            try:
+                for i in range(10):
+                    yield i
+            finally:
+                closed.append(True)
+
+        for item in iterate_sync(numbers()):
+            if item == 1:
+                break
+
+        assert closed == [True]
+
+
+class TestRunSync:
+    """Test running coroutines from sync code."""
+
+    def test_returns_result(self) -> None:
+        """Test that the coroutine's result is returned."""
+
+        async def add(a: int, b: int) -> int:
+            await asyncio.sleep(0)
+            return a + b
+
+        assert run_sync(add(1, 2)) == 3
+
+    def test_reuses_one_loop(self) -> None:
+        """Test that every call runs on the same persistent loop."""
+        first = run_sync(_current_loop())
+        second = run_sync(_current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+    def test_propagates_exceptions(self) -> None:
+        """Test that exceptions raised by the coroutine reach the caller."""
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(fail())
+
+    def test_works_inside_running_loop(self) -> None:
+        """Test that sync wrappers can be called while another loop runs."""
+
+        async def caller() -> int:
+            return run_sync(asyncio.sleep(0, result=7))
+
+        assert asyncio.run(caller()) == 7
+
+    def test_rejects_reentrant_call(self) -> None:
+        """Test that calling back in from the background loop fails fast."""
+
+        async def reenter() -> None:
+            run_sync(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="background event loop"):
+            run_sync(reenter())
+
+
+class TestVectorStoreSyncWrappers:
+    """Test that the sync vector store dispatches to the shared loop."""
+
+    def test_sync_calls_share_background_loop(self) -> None:
+        """Test that repeated sync searches run on one long-lived loop thread."""
+        from langchain_core.embeddings import FakeEmbeddings
+
+        from langchain_cockroachdb.engine import CockroachDBEngine
+        from langchain_cockroachdb.vectorstores import CockroachDBVectorStore
+
+        engine = CockroachDBEngine.from_connection_string(
+            "cockroachdb://root@localhost:26257/defaultdb"
+        )
+        store = CockroachDBVectorStore(
+            engine=engine, embeddings=FakeEmbeddings(size=3), collection_name="docs"
+        )
+        loops = []
+
+        async def fake_search(*args: object, **kwargs: object) -> list:
+            loops.append(asyncio.get_running_loop())
+            return []
+
+        store.asimilarity_search = fake_search  # type: ignore[method-assign]
+
+        assert store.similarity_search("a") == []
+        assert store.similarity_search("b") == []
+        assert loops[0] is loops[1] is run_sync(_current_loop())
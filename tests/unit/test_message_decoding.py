@@ -0,0 +1,48 @@
+"""Unit tests for stored chat message decoding."""
+
+from langchain_core.messages import (
+    AIMessage,
+    ChatMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    messages_to_dict,
+)
+
+from langchain_cockroachdb._json import dumps as json_dumps
+from langchain_cockroachdb.chat_message_histories import _message_from_dict
+
+
+class TestMessageFromDict:
+    """Test the message decoding fast path."""
+
+    def test_common_types_round_trip(self) -> None:
+        """Test that fast-path types decode to equal messages."""
+        messages = [
+            HumanMessage(content="hi", id="1"),
+            AIMessage(content="hello", additional_kwargs={"x": 1}),
+            SystemMessage(content="be brief"),
+            ToolMessage(content="42", tool_call_id="call_1"),
+        ]
+
+        decoded = [_message_from_dict(item) for item in messages_to_dict(messages)]
+
+        assert decoded == messages
+        assert [type(m) for m in decoded] == [type(m) for m in messages]
+
+    def test_other_types_fall_back(self) -> None:
+        """Test that types outside the fast map use the generic decoder."""
+        message = ChatMessage(content="hey", role="user")
+
+        decoded = _message_from_dict(messages_to_dict([message])[0])
+
+        assert isinstance(decoded, ChatMessage)
+        assert decoded == message
+
+    def test_text_row_decoded(self) -> None:
+        """Test that JSONB returned as text by the driver is parsed first."""
+        message = HumanMessage(content="hi", id="1")
+
+        decoded = _message_from_dict(json_dumps(messages_to_dict([message])[0]))
+
+        assert decoded == message
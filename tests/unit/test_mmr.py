@@ -0,0 +1,65 @@
+"""Unit tests for maximal marginal relevance selection."""
+
+import numpy as np
+
+from langchain_cockroachdb.mmr import maximal_marginal_relevance
+
+
+def _reference_mmr(query, candidates, k, lambda_mult):
+    """Straightforward per-candidate MMR loop used as the oracle."""
+    selected = [0]
+    while len(selected) < min(k, len(candidates)):
+        best_score, best_idx = -float("inf"), -1
+        for i, vec in enumerate(candidates):
+            if i in selected:
+                continue
+            relevance = np.dot(query, vec)
+            redundancy = max(np.dot(vec, candidates[j]) for j in selected)
+            score = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+            if score > best_score:
+                best_score, best_idx = score, i
+        selected.append(best_idx)
+    return selected
+
+
+class TestMaximalMarginalRelevance:
+    """Test vectorized MMR selection."""
+
+    def test_matches_reference_loop(self) -> None:
+        """Test that selections match the per-candidate loop."""
+        rng = np.random.default_rng(0)
+        query = rng.standard_normal(16).astype(np.float32)
+        candidates = rng.standard_normal((50, 16)).astype(np.float32)
+
+        for lambda_mult in (0.0, 0.3, 0.5, 1.0):
+            assert maximal_marginal_relevance(
+                query, candidates, k=10, lambda_mult=lambda_mult
+            ) == _reference_mmr(query, candidates, 10, lambda_mult)
+
+    def test_gram_path_matches_reference_loop(self) -> None:
+        """Test selections when k is large enough to use the Gram matrix."""
+        rng = np.random.default_rng(1)
+        query = rng.standard_normal(8).astype(np.float32)
+        candidates = rng.standard_normal((12, 8)).astype(np.float32)
+
+        for k in (4, 12):
+            assert maximal_marginal_relevance(
+                query, candidates, k=k, lambda_mult=0.5
+            ) == _reference_mmr(query, candidates, k, 0.5)
+
+    def test_prefers_diverse_candidates(self) -> None:
+        """Test that a near-duplicate of the first pick is skipped."""
+        query = [1.0, 0.0]
+        candidates = [[1.0, 0.0], [0.99, 0.01], [0.0, 1.0]]
+
+        assert maximal_marginal_relevance(query, candidates, k=2, lambda_mult=0.3) == [0, 2]
+
+    def test_k_larger_than_candidates(self) -> None:
+        """Test that every candidate is returned once when k exceeds n."""
+        selected = maximal_marginal_relevance([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0]], k=5)
+
+        assert sorted(selected) == [0, 1]
+
+    def test_empty_candidates(self) -> None:
+        """Test that no candidates yields no selection."""
+        assert maximal_marginal_relevance([1.0, 0.0], np.empty((0, 2)), k=3) == []
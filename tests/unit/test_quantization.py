@@ -0,0 +1,96 @@
+"""Unit tests for embedding quantization helpers."""
+
+import numpy as np
+import pytest
+
+from langchain_cockroachdb.indexes import DistanceStrategy
+from langchain_cockroachdb.quantization import (
+    QuantizationType,
+    dequantize_int8,
+    int8_distances,
+    quantize_int8,
+)
+
+
+class TestQuantizationType:
+    """Test QuantizationType enum."""
+
+    def test_values(self) -> None:
+        """Test enum values and string construction."""
+        assert QuantizationType("none") == QuantizationType.NONE
+        assert QuantizationType("int8") == QuantizationType.INT8
+
+
+class TestInt8Quantization:
+    """Test int8 scalar quantization."""
+
+    def test_round_trip(self) -> None:
+        """Test that dequantized vectors approximate the input."""
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((16, 64)).astype(np.float32)
+
+        codes, scales = quantize_int8(vectors)
+
+        assert codes.dtype == np.int8
+        assert codes.shape == vectors.shape
+        assert scales.shape == (16,)
+        restored = dequantize_int8(codes, scales)
+        assert np.all(np.abs(restored - vectors) <= scales[:, None] / 2 + 1e-6)
+
+    def test_max_abs_maps_to_127(self) -> None:
+        """Test that the largest component uses the full int8 range."""
+        codes, scales = quantize_int8(np.array([[0.5, -2.0, 1.0]]))
+
+        assert codes.tolist() == [[32, -127, 64]]
+        assert np.isclose(scales[0], 2.0 / 127)
+
+    def test_single_vector(self) -> None:
+        """Test quantizing a 1-d vector."""
+        codes, scales = quantize_int8(np.array([1.0, -1.0]))
+
+        assert codes.tolist() == [127, -127]
+        assert scales.shape == ()
+
+    def test_zero_vector(self) -> None:
+        """Test that an all-zero vector does not divide by zero."""
+        codes, scales = quantize_int8(np.zeros((1, 4)))
+
+        assert codes.tolist() == [[0, 0, 0, 0]]
+        assert scales[0] == 1.0
+
+
+class TestInt8Distances:
+    """Test approximate distances on int8 codes."""
+
+    def _exact(self, query: np.ndarray, vectors: np.ndarray, strategy: DistanceStrategy):
+        dots = vectors @ query
+        if strategy == DistanceStrategy.INNER_PRODUCT:
+            return -dots
+        if strategy == DistanceStrategy.EUCLIDEAN:
+            return np.linalg.norm(vectors - query, axis=1)
+        return 1 - dots / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+
+    @pytest.mark.parametrize("strategy", list(DistanceStrategy))
+    def test_approximates_exact_distances(self, strategy: DistanceStrategy) -> None:
+        """Test that int8 distances track float distances and their ranking."""
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((200, 64)).astype(np.float32)
+        query = rng.standard_normal(64).astype(np.float32)
+
+        codes, scales = quantize_int8(vectors)
+        norms = np.linalg.norm(vectors, axis=1)
+        approx = int8_distances(query, codes, scales, norms, strategy)
+        exact = self._exact(query, vectors, strategy)
+
+        assert approx.shape == (200,)
+        assert np.corrcoef(approx, exact)[0, 1] > 0.999
+        # The true nearest neighbour is among the approximate top 5
+        assert np.argmin(exact) in np.argsort(approx)[:5]
+
+    def test_zero_query_cosine(self) -> None:
+        """Test that a zero query does not divide by zero."""
+        codes, scales = quantize_int8(np.eye(3, dtype=np.float32))
+
+        distances = int8_distances(np.zeros(3), codes, scales, np.ones(3), DistanceStrategy.COSINE)
+
+        assert np.all(np.isfinite(distances))
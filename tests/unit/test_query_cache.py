@@ -0,0 +1,124 @@
+"""Unit tests for the query result cache."""
+
+import pytest
+
+from langchain_cockroachdb.query_cache import QueryCache
+
+
+class TestQueryCache:
+    """Test QueryCache behavior."""
+
+    def test_miss_then_hit(self) -> None:
+        """Test that a stored value is returned on the next lookup."""
+        cache = QueryCache(max_size=10)
+        key = cache.make_key([0.1, 0.2], None, 4)
+
+        assert cache.get(key) is None
+        cache.put(key, ["result"])
+        assert cache.get(key) == ["result"]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_key_rounding(self) -> None:
+        """Test that embeddings differing below the precision share a key."""
+        cache = QueryCache(precision=4)
+        assert cache.make_key([0.12341], None, 4) == cache.make_key([0.12339], None, 4)
+        assert cache.make_key([0.1234], None, 4) != cache.make_key([0.1235], None, 4)
+
+    def test_key_includes_filter_and_k(self) -> None:
+        """Test that filter, k and extra options are part of the key."""
+        cache = QueryCache()
+        base = cache.make_key([1.0], {"a": 1, "b": 2}, 4)
+
+        assert base == cache.make_key([1.0], {"b": 2, "a": 1}, 4)
+        assert base != cache.make_key([1.0], {"a": 2}, 4)
+        assert base != cache.make_key([1.0], {"a": 1, "b": 2}, 5)
+        assert base != cache.make_key([1.0], {"a": 1, "b": 2}, 4, 64)
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = QueryCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that entries expire after the TTL."""
+        now = [100.0]
+        monkeypatch.setattr("langchain_cockroachdb.query_cache.time.monotonic", lambda: now[0])
+
+        cache = QueryCache(ttl=10.0)
+        cache.put("a", 1)
+        now[0] += 5.0
+        assert cache.get("a") == 1
+        now[0] += 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["size"] == 0
+
+    def test_clear(self) -> None:
+        """Test clearing the cache."""
+        cache = QueryCache()
+        cache.put("a", 1)
+        cache.clear()
+
+        assert cache.get("a") is None
+
+    def test_speculative_miss_not_counted(self) -> None:
+        """Test that record_miss=False lookups leave the miss counter alone."""
+        cache = QueryCache()
+
+        assert cache.get("a", record_miss=False) is None
+        assert cache.stats()["misses"] == 0
+
+        cache.put("a", 1)
+        assert cache.get("a", record_miss=False) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_invalid_max_size(self) -> None:
+        """Test that a non-positive max_size is rejected."""
+        with pytest.raises(ValueError, match="max_size"):
+            QueryCache(max_size=0)
+
+
+class TestSyncCachedSearch:
+    """Test that the sync store answers fully cached queries directly."""
+
+    def test_hit_skips_async_search(self) -> None:
+        """Test that a cached query text is served without running a search."""
+        from langchain_core.documents import Document
+        from langchain_core.embeddings import FakeEmbeddings
+
+        from langchain_cockroachdb.engine import CockroachDBEngine
+        from langchain_cockroachdb.vectorstores import CockroachDBVectorStore
+
+        engine = CockroachDBEngine.from_connection_string(
+            "cockroachdb://root@localhost:26257/defaultdb"
+        )
+        store = CockroachDBVectorStore(
+            engine=engine,
+            embeddings=FakeEmbeddings(size=3),
+            collection_name="docs",
+            query_cache_size=10,
+            query_embedding_cache_size=10,
+        )
+        embedding = [0.1, 0.2, 0.3]
+        doc = Document(page_content="cached")
+        store._query_embeddings["hello"] = embedding
+        store._query_cache.put(store._query_cache.make_key(embedding, None, 4, None), [(doc, 0.5)])
+
+        async def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("search should be served from the cache")
+
+        store.asimilarity_search = fail  # type: ignore[method-assign]
+        store.asimilarity_search_with_score = fail  # type: ignore[method-assign]
+
+        assert store.similarity_search("hello") == [doc]
+        assert store.similarity_search_with_score("hello") == [(doc, 0.5)]
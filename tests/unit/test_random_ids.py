@@ -0,0 +1,23 @@
+"""Unit tests for batched document id generation."""
+
+import uuid
+
+from langchain_cockroachdb.async_vectorstore import _random_ids
+
+
+def test_random_ids_are_uuid4() -> None:
+    """Test that generated ids are canonical version 4 UUID strings."""
+    ids = _random_ids(500)
+
+    assert len(ids) == 500
+    assert len(set(ids)) == 500
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
+
+
+def test_random_ids_empty() -> None:
+    """Test that no ids are generated for an empty batch."""
+    assert _random_ids(0) == []
@@ -1,12 +1,13 @@
 """Unit tests for retry utilities."""
 
 import asyncio
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from psycopg import OperationalError
+from psycopg import OperationalError, errors
 from sqlalchemy.exc import DBAPIError, ResourceClosedError
 
+from langchain_cockroachdb import retry as retry_module
 from langchain_cockroachdb.retry import (
     async_retry_with_backoff,
     is_retryable_error,
@@ -45,6 +46,65 @@ class TestIsRetryableError:
         error = DBAPIError("statement", {}, orig_error, False)
         assert is_retryable_error(error) is True
 
+    def test_wrapped_sqlstate(self) -> None:
+        """Test 40001 detection from the driver error's SQLSTATE alone."""
+
+        class SerializationFailure(Exception):
+            sqlstate = "40001"
+
+        error = DBAPIError("statement", {}, SerializationFailure("could not commit"), False)
+        assert is_retryable_error(error) is True
+
+    def test_connection_error_class_without_pattern(self) -> None:
+        """Test that DB-API connection error classes are retried by type."""
+        orig_error = OperationalError("SSL SYSCALL error: EOF detected")
+        assert is_retryable_error(orig_error) is True
+        assert is_retryable_error(DBAPIError("statement", {}, orig_error, False)) is True
+
+    def test_sqlstate_overrides_error_class(self) -> None:
+        """Test that a non-transient SQLSTATE fails fast despite its error class."""
+        canceled = errors.QueryCanceled("canceling statement due to statement timeout")
+        assert isinstance(canceled, OperationalError)
+        assert is_retryable_error(canceled) is False
+        assert is_retryable_error(DBAPIError("statement", {}, canceled, False)) is False
+
+        assert is_retryable_error(errors.AdminShutdown("terminating connection")) is True
+        assert is_retryable_error(errors.ConnectionFailure("connection lost")) is True
+
+    def test_resource_closed_error_without_pattern(self) -> None:
+        """Test that SQLAlchemy's closed-resource error is retried by type."""
+        assert is_retryable_error(ResourceClosedError("cursor is gone")) is True
+
+    def test_wrapped_error_message_without_statement(self) -> None:
+        """Test that a wrapped error is matched on the driver message, not the SQL."""
+        transient = DBAPIError("SELECT 1", {}, Exception("broken pipe"), False)
+        assert is_retryable_error(transient) is True
+
+        # A pattern appearing only in the statement doesn't make the error retryable
+        wrapped = DBAPIError("SELECT connection FROM t", {}, Exception("syntax error"), False)
+        assert is_retryable_error(wrapped) is False
+
+    def test_pattern_after_message_head_ignored(self) -> None:
+        """Test that only the head of long messages is matched."""
+        error = Exception("syntax error " + "x" * 1000 + " connection")
+        assert is_retryable_error(error) is False
+
+    def test_pattern_match_ignores_case(self) -> None:
+        """Test that transient patterns match regardless of case."""
+        assert is_retryable_error(Exception("Broken Pipe")) is True
+
+    def test_verdict_cached_on_exception(self) -> None:
+        """Test that an exception is classified once, then answered from the cache."""
+        error = Exception("restart transaction: error code 40001")
+
+        with patch(
+            "langchain_cockroachdb.retry._classify", wraps=retry_module._classify
+        ) as classify:
+            assert is_retryable_error(error) is True
+            assert is_retryable_error(error) is True
+
+        assert classify.call_count == 1
+
     def test_non_retryable_error(self) -> None:
         """Test non-retryable errors."""
         error = ValueError("invalid input")
@@ -128,7 +188,7 @@ class TestAsyncRetryWithBackoff:
             jitter=False,  # Disable jitter for predictable timing
         )
         async def test_func() -> str:
-            call_times.append(asyncio.get_event_loop().time())
+            call_times.append(asyncio.get_running_loop().time())
             if len(call_times) < 3:
                 raise Exception("restart transaction: error code 40001")
             return "success"
@@ -142,6 +202,59 @@ class TestAsyncRetryWithBackoff:
         # Second retry after ~0.2s
         assert call_times[2] - call_times[1] >= 0.19
 
+    @pytest.mark.asyncio
+    async def test_backoff_schedule(self) -> None:
+        """Test the exponential schedule and its cap without real sleeps."""
+
+        @async_retry_with_backoff(
+            max_retries=5,
+            initial_backoff=0.005,
+            max_backoff=0.03,
+            backoff_multiplier=2.0,
+            jitter=False,
+        )
+        async def test_func() -> str:
+            raise Exception("restart transaction: error code 40001")
+
+        with (
+            patch("langchain_cockroachdb.retry.asyncio.sleep", new=AsyncMock()) as sleep,
+            pytest.raises(Exception, match="40001"),
+        ):
+            await test_func()
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == pytest.approx([0.005, 0.01, 0.02, 0.03])
+
+    @pytest.mark.asyncio
+    async def test_retry_does_not_block_event_loop(self) -> None:
+        """Test that backoff sleeps yield to other tasks instead of blocking."""
+        ticks = 0
+
+        async def canary() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        attempts = 0
+
+        @async_retry_with_backoff(max_retries=3, initial_backoff=0.1, jitter=False)
+        async def test_func() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise Exception("restart transaction: error code 40001")
+            return "success"
+
+        canary_task = asyncio.create_task(canary())
+        try:
+            assert await test_func() == "success"
+        finally:
+            canary_task.cancel()
+
+        # 0.1 s + 0.2 s of backoff; a blocking sleep would leave the canary at 0
+        assert ticks >= 10
+
     @pytest.mark.asyncio
     async def test_max_backoff_limit(self) -> None:
         """Test max backoff limit."""
@@ -155,7 +268,7 @@ class TestAsyncRetryWithBackoff:
             jitter=False,
         )
         async def test_func() -> str:
-            call_times.append(asyncio.get_event_loop().time())
+            call_times.append(asyncio.get_running_loop().time())
             if len(call_times) < 4:
                 raise Exception("restart transaction: error code 40001")
             return "success"
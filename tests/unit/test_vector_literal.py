@@ -0,0 +1,102 @@
+"""Unit tests for VECTOR literal formatting and parsing."""
+
+import numpy as np
+
+from langchain_cockroachdb.async_vectorstore import (
+    _MAX_POOLED_FLOATS,
+    _candidate_vectors,
+    _parse_vectors,
+    _vector_literal,
+)
+from langchain_cockroachdb.engine import (
+    _VectorBinaryDumper,
+    _VectorBinaryLoader,
+    _VectorTextLoader,
+)
+from langchain_cockroachdb.quantization import quantize_int8
+
+
+class TestVectorLiteral:
+    """Test embedding to VECTOR text conversion."""
+
+    def test_float_list(self) -> None:
+        """Test that Python floats keep their shortest repr."""
+        assert _vector_literal([0.1, -2.5, 3.0]) == "[0.1, -2.5, 3.0]"
+
+    def test_numpy_inputs(self) -> None:
+        """Test that arrays and NumPy scalars format as plain numbers."""
+        assert _vector_literal(np.array([0.5, 1.0], dtype=np.float32)) == "[0.5, 1.0]"
+        assert _vector_literal([np.float64(0.5), np.float64(1.0)]) == "[0.5, 1.0]"
+
+    def test_round_trips(self) -> None:
+        """Test that parsing the literal recovers the values."""
+        vector = np.random.default_rng(0).standard_normal(768).tolist()
+
+        parsed = [float(x) for x in _vector_literal(vector).strip("[]").split(",")]
+
+        assert parsed == vector
+
+    def test_parse_vectors(self) -> None:
+        """Test that stored VECTOR text parses into one float32 matrix."""
+        parsed = _parse_vectors(["[1,2.5,-3]", "[0.25,0,4]"])
+
+        assert parsed.dtype == np.float32
+        assert parsed.tolist() == [[1.0, 2.5, -3.0], [0.25, 0.0, 4.0]]
+
+    def test_parse_vectors_accepts_arrays(self) -> None:
+        """Test that already-decoded vectors are stacked as-is."""
+        parsed = _parse_vectors([[1.0, 2.0], np.array([3.0, 4.0])])
+
+        assert parsed.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_candidate_vectors_from_int8_codes(self) -> None:
+        """Test that int8 codes decode and rows without codes use the float vector."""
+        vectors = np.array([[1.0, -0.5], [0.25, 2.0]], dtype=np.float32)
+        codes, scales = quantize_int8(vectors)
+        quantized_rows = [(codes[i].tobytes(), float(scales[i]), None) for i in range(2)]
+
+        decoded = _candidate_vectors(quantized_rows).copy()
+        mixed = _candidate_vectors([quantized_rows[0], (None, None, "[0.25,2]")])
+
+        np.testing.assert_allclose(decoded, vectors, atol=0.01)
+        np.testing.assert_allclose(mixed, vectors, atol=0.01)
+        assert _candidate_vectors([("[1,2]",)]).tolist() == [[1.0, 2.0]]
+
+    def test_candidate_vectors_reuse_thread_buffer(self) -> None:
+        """Test that int8 candidates decode into one reused buffer per thread."""
+        codes, scales = quantize_int8(np.ones((4, 8), dtype=np.float32))
+        rows = [(codes[i].tobytes(), float(scales[i]), None) for i in range(4)]
+
+        first = _candidate_vectors(rows)
+        second = _candidate_vectors(rows[:2])
+
+        assert np.shares_memory(first, second)
+        assert second.shape == (2, 8)
+
+        dim = _MAX_POOLED_FLOATS // 2 + 1
+        big_codes, big_scales = quantize_int8(np.ones((2, dim), dtype=np.float32))
+        big_rows = [(big_codes[i].tobytes(), float(big_scales[i]), None) for i in range(2)]
+        assert not np.shares_memory(_candidate_vectors(big_rows), first)
+
+
+class TestVectorCodec:
+    """Test the binary_vectors VECTOR dumper and loaders."""
+
+    def test_binary_round_trip(self) -> None:
+        """Test that dumped arrays use the pgvector layout and load back."""
+        vector = np.array([1.0, -2.5, 0.125], dtype=np.float32)
+
+        data = _VectorBinaryDumper(np.ndarray).dump(vector)
+        loaded = _VectorBinaryLoader(0).load(data)
+
+        assert data[:4] == b"\x00\x03\x00\x00"
+        assert len(data) == 4 + 3 * 4
+        assert loaded.dtype == np.float32
+        assert loaded.tolist() == vector.tolist()
+
+    def test_text_loader(self) -> None:
+        """Test that VECTOR text loads as a float32 array."""
+        loaded = _VectorTextLoader(0).load(b"[1,2.5,-3]")
+
+        assert loaded.dtype == np.float32
+        assert loaded.tolist() == [1.0, 2.5, -3.0]